@@ -1,19 +1,57 @@
 import asyncio
 import logging
 import sys
+import time
 
 import click
+from psycopg import Error
 
+from tai_dynamic_postgres_mcp.config.settings import pg_settings
 from tai_dynamic_postgres_mcp.core.app import mcp_app
-from tai_dynamic_postgres_mcp.database.connection import close_connection_pool, get_async_connection
+from tai_dynamic_postgres_mcp.core.stats import server_stats
+from tai_dynamic_postgres_mcp.database.connection import close_connection_pool, get_async_connection, set_readonly
+from tai_dynamic_postgres_mcp.database.result_cache import (
+    install_change_triggers,
+    remove_change_triggers,
+    table_change_listener,
+)
 from tai_dynamic_postgres_mcp.gen.loader import load_dynamic_tools
+from tai_dynamic_postgres_mcp.gen.schema.introspect import introspect_schema
 
 if sys.platform == "win32":
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
 
+def log_stats():
+    # Also served while running, by the `stats://server` resource
+    for name, stats in server_stats().items():
+        logging.debug(f"{name} stats: {stats}")
+
+
+async def change_triggers(install: bool) -> int:
+    """Installs, or removes, the table change triggers of the result cache, then exits."""
+    try:
+        if install:
+            schema = await introspect_schema()
+            failed = await install_change_triggers(schema.tables, pg_settings.result_cache_channel)
+            logging.info(f"Installed the table change trigger on {len(schema.tables) - len(failed)} tables")
+            if failed:
+                logging.warning(f"Could not install the table change trigger on {', '.join(failed)}")
+        else:
+            tables = await remove_change_triggers()
+            logging.info(f"Removed the table change trigger from {len(tables)} tables")
+    except Error as e:
+        logging.error(f"Failed to {'install' if install else 'remove'} the table change triggers: {e}")
+        return 1
+    finally:
+        await close_connection_pool()
+    return 0
+
+
 async def runner(
         overwrite: bool,
+        emit_files: bool,
+        lazy: bool,
         readonly: bool,
         select_joined: tuple[str],
         ignore_insert_column: tuple[str],
@@ -23,7 +61,14 @@ async def runner(
         transport: str,
         host: str,
         port: int,
+        install_triggers: bool = False,
+        remove_triggers: bool = False,
 ):
+    if install_triggers or remove_triggers:
+        if install_triggers and remove_triggers:
+            raise click.BadParameter("Use either --install-change-triggers or --remove-change-triggers.")
+        return await change_triggers(install_triggers)
+
     # Validate transport-related arguments
     if transport == "stdio":
         if host != "127.0.0.1" or port != 8000:
@@ -31,8 +76,13 @@ async def runner(
                 "Host and port should not be set when using 'stdio' transport."
             )
 
-    await load_dynamic_tools(
+    start = time.perf_counter()
+    set_readonly(readonly)
+
+    schema_watcher = await load_dynamic_tools(
         overwrite=overwrite,
+        emit_files=emit_files,
+        lazy=lazy,
         readonly=readonly,
         ignore_insert_columns=ignore_insert_column,
         ignore_select_columns=ignore_select_column,
@@ -45,6 +95,8 @@ async def runner(
     async with get_async_connection():
         pass
 
+    logging.info(f"Server ready in {time.perf_counter() - start:.2f}s")
+
     try:
         if transport == "stdio":
             await mcp_app.run_async(transport=transport)
@@ -57,6 +109,10 @@ async def runner(
         logging.error(str(e))
         return 1
     finally:
+        if schema_watcher:
+            await schema_watcher.stop()
+        await table_change_listener.stop()
+        log_stats()
         try:
             await close_connection_pool()
         except asyncio.exceptions.CancelledError:
@@ -69,12 +125,25 @@ async def runner(
 @click.option(
     "--overwrite",
     is_flag=True,
-    help="Overwrite the generated tool file if it already exists.",
+    help="Overwrite the generated tool file if it already exists (with --emit-files).",
+)
+@click.option(
+    "--emit-files",
+    is_flag=True,
+    help="Write the generated tool modules into the tools package and load them from there, "
+         "to inspect the generated code. By default the tools are built in memory.",
+)
+@click.option(
+    "--lazy",
+    is_flag=True,
+    help="Expose a table catalog and one generic tool per operation taking the table name, instead of tools "
+         "per table. Per-table models are built on first use. Meant for schemas with thousands of tables.",
 )
 @click.option(
     "--readonly",
     is_flag=True,
-    help="Generate only read-only tools (e.g., select functions). No insert or update tools will be generated.",
+    help="Generate only read-only tools (e.g., select functions) and open every connection read-only. "
+         "No insert or update tools will be generated.",
 )
 @click.option(
     "--select-joined",
@@ -128,8 +197,21 @@ async def runner(
     type=int,
     help="Port number to bind the server to (used only with HTTP/SSE transports).",
 )
+@click.option(
+    "--install-change-triggers",
+    is_flag=True,
+    help="Install the triggers notifying the result cache of the writes of other clients on every table, "
+         "then exit. Locks each table briefly: run it once, and again after creating tables.",
+)
+@click.option(
+    "--remove-change-triggers",
+    is_flag=True,
+    help="Drop the table change triggers and their functions, then exit.",
+)
 def main(
         overwrite,
+        emit_files,
+        lazy,
         readonly,
         select_joined,
         ignore_insert_column,
@@ -139,10 +221,14 @@ def main(
         transport,
         host,
         port,
+        install_change_triggers,
+        remove_change_triggers,
 ):
     """Generate dynamic insert MCP tools based on a given PostgreSQL schema."""
     sys.exit(asyncio.run(runner(
         overwrite,
+        emit_files,
+        lazy,
         readonly,
         select_joined,
         ignore_insert_column,
@@ -152,6 +238,8 @@ def main(
         transport,
         host,
         port,
+        install_change_triggers,
+        remove_change_triggers,
     )))
 
 
@@ -1,3 +1,5 @@
+from typing import List, Literal, Optional
+
 from dotenv import load_dotenv
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -8,6 +10,7 @@ load_dotenv()
 class PostgresSettings(BaseSettings):
     model_config = {
         "env_prefix": "PG_",
+        "env_parse_none_str": "null",
     }
     host: str = Field("localhost", description="PostgreSQL host")
     port: int = Field(5432, description="PostgreSQL port")
@@ -20,6 +23,83 @@ class PostgresSettings(BaseSettings):
     pool_max_size: int = Field(10, description="Maximum number of pooled connections")
     pool_timeout: int = Field(10, description="Pool acquire timeout in seconds")
     pool_max_lifetime: int = Field(300, description="Max lifetime of connection in seconds")
+    read_pool_max_size: Optional[int] = Field(
+        None,
+        description="Maximum connections of each read pool. By default pool_max_size is split between the write and "
+                    "read pools of the primary, and each replica pool gets all of it",
+    )
+
+    # Read replicas configuration
+    replica_dsns: List[str] = Field(
+        default_factory=list, description="Connection strings of read replicas serving the select tools"
+    )
+    replica_routing: Literal["round_robin", "least_busy"] = Field(
+        "round_robin", description="How selects are spread across replicas"
+    )
+    replica_max_lag: Optional[float] = Field(
+        10.0, description="Replication lag in seconds above which reads fall back to the primary (null disables it)"
+    )
+    replica_lag_check_interval: float = Field(5.0, description="Seconds between replication lag checks of a replica")
+    replica_lag_check_timeout: float = Field(
+        2.0, description="Seconds a lag check waits for a replica connection before skipping the replica"
+    )
+
+    # Code generation configuration
+    schema_snapshot_path: Optional[str] = Field(
+        None, description="File caching the introspected schema between starts (defaults to the tools directory)"
+    )
+    schema_reload: bool = Field(False, description="Regenerate the tools of tables changed by DDL while running")
+    schema_reload_channel: str = Field("tai_schema_changed", description="NOTIFY channel of the DDL event trigger")
+    schema_reload_delay: float = Field(1.0, description="Seconds to wait for more DDL before regenerating tools")
+    lazy_cache_size: int = Field(128, description="Number of per-table tools kept compiled by the lazy mode")
+
+    # Statement configuration
+    statement_cache_size: int = Field(256, description="Number of SQL statements cached by query shape")
+    prepare_threshold: Optional[int] = Field(
+        5, description="Executions before psycopg prepares a statement server-side (null disables it)"
+    )
+
+    # Statement timeout configuration, in seconds (null keeps the server's statement_timeout)
+    select_statement_timeout: Optional[float] = Field(None, description="Timeout of select and aggregate statements")
+    join_statement_timeout: Optional[float] = Field(None, description="Timeout of joined select statements")
+    insert_statement_timeout: Optional[float] = Field(None, description="Timeout of insert and upsert statements")
+    update_statement_timeout: Optional[float] = Field(None, description="Timeout of update statements")
+    delete_statement_timeout: Optional[float] = Field(None, description="Timeout of delete statements")
+
+    # Query cost guard configuration
+    max_query_cost: Optional[float] = Field(
+        None, description="Estimated plan cost above which guarded statements are refused (null disables it)"
+    )
+    max_query_rows: Optional[int] = Field(
+        None, description="Estimated rows above which guarded statements are refused (null disables it)"
+    )
+    cost_guard_action: Literal["reject", "limit"] = Field(
+        "reject", description="Whether selects estimated above max_query_rows are refused or limited to it"
+    )
+    plan_cache_size: int = Field(256, description="Number of plan estimates cached by query shape")
+
+    # Result cache configuration
+    result_cache_ttl: float = Field(0, description="Seconds select results are cached for (0 disables the cache)")
+    result_cache_max_bytes: int = Field(64 * 1024 * 1024, description="Approximate memory budget of the cached results")
+    result_cache_notify: bool = Field(
+        False, description="Install triggers notifying the writes of other clients, to invalidate cached results"
+    )
+    result_cache_channel: str = Field("tai_table_changed", description="NOTIFY channel of the table change triggers")
+
+    # Result decoding configuration
+    binary_results: bool = Field(
+        False, description="Fetch select results in binary format, skipping the text parse of vectors and timestamps"
+    )
+    validate_results: bool = Field(False, description="Validate every result row against the tool's model")
+
+    # Insert configuration
+    insert_copy_threshold: int = Field(1000, description="Rows from which inserts go through COPY into a staging table")
+    insert_chunk_size: int = Field(250, description="Max rows per INSERT statement of a pipelined batch")
+
+    # Streaming configuration
+    stream_batch_size: int = Field(500, description="Rows fetched per round trip by streaming selects")
+    stream_max_rows: int = Field(10_000, description="Hard limit of rows returned by one streamed page")
+    stream_max_bytes: int = Field(16 * 1024 * 1024, description="Hard limit of raw bytes returned by one streamed page")
 
 
 pg_settings = PostgresSettings()
@@ -0,0 +1,33 @@
+from typing import Any, Dict
+
+from tai_dynamic_postgres_mcp.core.app import mcp_app
+from tai_dynamic_postgres_mcp.database.connection import pool_stats, type_registry
+from tai_dynamic_postgres_mcp.database.cost_guard import cost_guard
+from tai_dynamic_postgres_mcp.database.result_cache import result_cache
+from tai_dynamic_postgres_mcp.database.statement_cache import statement_cache
+from tai_dynamic_postgres_mcp.gen.lazy.registry import lazy_registry
+from tai_dynamic_postgres_mcp.gen.templates.batch import batch_metrics
+
+
+def server_stats() -> Dict[str, Any]:
+    """Counters of the server's caches, batched writes and connection pools, since it started."""
+    return {
+        "type_registry": type_registry.stats(),
+        "statement_cache": statement_cache.stats(),
+        "cost_guard": cost_guard.stats(),
+        "result_cache": result_cache.stats(),
+        "batch_writes": batch_metrics.stats(),
+        "connection_pools": pool_stats(),
+        "lazy_tools": lazy_registry.stats(),
+    }
+
+
+@mcp_app.resource(
+    "stats://server",
+    name="server_stats",
+    description="Hit, miss and eviction counters of the server's caches, batched write throughput and "
+                "connection pool utilization, since the server started.",
+    mime_type="application/json",
+)
+def server_stats_resource() -> Dict[str, Any]:
+    return server_stats()
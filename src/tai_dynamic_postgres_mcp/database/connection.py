@@ -1,14 +1,17 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
-from typing import Any
+from typing import Any, Dict, Literal, Optional
+from weakref import WeakKeyDictionary
 
 from async_lru import alru_cache
-from psycopg import AsyncConnection, AsyncCursor
+from psycopg import AsyncConnection, AsyncCursor, pq, sql
 from psycopg.rows import AsyncRowFactory
 from psycopg_pool import AsyncConnectionPool
 
 from tai_dynamic_postgres_mcp.config.settings import pg_settings
-from tai_dynamic_postgres_mcp.database.helpers import register_types_loaders
+from tai_dynamic_postgres_mcp.database.helpers import TypeRegistry
+from tai_dynamic_postgres_mcp.database.replicas import ReplicaRouter
 
 logger = logging.getLogger(__name__)
 
@@ -20,24 +23,107 @@ dsn = (
     f"password={pg_settings.password}"
 )
 
+# Server-side guard: any write attempted on these connections fails with ReadOnlySqlTransaction.
+_READ_ONLY_OPTIONS = "-c default_transaction_read_only=on"
 
-@alru_cache(maxsize=1)
-async def get_connection_pool() -> AsyncConnectionPool:
+# Shared by every connection of the pool: type OIDs are looked up once, not per checkout.
+type_registry = TypeRegistry()
+
+_readonly = False
+
+# Every pool opened so far, by name, for stats and shutdown.
+_open_pools: Dict[str, AsyncConnectionPool] = {}
+_replica_router: Optional[ReplicaRouter] = None
+
+# statement_timeout last set on each autocommit connection, in seconds (None for the server's).
+_session_timeouts: "WeakKeyDictionary[AsyncConnection, Optional[float]]" = WeakKeyDictionary()
+
+
+def set_readonly(readonly: bool):
+    """Opens every connection (not only the read pool ones) read-only. Must be called before the pools open."""
+    global _readonly
+    _readonly = readonly
+
+
+def _pool_max_size(role: Literal["write", "primary-read", "replica"]) -> int:
+    """
+    Connections of a pool. Unless the read pools are sized explicitly, the two pools of the primary share
+    `pool_max_size`, so the server opens no more connections to it than configured.
+    """
+    if pg_settings.read_pool_max_size is not None:
+        return pg_settings.pool_max_size if role == "write" else pg_settings.read_pool_max_size
+    if role == "primary-read":
+        return max(1, pg_settings.pool_max_size // 2)
+    if role == "write":
+        return max(1, pg_settings.pool_max_size - pg_settings.pool_max_size // 2)
+    return pg_settings.pool_max_size
+
+
+async def _open_pool(name: str, conninfo: str = dsn, max_size: Optional[int] = None, **kwargs) -> AsyncConnectionPool:
+    max_size = max_size or pg_settings.pool_max_size
     pool = AsyncConnectionPool(
-        conninfo=dsn,
-        min_size=pg_settings.pool_min_size,
-        max_size=pg_settings.pool_max_size,
+        conninfo=conninfo,
+        name=name,
+        min_size=min(pg_settings.pool_min_size, max_size),
+        max_size=max_size,
         timeout=pg_settings.pool_timeout,
         max_lifetime=pg_settings.pool_max_lifetime,
+        kwargs={"prepare_threshold": pg_settings.prepare_threshold, **kwargs},
+        configure=type_registry.configure,
         open=False
     )
     await pool.open()
+    _open_pools[name] = pool
     return pool
 
 
-async def close_connection_pool():
-    pool = await get_connection_pool()
-    await pool.close()
+@alru_cache(maxsize=1)
+async def get_connection_pool() -> AsyncConnectionPool:
+    if _readonly:
+        return await _open_pool("primary", max_size=_pool_max_size("write"), options=_READ_ONLY_OPTIONS)
+    return await _open_pool("primary", max_size=_pool_max_size("write"))
+
+
+@alru_cache(maxsize=1)
+async def get_primary_read_pool() -> AsyncConnectionPool:
+    """
+    Pool of autocommit, read-only connections used by the select tools: each statement is its own
+    transaction, so reads don't spend a round trip on COMMIT.
+    """
+    return await _open_pool(
+        "primary-read", max_size=_pool_max_size("primary-read"), autocommit=True, options=_READ_ONLY_OPTIONS
+    )
+
+
+@alru_cache(maxsize=1)
+async def get_replica_router() -> ReplicaRouter:
+    # Physical replicas share the primary's catalog, so the cached type OIDs are valid on them too.
+    pools = [
+        await _open_pool(
+            f"replica-{i}", replica_dsn, max_size=_pool_max_size("replica"), autocommit=True, options=_READ_ONLY_OPTIONS
+        )
+        for i, replica_dsn in enumerate(pg_settings.replica_dsns)
+    ]
+
+    global _replica_router
+    _replica_router = ReplicaRouter(
+        pools,
+        strategy=pg_settings.replica_routing,
+        max_lag=pg_settings.replica_max_lag,
+        check_interval=pg_settings.replica_lag_check_interval,
+        check_timeout=pg_settings.replica_lag_check_timeout,
+    )
+    return _replica_router
+
+
+async def get_read_connection_pool() -> AsyncConnectionPool:
+    """Pool serving the next read: a healthy replica when configured, the primary read pool otherwise."""
+    if pg_settings.replica_dsns:
+        router = await get_replica_router()
+        pool = await router.pick()
+        if pool is not None:
+            return pool
+    return await get_primary_read_pool()
 
 
 # Wait until the pool is ready
@@ -50,17 +136,73 @@ async def wait_for_pool():
         raise
 
 
+def pool_stats() -> Dict[str, Dict[str, Any]]:
+    """Utilization of every opened pool, by pool name, plus the replica routing counters."""
+    stats: Dict[str, Dict[str, Any]] = {name: pool.get_stats() for name, pool in _open_pools.items()}
+    if _replica_router is not None:
+        for name, routing_stats in _replica_router.stats().items():
+            stats[name].update(routing_stats)
+        stats["primary-read"] = {**stats.get("primary-read", {}), "replica_fallbacks": _replica_router.fallbacks}
+    return stats
+
+
+async def drain_connection_pools():
+    """
+    Replaces every pooled connection with a new one, dropping their prepared statements. Connections in
+    use are closed when returned, so running queries complete normally.
+    """
+    for pool in list(_open_pools.values()):
+        await pool.drain()
+
+
+async def close_connection_pool():
+    # Read pools are created by the first select only, this closes whichever were opened.
+    for pool in list(_open_pools.values()):
+        await pool.close()
+
+
+async def _set_statement_timeout(conn: AsyncConnection, timeout: Optional[float]):
+    """
+    Bounds the statements run on `conn` until it is returned to the pool. Inside a transaction the
+    timeout is set with SET LOCAL and ends with it. SET LOCAL has no effect in autocommit, where the
+    session's timeout is set instead, only when it differs from the last one set on the connection.
+    """
+    if conn.autocommit:
+        if _session_timeouts.get(conn) == timeout:
+            return
+        if timeout is None:
+            query = sql.SQL("SET statement_timeout TO DEFAULT")
+        else:
+            query = sql.SQL("SET statement_timeout = {}").format(sql.Literal(round(timeout * 1000)))
+        await conn.execute(query, prepare=False)
+        _session_timeouts[conn] = timeout
+    elif timeout is not None:
+        await conn.execute(
+            sql.SQL("SET LOCAL statement_timeout = {}").format(sql.Literal(round(timeout * 1000))), prepare=False
+        )
+
+
 @asynccontextmanager
-async def get_async_connection() -> AsyncConnection:
-    """Async context manager to get a pooled DB connection."""
+async def _pooled_connection(get_pool, statement_timeout: Optional[float] = None) -> AsyncConnection:
     pool: AsyncConnectionPool | None = None
     conn: AsyncConnection | None = None
 
     try:
-        pool = await get_connection_pool()
+        pool = await get_pool()
         conn = await pool.getconn()
-        await register_types_loaders(conn)
+        type_registry.checkouts += 1
+        await _set_statement_timeout(conn, statement_timeout)
         yield conn
+    except asyncio.CancelledError:
+        # The call was cancelled, e.g. its client went away. psycopg cancels a query interrupted while
+        # waiting for its result; one left running otherwise is cancelled here, so the server stops
+        # working for nobody and the connection goes back to the pool instead of staying busy.
+        if conn is not None and conn.pgconn.transaction_status == pq.TransactionStatus.ACTIVE:
+            try:
+                await conn.cancel_safe(timeout=5.0)
+            except Exception as e:
+                logger.warning(f"Failed to cancel the query of a cancelled call: {e}")
+        raise
     except Exception as e:
         logger.error(e)
         raise
@@ -69,6 +211,24 @@ async def get_async_connection() -> AsyncConnection:
             await pool.putconn(conn)
 
 
+@asynccontextmanager
+async def get_async_connection(statement_timeout: Optional[float] = None) -> AsyncConnection:
+    """Async context manager to get a pooled DB connection, its transaction bound by `statement_timeout` seconds."""
+    async with _pooled_connection(get_connection_pool, statement_timeout) as conn:
+        yield conn
+
+
+@asynccontextmanager
+async def get_read_connection(statement_timeout: Optional[float] = None, primary: bool = False) -> AsyncConnection:
+    """
+    Async context manager to get a pooled autocommit, read-only DB connection. With `primary`, the
+    connection is never a replica's, for reads that must see the latest state, such as the catalog.
+    """
+    get_pool = get_primary_read_pool if primary else get_read_connection_pool
+    async with _pooled_connection(get_pool, statement_timeout) as conn:
+        yield conn
+
+
 @asynccontextmanager
 async def cursor(
         name: str = "",
@@ -77,8 +237,9 @@ async def cursor(
         row_factory: AsyncRowFactory[Any] | None = None,
         scrollable: bool | None = None,
         withhold: bool = False,
+        statement_timeout: Optional[float] = None,
 ) -> AsyncCursor:
-    async with get_async_connection() as conn:
+    async with get_async_connection(statement_timeout) as conn:
         async with conn.cursor(
                 name=name,
                 binary=binary,
@@ -87,3 +248,17 @@ async def cursor(
                 withhold=withhold,
         ) as cur:
             yield cur
+
+
+@asynccontextmanager
+async def read_cursor(
+        *,
+        binary: bool = False,
+        row_factory: AsyncRowFactory[Any] | None = None,
+        statement_timeout: Optional[float] = None,
+        primary: bool = False,
+) -> AsyncCursor:
+    """Client-side cursor on a read pool connection (of the primary with `primary`). Results need no commit."""
+    async with get_read_connection(statement_timeout, primary) as conn:
+        async with conn.cursor(binary=binary, row_factory=row_factory) as cur:
+            yield cur
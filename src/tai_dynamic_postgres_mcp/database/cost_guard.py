@@ -0,0 +1,168 @@
+import json
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from fastmcp.exceptions import ToolError
+from psycopg import AsyncConnection, sql
+from psycopg.rows import tuple_row
+
+from tai_dynamic_postgres_mcp.config.settings import pg_settings
+
+READ_HINT = "Add a more selective `where`, a `limit`, or use `stream` to read the rows page by page."
+AGGREGATE_HINT = "Add a more selective `where`, or fewer `group_by` columns."
+WRITE_HINT = "Add a more selective `where`, or split the change into smaller batches."
+
+
+class PlanEstimate(NamedTuple):
+    cost: float  # Total cost of the plan, in the planner's arbitrary units
+    rows: float  # Rows returned, or affected by an UPDATE / DELETE
+
+
+class QueryCostError(ToolError):
+    """Refusal of the cost guard. The message is a JSON object, so agents can act on the reason."""
+
+    def __init__(
+            self,
+            reason: str,
+            estimate: PlanEstimate,
+            max_cost: Optional[float],
+            max_rows: Optional[int],
+            hint: str,
+    ) -> None:
+        self.details = {
+            "error": "query_cost_exceeded",
+            "reason": reason,
+            "estimated_cost": estimate.cost,
+            "max_cost": max_cost,
+            "estimated_rows": estimate.rows,
+            "max_rows": max_rows,
+            "hint": hint,
+        }
+        super().__init__(json.dumps(self.details))
+
+
+def _plan_rows(plan: Dict[str, Any]) -> float:
+    # UPDATE / DELETE return nothing, the rows they touch are the ones of the scan below them
+    if plan["Node Type"] == "ModifyTable" and plan.get("Plans"):
+        return plan["Plans"][0]["Plan Rows"]
+    return plan["Plan Rows"]
+
+
+class CostGuard:
+    """
+    Refuses statements the planner estimates above `max_cost` or `max_rows`, before running them.
+
+    Estimates come from `EXPLAIN (FORMAT JSON)`, which plans the statement without executing it. They
+    are cached by SQL text, i.e. by the shape of the filters, and LIMIT value: the estimate of the first
+    `where` values seen is reused for the following calls of the same shape. The guard can't see value
+    skew, a filter on a rare value is judged like one on a common value seen before, and vice versa.
+    """
+
+    def __init__(self, max_cost: Optional[float], max_rows: Optional[int], maxsize: int) -> None:
+        self.max_cost = max_cost
+        self.max_rows = max_rows
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Tuple[str, Optional[int]], PlanEstimate] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.rejected = 0
+        self.limited = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_cost is not None or self.max_rows is not None
+
+    async def estimate(
+            self,
+            conn: AsyncConnection,
+            query: str,
+            params: List[Any],
+            limit: Optional[int] = None,
+    ) -> PlanEstimate:
+        """Plan estimate of `query`, whose LIMIT parameter (part of `params`) is `limit`."""
+        # The limit bounds both the rows and the cost of the plan, the same shape is estimated per limit
+        key = (query, limit)
+        estimate = self._entries.get(key)
+        if estimate is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return estimate
+
+        self.misses += 1
+        async with conn.cursor(row_factory=tuple_row) as cur:
+            await cur.execute(sql.SQL("EXPLAIN (FORMAT JSON) ") + sql.SQL(query), params)
+            (plans,) = await cur.fetchone()
+        plan = plans[0]["Plan"]
+        estimate = PlanEstimate(plan["Total Cost"], _plan_rows(plan))
+
+        self._entries[key] = estimate
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return estimate
+
+    def _violation(self, estimate: PlanEstimate, check_rows: bool = True) -> Optional[str]:
+        if self.max_cost is not None and estimate.cost > self.max_cost:
+            return f"Estimated cost {estimate.cost:.0f} exceeds the limit of {self.max_cost:.0f}"
+        if check_rows and self.max_rows is not None and estimate.rows > self.max_rows:
+            return f"Estimated {estimate.rows:.0f} rows exceed the limit of {self.max_rows}"
+        return None
+
+    async def check(
+            self,
+            conn: AsyncConnection,
+            query: str,
+            params: List[Any],
+            hint: str,
+            check_rows: bool = True,
+            limit: Optional[int] = None,
+    ):
+        """Raises `QueryCostError` when the statement, limited to `limit` rows, is estimated above the limits."""
+        estimate = await self.estimate(conn, query, params, limit)
+        reason = self._violation(estimate, check_rows)
+        if reason:
+            self.rejected += 1
+            raise QueryCostError(reason, estimate, self.max_cost, self.max_rows, hint)
+
+    async def check_select(
+            self,
+            conn: AsyncConnection,
+            query: str,
+            params: List[Any],
+            limit: Optional[int],
+    ) -> Optional[int]:
+        """
+        Like `check`, except that with the `limit` action a select estimated to return too many rows gets
+        a LIMIT instead of being refused. Returns the limit to apply; the caller checks the cost of the
+        limited statement again. The cost of the unlimited plan is not checked then: a scan returning
+        too many rows is usually too costly as well, and only the limited plan runs.
+        """
+        estimate = await self.estimate(conn, query, params, limit)
+        if (
+                pg_settings.cost_guard_action == "limit"
+                and self.max_rows is not None
+                and estimate.rows > self.max_rows
+                and (limit is None or limit > self.max_rows)
+        ):
+            self.limited += 1
+            return self.max_rows
+
+        reason = self._violation(estimate)
+        if reason:
+            self.rejected += 1
+            raise QueryCostError(reason, estimate, self.max_cost, self.max_rows, READ_HINT)
+        return limit
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "rejected": self.rejected,
+            "limited": self.limited,
+        }
+
+
+cost_guard = CostGuard(pg_settings.max_query_cost, pg_settings.max_query_rows, pg_settings.plan_cache_size)
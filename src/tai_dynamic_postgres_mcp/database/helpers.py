@@ -1,10 +1,23 @@
+import asyncio
+import struct
+import sys
+import uuid
 import warnings
-from typing import List
+from array import array
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional, Union
 
+from psycopg import DataError, postgres
 from psycopg.adapt import Loader, Dumper
-from psycopg.types import TypeInfo
+from psycopg.pq import Format
 from psycopg.types.array import ListDumper
 from psycopg.types.json import JsonDumper
+from psycopg.types.numeric import FloatLoader
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 TEMPORAL_TYPES = [
     'date',
@@ -14,23 +27,105 @@ TEMPORAL_TYPES = [
     'timestamptz',
 ]
 
+# Built-in types, same OIDs on every server.
+NUMERIC_OID = postgres.types["numeric"].oid
+NUMERIC_ARRAY_OID = postgres.types["numeric"].array_oid
+
+# Every type whose OID is needed to install the custom loaders.
+ADAPTED_TYPES = TEMPORAL_TYPES + ['uuid', 'vector']
+
+# Resolves all the adapted types in a single round trip. `to_regtype` returns
+# NULL (instead of raising) for missing types, such as `vector` without pgvector.
+_RESOLVE_TYPES_QUERY = "SELECT t.name, to_regtype(t.name)::oid FROM unnest(%s::text[]) AS t(name)"
+
 
 class TextLoader(Loader):
     def load(self, data: memoryview) -> str:
         return bytes(data).decode("utf-8")
 
 
-async def register_temporal_types_as_strings(conn):
+def _format_offset(offset: timedelta) -> str:
+    seconds = int(offset.total_seconds())
+    hours, rest = divmod(abs(seconds), 3600)
+    minutes, seconds_left = divmod(rest, 60)
+    text = f"{'-' if seconds < 0 else '+'}{hours:02d}"
+    if minutes or seconds_left:
+        text += f":{minutes:02d}"
+    if seconds_left:
+        text += f":{seconds_left:02d}"
+    return text
+
+
+def _format_temporal(value: Union[date, time, datetime]) -> str:
+    """
+    Formats a date/time value the way Postgres outputs it with `DateStyle=ISO`: a space between date
+    and time, fractional seconds without trailing zeros, and the UTC offset as `+HH[:MM[:SS]]`.
+    """
+    if isinstance(value, datetime):
+        text = f"{value.date().isoformat()} {value.time().isoformat()}"
+    elif isinstance(value, date):
+        return value.isoformat()
+    else:
+        text = value.replace(tzinfo=None).isoformat()
+    if value.microsecond:
+        text = text.rstrip("0")
+
+    offset = value.utcoffset()
+    if offset is not None:
+        text += _format_offset(offset)
+    return text
+
+
+class TemporalBinaryLoader(Loader):
+    """
+    Decodes binary date/time values with psycopg's own loader (`base`) and returns them as strings
+    formatted like the text ones. Postgres' `infinity` / `-infinity` are stored as the largest /
+    smallest integer of the payload.
+    """
+    format = Format.BINARY
+    base: type
+
+    def __init__(self, oid: int, context=None):
+        super().__init__(oid, context)
+        self._loader = self.base(oid, context)
+
+    def load(self, data: memoryview) -> str:
+        try:
+            return _format_temporal(self._loader.load(data))
+        except DataError:
+            value = int.from_bytes(data, "big", signed=True)
+            bound = 1 << (len(data) * 8 - 1)
+            if value == bound - 1:
+                return "infinity"
+            if value == -bound:
+                return "-infinity"
+            raise
+
+
+def register_temporal_types_as_strings(conn, oids: Dict[str, int]):
     for type_name in TEMPORAL_TYPES:
-        tinfo = await TypeInfo.fetch(conn, type_name)
-        if tinfo:
-            conn.adapters.register_loader(tinfo.oid, TextLoader)
+        oid = oids.get(type_name)
+        if oid:
+            conn.adapters.register_loader(oid, TextLoader)
+
+            base = conn.adapters.get_loader(oid, Format.BINARY)
+            if base:
+                loader = type(f"{type_name.capitalize()}StrBinaryLoader", (TemporalBinaryLoader,), {"base": base})
+                conn.adapters.register_loader(oid, loader)
+
+
+class UUIDBinaryLoader(Loader):
+    format = Format.BINARY
+
+    def load(self, data: memoryview) -> str:
+        return str(uuid.UUID(bytes=bytes(data)))
 
 
-async def register_uuid_as_string(conn):
-    tinfo = await TypeInfo.fetch(conn, 'uuid')
-    if tinfo:
-        conn.adapters.register_loader(tinfo.oid, TextLoader)
+def register_uuid_as_string(conn, oids: Dict[str, int]):
+    oid = oids.get('uuid')
+    if oid:
+        conn.adapters.register_loader(oid, TextLoader)
+        conn.adapters.register_loader(oid, UUIDBinaryLoader)
 
 
 class VectorLoader(Loader):
@@ -43,12 +138,86 @@ class VectorLoader(Loader):
             raise ValueError(f"Invalid vector format: {s}")
 
 
-async def register_vector_as_list(conn):
-    tinfo = await TypeInfo.fetch(conn, 'vector')
-    if not tinfo:
-        warnings.warn("Postgres type 'vector' not found. Did you enable the pgvector extension?", RuntimeWarning)
-    else:
-        conn.adapters.register_loader(tinfo.oid, VectorLoader)
+# pgvector's binary format: dimensions and an unused field as int16, then the float4 values, all big endian.
+_VECTOR_HEADER = struct.Struct(">HH")
+
+
+class VectorBinaryLoader(Loader):
+    format = Format.BINARY
+
+    def load(self, data: memoryview) -> List[float]:
+        if np is not None:
+            return np.frombuffer(data, dtype=">f4", offset=_VECTOR_HEADER.size).tolist()
+
+        # array("f", memoryview) would convert each byte to a float: the bytes must be copied as is.
+        values = array("f")
+        values.frombytes(data[_VECTOR_HEADER.size:])
+        if sys.byteorder == "little":
+            values.byteswap()
+        return values.tolist()
+
+
+def register_vector_as_list(conn, oids: Dict[str, int]):
+    oid = oids.get('vector')
+    if oid:
+        conn.adapters.register_loader(oid, VectorLoader)
+        conn.adapters.register_loader(oid, VectorBinaryLoader)
+
+
+class Vector(list):
+    """A list of floats sent as a pgvector `vector` parameter (e.g. a KNN query), instead of a float array."""
+
+
+class VectorDumper(Dumper):
+    def dump(self, obj: Vector) -> bytes:
+        return ("[" + ",".join(map(repr, map(float, obj))) + "]").encode()
+
+
+class VectorBinaryDumper(Dumper):
+    format = Format.BINARY
+
+    def dump(self, obj: Vector) -> bytes:
+        values = array("f", obj)
+        if sys.byteorder == "little":
+            values.byteswap()
+        return _VECTOR_HEADER.pack(len(values), 0) + values.tobytes()
+
+
+def register_vector_dumpers(conn, oids: Dict[str, int]):
+    oid = oids.get('vector')
+    if oid:
+        # The binary dumper is registered last, so it's the one used for `%s` placeholders.
+        conn.adapters.register_dumper(Vector, type("VectorTextDumper", (VectorDumper,), {"oid": oid}))
+        conn.adapters.register_dumper(Vector, type("VectorBinaryDumper", (VectorBinaryDumper,), {"oid": oid}))
+
+
+class NumericFloatBinaryLoader(Loader):
+    format = Format.BINARY
+    base: type
+
+    def __init__(self, oid: int, context=None):
+        super().__init__(oid, context)
+        self._loader = self.base(oid, context)
+
+    def load(self, data: memoryview) -> float:
+        return float(self._loader.load(data))
+
+
+def register_numeric_as_float(context):
+    """
+    Loads `numeric` as float, the type of the generated models, so rows can be returned
+    without a validation pass converting each Decimal.
+
+    Registered on the cursors reading select rows only (`context`): aggregates, keyset
+    tokens and the other reads keep exact Decimals.
+    """
+    context.adapters.register_loader("numeric", FloatLoader)
+
+    base = context.adapters.get_loader(NUMERIC_OID, Format.BINARY)
+    if base:
+        context.adapters.register_loader(
+            NUMERIC_OID, type("NumericFloatBinaryLoader", (NumericFloatBinaryLoader,), {"base": base})
+        )
 
 
 class HybridListDumper(Dumper):
@@ -69,8 +238,53 @@ def register_json_dumpers(conn):
     conn.adapters.register_dumper(list, HybridListDumper)
 
 
-async def register_types_loaders(conn):
-    await register_temporal_types_as_strings(conn)
-    await register_vector_as_list(conn)
-    await register_uuid_as_string(conn)
-    register_json_dumpers(conn)
+class TypeRegistry:
+    """
+    Process-wide cache of the OIDs needed by the custom loaders.
+
+    The OIDs are resolved with a single catalog query the first time a pool opens a
+    connection; afterwards `configure` installs the adapters from memory, so neither
+    new connections nor checkouts pay any extra round trip.
+    """
+
+    def __init__(self) -> None:
+        self._oids: Optional[Dict[str, int]] = None
+        self._lock = asyncio.Lock()
+        self.catalog_round_trips = 0
+        self.connections_configured = 0
+        self.checkouts = 0
+
+    async def resolve(self, conn) -> Dict[str, int]:
+        if self._oids is None:
+            async with self._lock:
+                if self._oids is None:
+                    async with conn.transaction():
+                        cursor = await conn.execute(_RESOLVE_TYPES_QUERY, [ADAPTED_TYPES])
+                        rows = await cursor.fetchall()
+                    self.catalog_round_trips += 1
+
+                    self._oids = {name: oid for name, oid in rows if oid}
+                    if 'vector' not in self._oids:
+                        warnings.warn(
+                            "Postgres type 'vector' not found. Did you enable the pgvector extension?",
+                            RuntimeWarning
+                        )
+        return self._oids
+
+    async def configure(self, conn) -> None:
+        """`configure` hook of the connection pool, runs once per new connection."""
+        oids = await self.resolve(conn)
+        register_temporal_types_as_strings(conn, oids)
+        register_vector_as_list(conn, oids)
+        register_vector_dumpers(conn, oids)
+        register_uuid_as_string(conn, oids)
+        register_json_dumpers(conn)
+        self.connections_configured += 1
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "checkouts": self.checkouts,
+            "connections_configured": self.connections_configured,
+            "catalog_round_trips": self.catalog_round_trips,
+            "round_trips_per_checkout": self.catalog_round_trips / self.checkouts if self.checkouts else 0.0,
+        }
@@ -0,0 +1,34 @@
+import asyncio
+import logging
+from typing import Callable
+
+from psycopg import AsyncConnection, sql
+
+from tai_dynamic_postgres_mcp.database.connection import dsn
+
+logger = logging.getLogger(__name__)
+
+
+async def listen(channel: str, on_notify: Callable[[str], None], on_reconnect: Callable[[], None]):
+    """
+    Calls `on_notify` with the payload of every notification sent on `channel`, until cancelled.
+
+    Listens on a dedicated connection, outside the pools. After a disconnection it reconnects with an
+    exponential backoff and calls `on_reconnect`, since the notifications sent meanwhile are lost.
+    """
+    backoff = 1.0
+    while True:
+        try:
+            conn = await AsyncConnection.connect(dsn, autocommit=True)
+            async with conn:
+                await conn.execute(sql.SQL("LISTEN {}").format(sql.Identifier(channel)))
+                backoff = 1.0
+                async for notify in conn.notifies():
+                    on_notify(notify.payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Listener of {channel} disconnected: {e}, reconnecting in {backoff:.0f}s")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 60.0)
+            on_reconnect()
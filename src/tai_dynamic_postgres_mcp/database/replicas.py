@@ -0,0 +1,96 @@
+import asyncio
+import itertools
+import logging
+import time
+from typing import Dict, List, Optional
+
+from psycopg_pool import AsyncConnectionPool
+
+logger = logging.getLogger(__name__)
+
+# Seconds behind the primary. A replica that has replayed everything it received is up to date
+# even if the primary has been idle for a while (`now() - pg_last_xact_replay_timestamp()` would grow).
+_LAG_QUERY = """
+             SELECT CASE
+                        WHEN NOT pg_is_in_recovery() THEN 0
+                        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+                        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+                        END::float8 \
+             """
+
+
+def _in_use(pool: AsyncConnectionPool) -> int:
+    stats = pool.get_stats()
+    return stats.get("pool_size", 0) - stats.get("pool_available", 0)
+
+
+class ReplicaRouter:
+    """
+    Picks the replica pool serving the next read.
+
+    Replicas are chosen round-robin or by the fewest connections in use. Each replica's replication
+    lag is measured at most once per `check_interval` seconds, waiting at most `check_timeout` seconds
+    for a connection; replicas failing the check, or lagging more than `max_lag` seconds when set, are
+    skipped until the next check, and `pick` returns None when none is usable, so the caller falls
+    back to the primary.
+    """
+
+    def __init__(
+            self,
+            pools: List[AsyncConnectionPool],
+            strategy: str = "round_robin",
+            max_lag: Optional[float] = None,
+            check_interval: float = 5.0,
+            check_timeout: float = 2.0,
+    ) -> None:
+        self.pools = pools
+        self.strategy = strategy
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.check_timeout = check_timeout
+        self._next = itertools.count()
+        self._lag: Dict[str, Optional[float]] = {}
+        self._checked_at: Dict[str, float] = {}
+        self._locks: Dict[str, asyncio.Lock] = {pool.name: asyncio.Lock() for pool in pools}
+        self.routed: Dict[str, int] = {pool.name: 0 for pool in pools}
+        self.fallbacks = 0
+
+    async def _check_lag(self, pool: AsyncConnectionPool) -> Optional[float]:
+        try:
+            # Not the pool's timeout: an unreachable replica would hold the check's lock, and the reads
+            # waiting on it, for that long.
+            async with pool.connection(timeout=self.check_timeout) as conn:
+                cursor = await conn.execute(_LAG_QUERY)
+                (lag,) = await cursor.fetchone()
+            return lag
+        except Exception as e:
+            logger.warning(f"Replica {pool.name} lag check failed: {e}")
+            return None
+
+    async def _healthy(self, pool: AsyncConnectionPool) -> bool:
+        if time.monotonic() - self._checked_at.get(pool.name, float("-inf")) >= self.check_interval:
+            async with self._locks[pool.name]:
+                if time.monotonic() - self._checked_at.get(pool.name, float("-inf")) >= self.check_interval:
+                    self._lag[pool.name] = await self._check_lag(pool)
+                    self._checked_at[pool.name] = time.monotonic()
+
+        lag = self._lag.get(pool.name)
+        return lag is not None and (self.max_lag is None or lag <= self.max_lag)
+
+    async def pick(self) -> Optional[AsyncConnectionPool]:
+        if self.strategy == "least_busy":
+            candidates = sorted(self.pools, key=_in_use)
+        else:
+            start = next(self._next) % len(self.pools)
+            candidates = self.pools[start:] + self.pools[:start]
+
+        for pool in candidates:
+            if await self._healthy(pool):
+                self.routed[pool.name] += 1
+                return pool
+
+        self.fallbacks += 1
+        return None
+
+    def stats(self) -> Dict[str, Dict[str, Optional[float]]]:
+        return {pool.name: {"routed": self.routed[pool.name], "lag": self._lag.get(pool.name)} for pool in self.pools}
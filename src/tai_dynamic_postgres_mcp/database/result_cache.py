@@ -0,0 +1,301 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from contextlib import suppress
+from typing import Any, Dict, Hashable, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from psycopg import sql
+
+from tai_dynamic_postgres_mcp.config.settings import pg_settings
+from tai_dynamic_postgres_mcp.database.connection import get_async_connection
+from tai_dynamic_postgres_mcp.database.listener import listen
+
+logger = logging.getLogger(__name__)
+
+# Rough size of the Python object holding a fetched value, on top of its raw bytes.
+_VALUE_OVERHEAD = 56
+
+_TRIGGER_NAME = "tai_table_changed"
+
+# Statement-level triggers notify the schema-qualified name of a table once per writing statement;
+# Postgres delivers a single notification per table and transaction.
+_TRIGGER_FUNCTION_SQL = """
+                        CREATE OR REPLACE FUNCTION tai_notify_table_change() RETURNS trigger
+                            LANGUAGE plpgsql AS
+                        $$
+                        BEGIN
+                            PERFORM pg_notify({channel}, TG_TABLE_SCHEMA || '.' || TG_TABLE_NAME);
+                            RETURN NULL;
+                        END
+                        $$; \
+                        """
+
+# Installs the trigger on every table it can, in a single round trip, and returns the ones it couldn't.
+_WATCH_FUNCTION_SQL = """
+                      CREATE OR REPLACE FUNCTION tai_watch_table_changes(tables text[]) RETURNS SETOF text
+                          LANGUAGE plpgsql AS
+                      $$
+                      DECLARE
+                          tbl    text;
+                          target text;
+                      BEGIN
+                          FOREACH tbl IN ARRAY tables
+                              LOOP
+                                  target := format('%I.%I', split_part(tbl, '.', 1), substr(tbl, strpos(tbl, '.') + 1));
+                                  BEGIN
+                                      EXECUTE format('DROP TRIGGER IF EXISTS tai_table_changed ON %s', target);
+                                      EXECUTE format('CREATE TRIGGER tai_table_changed '
+                                                         || 'AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON %s '
+                                                         || 'FOR EACH STATEMENT '
+                                                         || 'EXECUTE FUNCTION tai_notify_table_change()',
+                                                     target);
+                                  EXCEPTION
+                                      WHEN OTHERS THEN
+                                          RETURN NEXT tbl;
+                                  END;
+                              END LOOP;
+                      END
+                      $$; \
+                      """
+
+_TRIGGERED_TABLES_QUERY = "SELECT tgrelid::regclass::text FROM pg_trigger WHERE tgname = %s AND NOT tgisinternal"
+
+_DROP_FUNCTIONS_SQL = """
+                      DROP FUNCTION IF EXISTS tai_watch_table_changes(text[]);
+                      DROP FUNCTION IF EXISTS tai_notify_table_change(); \
+                      """
+
+
+class _Entry(NamedTuple):
+    value: Any
+    size: int
+    expires: float
+    tables: Tuple[str, ...]
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
+
+
+def result_size(cur) -> int:
+    """Approximate memory taken by the rows of the last fetched result: their raw size plus a per-value overhead."""
+    res = cur.pgresult
+    if res is None:
+        return 0
+    return sum(
+        res.get_length(row, col) + _VALUE_OVERHEAD for row in range(res.ntuples) for col in range(res.nfields)
+    )
+
+
+class ResultCache:
+    """
+    LRU cache of select results, keyed on the SQL text (the normalized filters, order, limit and
+    projection) and the parameter values, bounded by the approximate size of the results in bytes.
+
+    Entries expire after `ttl` seconds and are invalidated as soon as one of their tables is written,
+    by the write tools of this server or, through `table_change_listener`, by any other client.
+    Every invalidation bumps the version of the table: a select running meanwhile may have read the
+    data from before the write, so its result is not cached.
+
+    With read replicas, `replica_window` is how long after a write a replica may still return the rows
+    from before it: selects of a table written within that time read the primary (`needs_primary`),
+    so a stale replica result is neither returned nor cached.
+    """
+
+    def __init__(self, ttl: float, max_bytes: int, replica_window: Optional[float] = None) -> None:
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.replica_window = replica_window
+        self._written_at: Dict[str, float] = {}
+        # Writes missed by the listener may have touched any table
+        self._cleared_at = float("-inf")
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._keys_by_table: Dict[str, Set[Hashable]] = {}
+        self._versions: Dict[str, int] = {}
+        self._generation = 0
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.primary_reads = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_bytes > 0
+
+    @staticmethod
+    def key(query: str, params: List[Any], format: str) -> Optional[Hashable]:
+        """Cache key of a select, or None when its parameters can't be hashed."""
+        key = (query, _freeze(params), format)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def versions(self, tables: Iterable[str]) -> Tuple[int, ...]:
+        """Token to take before running a select, and to pass to `put` with its result."""
+        return (self._generation, *(self._versions.get(table, 0) for table in tables))
+
+    def needs_primary(self, tables: Iterable[str]) -> bool:
+        """Whether a select of `tables` must read the primary, a replica possibly missing their last write."""
+        if self.replica_window is None:
+            return False
+        written_at = max((self._written_at.get(table, float("-inf")) for table in tables), default=float("-inf"))
+        if time.monotonic() - max(written_at, self._cleared_at) >= self.replica_window:
+            return False
+        self.primary_reads += 1
+        return True
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.expires <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def put(self, key: Hashable, tables: List[str], versions: Tuple[int, ...], value: Any, size: int):
+        if self.versions(tables) != versions or size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = _Entry(value, size, time.monotonic() + self.ttl, tuple(tables))
+        for table in tables:
+            self._keys_by_table.setdefault(table, set()).add(key)
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key)
+        self.bytes -= entry.size
+        for table in entry.tables:
+            keys = self._keys_by_table.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_table[table]
+
+    def invalidate(self, tables: Iterable[str]) -> int:
+        """Drops the results read from `tables`, after a write. Returns their count."""
+        count = 0
+        now = time.monotonic()
+        for table in tables:
+            self._versions[table] = self._versions.get(table, 0) + 1
+            self._written_at[table] = now
+            for key in list(self._keys_by_table.get(table, ())):
+                self._remove(key)
+                count += 1
+        self.invalidations += count
+        return count
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._cleared_at = time.monotonic()
+        self._entries.clear()
+        self._keys_by_table.clear()
+        self.bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "primary_reads": self.primary_reads,
+        }
+
+
+async def install_change_triggers(tables: Iterable[str], channel: str) -> List[str]:
+    """
+    Installs a statement-level trigger notifying `channel` on each of `tables`, replacing the ones
+    installed before. Returns the tables it couldn't be installed on (creating a trigger requires
+    owning the table).
+
+    Takes a SHARE ROW EXCLUSIVE lock on every table, blocking their writes meanwhile: run it as a
+    maintenance step (`--install-change-triggers`), not on every start.
+    """
+    async with get_async_connection() as conn:
+        async with conn.transaction():
+            await conn.execute(sql.SQL(_TRIGGER_FUNCTION_SQL).format(channel=sql.Literal(channel)))
+            await conn.execute(_WATCH_FUNCTION_SQL)
+            cur = await conn.execute("SELECT tai_watch_table_changes(%s)", [sorted(tables)])
+            return [row[0] for row in await cur.fetchall()]
+
+
+async def remove_change_triggers() -> List[str]:
+    """Drops the triggers installed by `install_change_triggers`, and their functions. Returns the tables cleaned."""
+    async with get_async_connection() as conn:
+        async with conn.transaction():
+            cur = await conn.execute(_TRIGGERED_TABLES_QUERY, [_TRIGGER_NAME])
+            tables = [row[0] for row in await cur.fetchall()]
+            for table in tables:
+                # regclass output is already quoted and schema-qualified when needed
+                await conn.execute(
+                    sql.SQL("DROP TRIGGER {trigger} ON {table}").format(
+                        trigger=sql.Identifier(_TRIGGER_NAME), table=sql.SQL(table)
+                    )
+                )
+            await conn.execute(_DROP_FUNCTIONS_SQL)
+    return tables
+
+
+class TableChangeListener:
+    """
+    Invalidates the cached results of the tables written by other clients, listening on `channel`
+    on a dedicated connection.
+
+    Only the tables with the triggers of `install_change_triggers` notify their writes, the results of
+    the others may be served up to the cache's TTL after they changed.
+    """
+
+    def __init__(self, cache: ResultCache, channel: str) -> None:
+        self.cache = cache
+        self.channel = channel
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        # Writes made while disconnected were not notified
+        self._task = asyncio.create_task(
+            listen(self.channel, lambda table: self.cache.invalidate([table]), self.cache.clear)
+        )
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+
+def _replica_window() -> Optional[float]:
+    if not pg_settings.replica_dsns:
+        return None
+    if pg_settings.replica_max_lag is None:
+        # Replicas may lag without bound
+        return float("inf")
+    # The lag of a replica is known as of its last check
+    return pg_settings.replica_max_lag + pg_settings.replica_lag_check_interval
+
+
+result_cache = ResultCache(pg_settings.result_cache_ttl, pg_settings.result_cache_max_bytes, _replica_window())
+table_change_listener = TableChangeListener(result_cache, pg_settings.result_cache_channel)
@@ -0,0 +1,68 @@
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from psycopg import sql
+
+from tai_dynamic_postgres_mcp.config.settings import pg_settings
+
+
+class StatementCache:
+    """
+    LRU cache of rendered SQL statements, keyed on the shape of the query.
+
+    The key holds the rendered WHERE / ORDER BY clauses, which only contain placeholders: it
+    captures the operators, fields and arity of the filters but none of their values. The
+    same shape therefore always maps to the same SQL text, which lets psycopg reuse the
+    server-side prepared statement instead of planning every call from scratch.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, build: Callable[[], sql.Composable]) -> Tuple[str, bool]:
+        """Returns the SQL text of `key`, rendering it with `build` on a miss, and whether it was a hit."""
+        query = self._entries.get(key)
+        if query is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return query, True
+
+        self.misses += 1
+        query = build().as_string()
+        self._entries[key] = query
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return query, False
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def evict(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Drops the statements whose key matches `predicate`, e.g. after a schema change. Returns their count."""
+        keys = [key for key in self._entries if predicate(key)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+def prepare_flag(hit: bool) -> Optional[bool]:
+    """`prepare` argument of `execute`: a repeated shape is prepared right away, others follow the threshold."""
+    if hit and pg_settings.prepare_threshold is not None:
+        return True
+    return None
+
+
+statement_cache = StatementCache(pg_settings.statement_cache_size)
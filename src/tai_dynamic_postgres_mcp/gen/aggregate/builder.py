@@ -0,0 +1,44 @@
+from typing import Dict, List, Optional, Set
+
+from psycopg import sql
+
+from tai_dynamic_postgres_mcp.gen.aggregate.models import AggregateItem
+from tai_dynamic_postgres_mcp.gen.filters.models import LogicalFilter, WhereFilter
+
+_FUNCTIONS = {
+    'count': "count({})",
+    'sum': "sum({})",
+    'avg': "avg({})",
+    'min': "min({})",
+    'max': "max({})",
+    'count_distinct': "count(DISTINCT {})",
+}
+
+
+def aggregate_expression(item: AggregateItem) -> str:
+    column = sql.Identifier(item.field).as_string() if item.field else "*"
+    return _FUNCTIONS[item.func].format(column)
+
+
+def filter_fields(op: Optional[WhereFilter]) -> Set[str]:
+    """Every field a filter refers to, at any depth of its AND / OR / NOT nesting."""
+    if not op:
+        return set()
+    inner = op.root
+    if isinstance(inner, LogicalFilter):
+        subs = (inner.AND or []) + (inner.OR or []) + ([inner.NOT] if inner.NOT else [])
+        return set().union(*(filter_fields(sub) for sub in subs))
+    return set(inner)
+
+
+def build_result_map(aggregates: List[AggregateItem], group_by: List[str]) -> Dict[str, str]:
+    """
+    SQL expression of every result column, by name. HAVING can't refer to the output names, so
+    `having` and `order_by` are rendered through this map, which also rejects unknown names.
+    """
+    result_map = {col: sql.Identifier(col).as_string() for col in group_by}
+    for item in aggregates:
+        if item.name in result_map:
+            raise ValueError(f"Duplicate result name {item.name}, set a distinct `alias`")
+        result_map[item.name] = aggregate_expression(item)
+    return result_map
@@ -0,0 +1,19 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel, model_validator
+
+
+class AggregateItem(BaseModel):
+    func: Literal['count', 'sum', 'avg', 'min', 'max', 'count_distinct']
+    field: Optional[str] = None  # Column to aggregate, omitted for count(*)
+    alias: Optional[str] = None  # Name of the result, "<func>_<field>" (or "count") by default
+
+    @model_validator(mode='after')
+    def check_field(self):
+        if self.field is None and self.func != 'count':
+            raise ValueError(f"`{self.func}` needs a field, only `count` can count rows")
+        return self
+
+    @property
+    def name(self) -> str:
+        return self.alias or (f"{self.func}_{self.field}" if self.field else self.func)
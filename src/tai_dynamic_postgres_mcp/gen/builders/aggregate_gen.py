@@ -0,0 +1,94 @@
+from typing import Any, Callable, Dict, List, Literal, Optional
+
+from tai_dynamic_postgres_mcp.gen.aggregate.models import AggregateItem
+from tai_dynamic_postgres_mcp.gen.builders.base_gen import BaseGen, runtime_tool
+from tai_dynamic_postgres_mcp.gen.filters.models import WhereFilter
+from tai_dynamic_postgres_mcp.gen.order.models import OrderByItem
+from tai_dynamic_postgres_mcp.gen.templates.aggregate import aggregate_tmpl
+
+_FUNC_PREFIX = "aggregate"
+
+_IMPORTS = """# This file is auto-generated. Do not edit manually.
+
+from typing import Any, Dict, Optional, List, Literal
+from tai_dynamic_postgres_mcp.core.app import mcp_app
+from tai_dynamic_postgres_mcp.gen.templates.aggregate import aggregate_tmpl
+from tai_dynamic_postgres_mcp.gen.aggregate.models import AggregateItem
+from tai_dynamic_postgres_mcp.gen.filters.models import WhereFilter
+from tai_dynamic_postgres_mcp.gen.order.models import OrderByItem
+
+"""
+
+_TOOL_DOC = '''
+    Computes aggregates over the `{table}` table in the database, returning one row per group instead of the rows themselves.
+
+    Parameters:
+        aggregates: Optional list of `AggregateItem` ({{"func": "count" | "sum" | "avg" | "min" | "max" | "count_distinct", "field": column, "alias": name}}). `field` can be omitted for `count` to count rows. Defaults to counting rows.
+        where: Optional filters to apply using `WhereFilter` on the rows, before aggregating.
+        group_by: Optional columns to group by, one result row per distinct combination.
+        having: Optional filters to apply using `WhereFilter` on the results, referring to the aggregates by alias (default "<func>_<field>", or "count") and to the `group_by` columns.
+        order_by: Optional list of results (aliases or `group_by` columns) and directions to order by.
+        limit: Optional maximum number of result rows to return.
+
+    Returns:
+        List of result rows, each holding the `group_by` columns and the aggregates by alias, from the `{table}` table.
+    '''
+
+_TOOL_TEMPLATE = '''
+@mcp_app.tool
+async def {func_name}(aggregates: Optional[List[AggregateItem]] = None, where: Optional[WhereFilter] = None, group_by: Optional[List[Literal[{column_literals}]]] = None, having: Optional[WhereFilter] = None, order_by: Optional[List[OrderByItem]] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """{doc}"""
+
+    return await aggregate_tmpl(
+        "{table}", aggregates, where, group_by, having, order_by, limit, column_types={column_types},
+    )
+'''
+
+
+class AggregateGen(BaseGen):
+    def __init__(self, ignore_columns: Optional[List[str]] = None):
+        super().__init__(_FUNC_PREFIX, _IMPORTS, _TOOL_TEMPLATE, ignore_columns)
+
+    def _column_types(self, table: str, columns: List[tuple]) -> Dict[str, str]:
+        # Ignored columns can't be aggregated nor grouped by either
+        types = self.column_types(table)
+        return {col: types[col] for col, _ in columns if col not in self.ignore_columns}
+
+    def generate_tool(
+            self,
+            table: str,
+            columns: List[tuple],
+    ) -> tuple[str, str]:
+        column_types = self._column_types(table, columns)
+
+        tool_code = self.template.format(
+            func_name=self.func_name(table),
+            doc=_TOOL_DOC.format(table=table),
+            table=table,
+            column_literals=", ".join(repr(col) for col in column_types),
+            column_types=repr(column_types),
+        )
+
+        return "", tool_code  # Results are keyed by alias, there is no row model
+
+    def build_tool(
+            self,
+            table: str,
+            columns: List[tuple],
+    ) -> Optional[Callable]:
+        column_types = self._column_types(table, columns)
+
+        async def tool(aggregates=None, where=None, group_by=None, having=None, order_by=None, limit=None):
+            return await aggregate_tmpl(
+                table, aggregates, where, group_by, having, order_by, limit, column_types=column_types,
+            )
+
+        return runtime_tool(tool, self.func_name(table), _TOOL_DOC.format(table=table), {
+            "aggregates": Optional[List[AggregateItem]],
+            "where": Optional[WhereFilter],
+            "group_by": Optional[List[Literal[tuple(column_types)]]],
+            "having": Optional[WhereFilter],
+            "order_by": Optional[List[OrderByItem]],
+            "limit": Optional[int],
+            "return": List[Dict[str, Any]],
+        })
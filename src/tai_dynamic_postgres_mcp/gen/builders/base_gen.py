@@ -1,16 +1,28 @@
 import os
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, Callable, Optional, List, Dict, Union
 
 from tai_dynamic_postgres_mcp import tools
-from tai_dynamic_postgres_mcp.gen.schema.schema_parser import parse_schema
+from tai_dynamic_postgres_mcp.core.app import mcp_app
+from tai_dynamic_postgres_mcp.gen.schema.schema_parser import ParsedSchema, as_parsed_schema
 
 _OUTPUT_DIR = Path(tools.__file__).resolve().parent
 
 TOOLS_SUFFIX = "tools"
 
 
+def runtime_tool(fn: Callable, name: str, doc: str, annotations: Dict[str, Any]) -> Callable:
+    """
+    Dresses a closure as the function a generated module would define: FastMCP reads the tool's name,
+    description and schemas from these attributes.
+    """
+    fn.__name__ = fn.__qualname__ = name
+    fn.__doc__ = doc
+    fn.__annotations__ = annotations
+    return fn
+
+
 class BaseGen(ABC):
     def __init__(
             self,
@@ -23,6 +35,7 @@ class BaseGen(ABC):
         self.imports = imports
         self.template = template
         self.ignore_columns = ignore_columns or []
+        self.schema: Optional[ParsedSchema] = None
 
     @abstractmethod
     def generate_tool(
@@ -32,6 +45,14 @@ class BaseGen(ABC):
     ) -> tuple[str, str]:
         raise NotImplementedError
 
+    def build_tool(
+            self,
+            table: str,
+            columns: List[tuple],
+    ) -> Optional[Callable]:
+        """In-memory counterpart of `generate_tool`: the tool function itself, or None when there is no tool."""
+        raise NotImplementedError
+
     @property
     def output_path(self) -> Path:
         return _OUTPUT_DIR / f'{self.prefix}_{TOOLS_SUFFIX}.py'
@@ -43,17 +64,41 @@ class BaseGen(ABC):
     def func_name(self, table: str) -> str:
         return f"{self.prefix}_{table.replace('.', '_')}"
 
-    def generate_tools(self, schema: str) -> List[str]:
-        tables, fks = parse_schema(schema)
+    def primary_key(self, table: str) -> List[str]:
+        return self.schema.pks.get(table, []) if self.schema else []
+
+    def unique_keys(self, table: str) -> List[List[str]]:
+        """Column lists of the primary key and of every unique key, usable as ON CONFLICT targets."""
+        if not self.schema:
+            return []
+        pk = self.schema.pks.get(table)
+        return ([pk] if pk else []) + self.schema.uniques.get(table, [])
+
+    def column_types(self, table: str) -> Dict[str, str]:
+        return self.schema.types.get(table, {}) if self.schema else {}
+
+    def generate_tools(self, schema: Union[ParsedSchema, str]) -> List[str]:
+        self.schema = as_parsed_schema(schema)
         chunks = [self.imports]
-        for table, columns in tables.items():
+        for table, columns in self.schema.tables.items():
             model_code, tool_code = self.generate_tool(table, columns)
             chunks.append(model_code)
             chunks.append(tool_code)
 
         return chunks
 
-    def generate_file(self, schema: str):
+    def register_tools(self, schema: Union[ParsedSchema, str]) -> int:
+        """Registers the tools on `mcp_app` directly, without generating any source. Returns their count."""
+        self.schema = as_parsed_schema(schema)
+        count = 0
+        for table, columns in self.schema.tables.items():
+            tool = self.build_tool(table, columns)
+            if tool:
+                mcp_app.tool(tool)
+                count += 1
+        return count
+
+    def generate_file(self, schema: Union[ParsedSchema, str]):
         if self.is_exists:
             os.chmod(self.output_path, 0o644)
 
@@ -1,6 +1,8 @@
-from typing import List
+from typing import Callable, List, Optional
 
-from tai_dynamic_postgres_mcp.gen.builders.base_gen import BaseGen
+from tai_dynamic_postgres_mcp.gen.builders.base_gen import BaseGen, runtime_tool
+from tai_dynamic_postgres_mcp.gen.filters.models import WhereFilter
+from tai_dynamic_postgres_mcp.gen.templates.delete import delete_tmpl
 
 _FUNC_PREFIX = "delete"
 
@@ -13,10 +15,7 @@ from tai_dynamic_postgres_mcp.gen.filters.models import WhereFilter
 
 """
 
-_TOOL_TEMPLATE = '''
-@mcp_app.tool
-async def {func_name}(where: Optional[WhereFilter] = None) -> int:
-    """
+_TOOL_DOC = '''
     Deletes rows from the `{table}` table.
 
     Parameters:
@@ -24,9 +23,14 @@ async def {func_name}(where: Optional[WhereFilter] = None) -> int:
 
     Returns:
         Number of rows deleted from the `{table}` table.
-    """
+    '''
+
+_TOOL_TEMPLATE = '''
+@mcp_app.tool
+async def {func_name}(where: Optional[WhereFilter] = None) -> int:
+    """{doc}"""
 
-    return await delete_tmpl("{table}", where)
+    return await delete_tmpl("{table}", where, column_types={column_types})
 '''
 
 
@@ -37,10 +41,27 @@ class DeleteGen(BaseGen):
     def generate_tool(
             self,
             table: str,
-            _: List[tuple],  # columns are unused here but kept for interface compatibility
+            _: List[tuple],  # columns are unused here, the types come from the parsed schema
     ) -> tuple[str, str]:
         tool_code = self.template.format(
             func_name=self.func_name(table),
-            table=table
+            doc=_TOOL_DOC.format(table=table),
+            table=table,
+            column_types=repr(self.column_types(table)),
         )
         return "", tool_code  # No model needed for delete
+
+    def build_tool(
+            self,
+            table: str,
+            _: List[tuple],
+    ) -> Optional[Callable]:
+        column_types = self.column_types(table)
+
+        async def tool(where=None):
+            return await delete_tmpl(table, where, column_types=column_types)
+
+        return runtime_tool(tool, self.func_name(table), _TOOL_DOC.format(table=table), {
+            "where": Optional[WhereFilter],
+            "return": int,
+        })
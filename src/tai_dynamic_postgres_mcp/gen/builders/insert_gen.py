@@ -1,7 +1,12 @@
-from typing import List, Optional
-
-from tai_dynamic_postgres_mcp.gen.builders.base_gen import BaseGen
-from tai_dynamic_postgres_mcp.gen.schema.schema_parser import sql_columns_to_pydantic_model
+from typing import Callable, List, Optional
+
+from tai_dynamic_postgres_mcp.gen.builders.base_gen import BaseGen, runtime_tool
+from tai_dynamic_postgres_mcp.gen.schema.schema_parser import (
+    model_name_of,
+    sql_columns_to_pydantic_class,
+    sql_columns_to_pydantic_model,
+)
+from tai_dynamic_postgres_mcp.gen.templates.insert import insert_tmpl
 
 _FUNC_PREFIX = "insert"
 
@@ -14,10 +19,7 @@ from tai_dynamic_postgres_mcp.gen.templates.insert import insert_tmpl
 
 """
 
-_TOOL_TEMPLATE = '''
-@mcp_app.tool
-async def {func_name}(params: List[{model_name}], raise_on_conflict: bool = True) -> List[int]:
-    """
+_TOOL_DOC = '''
     Inserts multiple rows into the `{table}` table.
 
     Parameters:
@@ -27,11 +29,16 @@ async def {func_name}(params: List[{model_name}], raise_on_conflict: bool = True
 
     Returns:
         List of inserted row IDs from the `{table}` table.
-    """
+    '''
+
+_TOOL_TEMPLATE = '''
+@mcp_app.tool
+async def {func_name}(params: List[{model_name}], raise_on_conflict: bool = True) -> List[int]:
+    """{doc}"""
 
     values = [({args}) for row in params or []]
 
-    return await insert_tmpl("{table}", {col_list}, values, raise_on_conflict)
+    return await insert_tmpl("{table}", {col_list}, values, raise_on_conflict, column_types={column_types})
 '''
 
 
@@ -39,6 +46,9 @@ class InsertGen(BaseGen):
     def __init__(self, ignore_columns: Optional[List[str]] = None):
         super().__init__(_FUNC_PREFIX, _IMPORTS, _TOOL_TEMPLATE, ignore_columns)
 
+    def _doc(self, table: str, col_list: List[str]) -> str:
+        return _TOOL_DOC.format(table=table, model_name=model_name_of(self.prefix, table), doc_params=', '.join(col_list))
+
     def generate_tool(
             self,
             table: str,
@@ -48,7 +58,6 @@ class InsertGen(BaseGen):
 
         model_name, model_code = sql_columns_to_pydantic_model(self.prefix, table, insert_columns)
 
-        doc_params = ', '.join([col for col, _ in insert_columns])
         args = ', '.join([f"row.{col}" for col, _ in insert_columns])
         col_list = [col for col, _ in insert_columns]
         num_cols = len(insert_columns)
@@ -57,10 +66,32 @@ class InsertGen(BaseGen):
             func_name=self.func_name(table),
             model_name=model_name,
             table=table,
-            doc_params=doc_params,
+            doc=self._doc(table, col_list),
             args=args,
             col_list=repr(col_list),
-            num_cols=num_cols
+            num_cols=num_cols,
+            column_types=repr({col: self.column_types(table)[col] for col in col_list}),
         )
 
         return model_code, tool_code
+
+    def build_tool(
+            self,
+            table: str,
+            columns: List[tuple],
+    ) -> Optional[Callable]:
+        insert_columns = [(col, typ) for col, typ in columns if col not in self.ignore_columns]
+        model = sql_columns_to_pydantic_class(self.prefix, table, insert_columns)
+        col_list = [col for col, _ in insert_columns]
+        column_types = {col: self.column_types(table)[col] for col in col_list}
+
+        async def tool(params, raise_on_conflict=True):
+            values = [tuple(getattr(row, col) for col in col_list) for row in params or []]
+
+            return await insert_tmpl(table, col_list, values, raise_on_conflict, column_types=column_types)
+
+        return runtime_tool(tool, self.func_name(table), self._doc(table, col_list), {
+            "params": List[model],
+            "raise_on_conflict": bool,
+            "return": List[int],
+        })
@@ -1,37 +1,56 @@
-from typing import List, Optional
+from typing import Callable, List, Literal, Optional, Union
 
-from tai_dynamic_postgres_mcp.gen.builders.base_gen import BaseGen
-from tai_dynamic_postgres_mcp.gen.schema.schema_parser import sql_columns_to_pydantic_model
+from tai_dynamic_postgres_mcp.gen.builders.base_gen import BaseGen, runtime_tool
+from tai_dynamic_postgres_mcp.gen.filters.models import WhereFilter
+from tai_dynamic_postgres_mcp.gen.order.models import OrderByItem
+from tai_dynamic_postgres_mcp.gen.pagination.models import ColumnarResult, ResultPage
+from tai_dynamic_postgres_mcp.gen.schema.schema_parser import (
+    model_name_of,
+    sql_columns_to_pydantic_class,
+    sql_columns_to_pydantic_model,
+)
+from tai_dynamic_postgres_mcp.gen.templates.select import select_tmpl
 
 _FUNC_PREFIX = "select"
 
 _IMPORTS = """# This file is auto-generated. Do not edit manually.
 
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Literal
 from pydantic import BaseModel
 from tai_dynamic_postgres_mcp.core.app import mcp_app
 from tai_dynamic_postgres_mcp.gen.templates.select import select_tmpl
 from tai_dynamic_postgres_mcp.gen.filters.models import WhereFilter
 from tai_dynamic_postgres_mcp.gen.order.models import OrderByItem
+from tai_dynamic_postgres_mcp.gen.pagination.models import ColumnarResult, ResultPage
 
 """
 
-_TOOL_TEMPLATE = '''
-@mcp_app.tool
-async def {func_name}(where: Optional[WhereFilter] = None, order_by: Optional[List[OrderByItem]] = None, limit: Optional[int] = None) -> List[{model_name}]:
-    """
+_TOOL_DOC = '''
     Selects rows from the `{table}` table.
 
     Parameters:
         where: Optional filters to apply using `WhereFilter`. For vector similarity (KNN), include in field filters like {{"vector_field": {{"knn": {{"query": [floats], "distance": "l2", "threshold": 0.5, "direction": "ASC"}}}}}}. If `threshold` is set, adds a distance filter; always implies ordering by distance (use 'direction' for ASC/DESC). Combine with AND/OR as needed.
         order_by: Optional list of fields and directions to order by (appended after any implied KNN orders).
-        limit: Optional maximum number of rows to return.
+        limit: Optional maximum number of rows to return (the page size when streaming).
+        stream: If True, rows are read in batches through a server-side cursor and returned as a `ResultPage`, capped by the server's row and byte budget. When the page is truncated, `next_token` points to the rest.
+        after: Optional `next_token` of a previous `ResultPage`, to fetch the following page (implies `stream`).
+        columns: Optional subset of columns to fetch; the others are left empty. Skip heavy fields you don't need.
+        format: "rows" (default) returns one object per row; "columnar" returns the column names once plus one array of values per row, a much smaller response for many rows.
 
     Returns:
-        List of `{model_name}` objects from the `{table}` table.
-    """
+        List of `{model_name}` objects (or a `ResultPage` of them when streaming), or a `ColumnarResult` with `format="columnar"`, from the `{table}` table.
+    '''
+
+_TOOL_TEMPLATE = '''
+@mcp_app.tool
+async def {func_name}(where: Optional[WhereFilter] = None, order_by: Optional[List[OrderByItem]] = None, limit: Optional[int] = None, stream: bool = False, after: Optional[str] = None, columns: Optional[List[Literal[{column_literals}]]] = None, format: Literal["rows", "columnar"] = "rows") -> Union[List[{model_name}], ResultPage[{model_name}], ColumnarResult]:
+    """{doc}"""
     
-    return await select_tmpl("{table}", where, order_by, limit, {model_name})
+    return await select_tmpl(
+        "{table}", where, order_by, limit, {model_name}, stream, after,
+        key_columns={key_columns}, not_null_columns={not_null_columns}, column_types={column_types},
+        columns=columns or {col_list}, format=format, selectable_columns={col_list},
+    )
 '''
 
 
@@ -39,19 +58,73 @@ class SelectGen(BaseGen):
     def __init__(self, ignore_columns: Optional[List[str]] = None):
         super().__init__(_FUNC_PREFIX, _IMPORTS, _TOOL_TEMPLATE, ignore_columns)
 
+    def _columns(self, columns: List[tuple]) -> tuple[List[str], List[tuple], List[str]]:
+        select_columns = [(col, typ) for col, typ in columns if col not in self.ignore_columns]
+
+        # Every field is optional, a projection (`columns`) leaves the other ones empty
+        optional_columns = [
+            (col, typ if typ.startswith('Optional[') else f"Optional[{typ}]") for col, typ in select_columns
+        ]
+
+        # Keyset pagination sorts on the primary key and only on columns that can't be NULL
+        not_null_columns = [col for col, typ in select_columns if not typ.startswith('Optional[')]
+
+        return [col for col, _ in select_columns], optional_columns, not_null_columns
+
+    def _key_columns(self, table: str, col_list: List[str]) -> List[str]:
+        # A key hidden from the tool can't be the tiebreaker of its pages: they fall back to OFFSET
+        key_columns = self.primary_key(table)
+        return key_columns if all(col in col_list for col in key_columns) else []
+
+    def _doc(self, table: str) -> str:
+        return _TOOL_DOC.format(table=table, model_name=model_name_of(self.prefix, table))
+
     def generate_tool(
             self,
             table: str,
             columns: List[tuple],
     ) -> tuple[str, str]:
-        select_columns = [(col, typ) for col, typ in columns if col not in self.ignore_columns]
-
-        model_name, model_code = sql_columns_to_pydantic_model(self.prefix, table, select_columns)
+        col_list, optional_columns, not_null_columns = self._columns(columns)
+        model_name, model_code = sql_columns_to_pydantic_model(self.prefix, table, optional_columns)
 
         tool_code = self.template.format(
             func_name=self.func_name(table),
+            doc=self._doc(table),
             model_name=model_name,
-            table=table
+            table=table,
+            key_columns=repr(self._key_columns(table, col_list)),
+            not_null_columns=repr(not_null_columns),
+            column_types=repr(self.column_types(table)),
+            column_literals=", ".join(repr(col) for col in col_list),
+            col_list=repr(col_list),
         )
 
         return model_code, tool_code
+
+    def build_tool(
+            self,
+            table: str,
+            columns: List[tuple],
+    ) -> Optional[Callable]:
+        col_list, optional_columns, not_null_columns = self._columns(columns)
+        model = sql_columns_to_pydantic_class(self.prefix, table, optional_columns)
+        key_columns = self._key_columns(table, col_list)
+        column_types = self.column_types(table)
+
+        async def tool(where=None, order_by=None, limit=None, stream=False, after=None, columns=None, format="rows"):
+            return await select_tmpl(
+                table, where, order_by, limit, model, stream, after,
+                key_columns=key_columns, not_null_columns=not_null_columns, column_types=column_types,
+                columns=columns or col_list, format=format, selectable_columns=col_list,
+            )
+
+        return runtime_tool(tool, self.func_name(table), self._doc(table), {
+            "where": Optional[WhereFilter],
+            "order_by": Optional[List[OrderByItem]],
+            "limit": Optional[int],
+            "stream": bool,
+            "after": Optional[str],
+            "columns": Optional[List[Literal[tuple(col_list)]]],
+            "format": Literal["rows", "columnar"],
+            "return": Union[List[model], ResultPage[model], ColumnarResult],
+        })
@@ -1,40 +1,72 @@
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, List, Literal, NamedTuple, Optional, Tuple, Union
 
-from tai_dynamic_postgres_mcp.gen.builders.base_gen import BaseGen
-from tai_dynamic_postgres_mcp.gen.schema.schema_parser import parse_schema, sql_columns_to_pydantic_model
+from tai_dynamic_postgres_mcp.core.app import mcp_app
+from tai_dynamic_postgres_mcp.gen.builders.base_gen import BaseGen, runtime_tool
+from tai_dynamic_postgres_mcp.gen.filters.models import WhereFilter
+from tai_dynamic_postgres_mcp.gen.order.models import OrderByItem
+from tai_dynamic_postgres_mcp.gen.pagination.models import ColumnarResult, ResultPage
+from tai_dynamic_postgres_mcp.gen.schema.schema_parser import (
+    ParsedSchema,
+    as_parsed_schema,
+    model_name_of,
+    sql_columns_to_pydantic_class,
+    sql_columns_to_pydantic_model,
+)
+from tai_dynamic_postgres_mcp.gen.templates.select_joined import select_joined_tmpl
 
 _FUNC_PREFIX = "select_joined"
 
 _IMPORTS = """# This file is auto-generated. Do not edit manually.
 
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Literal
 from pydantic import BaseModel
 from tai_dynamic_postgres_mcp.core.app import mcp_app
 from tai_dynamic_postgres_mcp.gen.templates.select_joined import select_joined_tmpl
 from tai_dynamic_postgres_mcp.gen.filters.models import WhereFilter
 from tai_dynamic_postgres_mcp.gen.order.models import OrderByItem
+from tai_dynamic_postgres_mcp.gen.pagination.models import ColumnarResult, ResultPage
 
 """
 
-_TOOL_TEMPLATE = '''
-@mcp_app.tool
-async def {func_name}(where: Optional[WhereFilter] = None, order_by: Optional[List[OrderByItem]] = None, limit: Optional[int] = None) -> List[{model_name}]:
-    """
+_TOOL_DOC = '''
     Selects rows from joined tables: {tables_str}.
 
     Parameters:
         where: Optional filters to apply using `WhereFilter` on aliased columns (table_column). For vector similarity (KNN), include in field filters like {{"aliased_vector": {{"knn": {{"query": [floats], "distance": "l2", "threshold": 0.5, "direction": "ASC"}}}}}}. If `threshold` is set, adds a distance filter; always implies ordering by distance (use 'direction' for ASC/DESC). Combine with AND/OR as needed.
         order_by: Optional list of fields and directions to order by (using aliased columns; appended after any implied KNN orders).
-        limit: Optional maximum number of rows to return.
+        limit: Optional maximum number of rows to return (the page size when streaming).
+        stream: If True, rows are read in batches through a server-side cursor and returned as a `ResultPage`, capped by the server's row and byte budget. When the page is truncated, `next_token` points to the rest.
+        after: Optional `next_token` of a previous `ResultPage`, to fetch the following page (implies `stream`).
+        columns: Optional subset of aliased columns to fetch; the others are left empty. Skip heavy fields you don't need.
+        format: "rows" (default) returns one object per row; "columnar" returns the column names once plus one array of values per row, a much smaller response for many rows.
 
     Returns:
-        List of `{model_name}` objects from the joined tables.
-    """
+        List of `{model_name}` objects (or a `ResultPage` of them when streaming), or a `ColumnarResult` with `format="columnar"`, from the joined tables.
+    '''
 
-    return await select_joined_tmpl("{select_clause}", "{from_clause}", where, {column_map_repr}, order_by, limit, {model_name})
+_TOOL_TEMPLATE = '''
+@mcp_app.tool
+async def {func_name}(where: Optional[WhereFilter] = None, order_by: Optional[List[OrderByItem]] = None, limit: Optional[int] = None, stream: bool = False, after: Optional[str] = None, columns: Optional[List[Literal[{column_literals}]]] = None, format: Literal["rows", "columnar"] = "rows") -> Union[List[{model_name}], ResultPage[{model_name}], ColumnarResult]:
+    """{doc}"""
+
+    return await select_joined_tmpl(
+        "{select_clause}", "{from_clause}", where, {column_map_repr}, order_by, limit, {model_name}, stream, after,
+        key_columns={key_columns}, not_null_columns={not_null_columns}, column_types={column_types},
+        columns=columns, format=format,
+    )
 '''
 
 
+class JoinParts(NamedTuple):
+    select_clause: str
+    from_clause: str
+    column_map: Dict[str, str]
+    column_types: Dict[str, str]
+    model_columns: List[Tuple[str, str]]
+    key_columns: List[str]
+    not_null_columns: List[str]
+
+
 class SelectJoinedGen(BaseGen):
     def __init__(self, join_groups: List[List[str]], ignore_columns: Optional[List[str]] = None):
         super().__init__(_FUNC_PREFIX, _IMPORTS, _TOOL_TEMPLATE, ignore_columns)
@@ -47,15 +79,26 @@ class SelectJoinedGen(BaseGen):
     ) -> tuple[str, str]:
         raise NotImplementedError("Use generate_join_tool for joins")
 
-    def generate_tools(self, schema: str) -> List[str]:
-        tables, fks = parse_schema(schema)
+    def generate_tools(self, schema: Union[ParsedSchema, str]) -> List[str]:
+        self.schema = as_parsed_schema(schema)
         chunks = [self.imports]
         for group in self.join_groups:
-            model_code, tool_code = self.generate_join_tool(group, tables, fks)
+            model_code, tool_code = self.generate_join_tool(group, self.schema.tables, self.schema.fks)
             chunks.append(model_code)
             chunks.append(tool_code)
         return chunks
 
+    def register_tools(self, schema: Union[ParsedSchema, str]) -> int:
+        self.schema = as_parsed_schema(schema)
+        for group in self.join_groups:
+            mcp_app.tool(self.build_join_tool(group, self.schema.tables, self.schema.fks))
+        return len(self.join_groups)
+
+    def group_name(self, group: List[str]) -> str:
+        schema_name = group[0].split('.')[0]
+        table_names = "_".join([g.split('.')[-1] for g in group])
+        return f"{schema_name}_{table_names}"
+
     def find_join_condition(self, table_a: str, table_b: str, fks: List[Tuple[str, str, str, str]]) -> Optional[str]:
         for fk_table, fk_col, ref_table, ref_col in fks:
             if fk_table == table_a and ref_table == table_b:
@@ -64,12 +107,12 @@ class SelectJoinedGen(BaseGen):
                 return f"{table_b}.{fk_col} = {table_a}.{ref_col}"
         return None
 
-    def generate_join_tool(
+    def join_parts(
             self,
             group: List[str],
             tables: dict[str, List[Tuple[str, str]]],
             fks: List[Tuple[str, str, str, str]]
-    ) -> Tuple[str, str]:
+    ) -> JoinParts:
         if len(group) < 2:
             raise ValueError("Join group must have at least two tables.")
 
@@ -91,8 +134,10 @@ class SelectJoinedGen(BaseGen):
 
         # Collect columns with aliases and map
         column_map = {}
+        column_types = {}
         select_parts = []
         model_columns = []
+        not_null_columns = []
         base_table = group[0]
         for t in group:
             if t not in tables:
@@ -104,25 +149,87 @@ class SelectJoinedGen(BaseGen):
                 alias = f"{table_name}_{col}"
                 qualified = f"{t}.{col}"
                 column_map[alias] = qualified
+                column_types[alias] = self.column_types(t)[col]
                 select_parts.append(f"{qualified} AS {alias}")
-                if t != base_table and not typ.startswith('Optional['):
+                if not typ.startswith('Optional['):
+                    if t == base_table:
+                        not_null_columns.append(alias)
+                    # Every field is optional: LEFT JOINed tables and projections (`columns`) leave them empty
                     typ = f"Optional[{typ}]"
                 model_columns.append((alias, typ))
 
+        # The primary keys of all the joined tables identify a joined row. A NULL key of a LEFT JOINed
+        # table only shows up on the single row of its parent, so it never breaks the keyset comparison.
+        key_columns = []
+        for t in group:
+            table_name = t.split('.')[-1]
+            pk_aliases = [f"{table_name}_{col}" for col in self.primary_key(t)]
+            if not pk_aliases or any(alias not in column_map for alias in pk_aliases):
+                key_columns = []
+                break
+            key_columns.extend(pk_aliases)
+
         select_clause = "SELECT " + ", ".join(select_parts)
 
-        schema_name = group[0].split('.')[0]
-        table_names = "_".join([g.split('.')[-1] for g in group])
-        joined_group = f"{schema_name}_{table_names}"
-        model_name, model_code = sql_columns_to_pydantic_model(self.prefix, joined_group, model_columns)
+        return JoinParts(select_clause, from_clause, column_map, column_types, model_columns, key_columns, not_null_columns)
+
+    def _doc(self, group: List[str]) -> str:
+        return _TOOL_DOC.format(
+            tables_str=", ".join(group), model_name=model_name_of(self.prefix, self.group_name(group))
+        )
+
+    def generate_join_tool(
+            self,
+            group: List[str],
+            tables: dict[str, List[Tuple[str, str]]],
+            fks: List[Tuple[str, str, str, str]]
+    ) -> Tuple[str, str]:
+        parts = self.join_parts(group, tables, fks)
+
+        joined_group = self.group_name(group)
+        model_name, model_code = sql_columns_to_pydantic_model(self.prefix, joined_group, parts.model_columns)
 
         tool_code = self.template.format(
             func_name=self.func_name(joined_group),
+            doc=self._doc(group),
             model_name=model_name,
-            tables_str=", ".join(group),
-            select_clause=select_clause,
-            from_clause=from_clause,
-            column_map_repr=repr(column_map)
+            select_clause=parts.select_clause,
+            from_clause=parts.from_clause,
+            column_map_repr=repr(parts.column_map),
+            key_columns=repr(parts.key_columns),
+            not_null_columns=repr(parts.not_null_columns),
+            column_types=repr(parts.column_types),
+            column_literals=", ".join(repr(alias) for alias in parts.column_map),
         )
 
         return model_code, tool_code
+
+    def build_join_tool(
+            self,
+            group: List[str],
+            tables: dict[str, List[Tuple[str, str]]],
+            fks: List[Tuple[str, str, str, str]]
+    ) -> Callable:
+        """In-memory counterpart of `generate_join_tool`."""
+        parts = self.join_parts(group, tables, fks)
+
+        joined_group = self.group_name(group)
+        model = sql_columns_to_pydantic_class(self.prefix, joined_group, parts.model_columns)
+
+        async def tool(where=None, order_by=None, limit=None, stream=False, after=None, columns=None, format="rows"):
+            return await select_joined_tmpl(
+                parts.select_clause, parts.from_clause, where, parts.column_map, order_by, limit, model, stream,
+                after, key_columns=parts.key_columns, not_null_columns=parts.not_null_columns,
+                column_types=parts.column_types, columns=columns, format=format,
+            )
+
+        return runtime_tool(tool, self.func_name(joined_group), self._doc(group), {
+            "where": Optional[WhereFilter],
+            "order_by": Optional[List[OrderByItem]],
+            "limit": Optional[int],
+            "stream": bool,
+            "after": Optional[str],
+            "columns": Optional[List[Literal[tuple(parts.column_map)]]],
+            "format": Literal["rows", "columnar"],
+            "return": Union[List[model], ResultPage[model], ColumnarResult],
+        })
@@ -1,7 +1,15 @@
-from typing import List, Optional
+from typing import Callable, List, Optional
 
-from tai_dynamic_postgres_mcp.gen.builders.base_gen import BaseGen
-from tai_dynamic_postgres_mcp.gen.schema.schema_parser import sql_columns_to_pydantic_model
+from pydantic import create_model
+
+from tai_dynamic_postgres_mcp.gen.builders.base_gen import BaseGen, runtime_tool
+from tai_dynamic_postgres_mcp.gen.filters.models import WhereFilter
+from tai_dynamic_postgres_mcp.gen.schema.schema_parser import (
+    model_name_of,
+    sql_columns_to_pydantic_class,
+    sql_columns_to_pydantic_model,
+)
+from tai_dynamic_postgres_mcp.gen.templates.update import update_many_tmpl, update_tmpl
 
 _FUNC_PREFIX = "update"
 
@@ -15,20 +23,22 @@ from tai_dynamic_postgres_mcp.gen.filters.models import WhereFilter
 
 """
 
-_TOOL_TEMPLATE = '''
-@mcp_app.tool
-async def {func_name}(data: {model_name}, where: Optional[WhereFilter] = None) -> int:
-    """
+_TOOL_DOC = '''
     Updates rows in the `{table}` table.
 
     Parameters:
-        data: Partial `{model_name}` object with fields to update.
+        data: Partial `{model_name}` object with the fields to update. Fields left out keep their current value, fields set to null are set to NULL.
         where: Optional filters to apply using `WhereFilter`.
 
     Returns:
         Number of rows updated in the `{table}` table.
-    """
-    return await update_tmpl("{table}", data, where)
+    '''
+
+_TOOL_TEMPLATE = '''
+@mcp_app.tool
+async def {func_name}(data: {model_name}, where: Optional[WhereFilter] = None) -> int:
+    """{doc}"""
+    return await update_tmpl("{table}", data, where, column_types={column_types})
 '''
 
 
@@ -36,22 +46,160 @@ class UpdateGen(BaseGen):
     def __init__(self, ignore_columns: Optional[List[str]] = None):
         super().__init__(_FUNC_PREFIX, _IMPORTS, _TOOL_TEMPLATE, ignore_columns)
 
+    def _columns(self, columns: List[tuple]) -> List[tuple]:
+        # All fields optional for updates
+        return [(col, f"Optional[{typ}]") for col, typ in columns if col not in self.ignore_columns]
+
+    def _doc(self, table: str) -> str:
+        return _TOOL_DOC.format(table=table, model_name=model_name_of(self.prefix, table))
+
     def generate_tool(
             self,
             table: str,
             columns: List[tuple],
     ) -> tuple[str, str]:
-        update_columns = [(col, typ) for col, typ in columns if col not in self.ignore_columns]
-
-        # All fields optional for updates
-        optional_columns = [(col, f"Optional[{typ}]") for col, typ in update_columns]
-
-        model_name, model_code = sql_columns_to_pydantic_model(self.prefix, table, optional_columns)
+        model_name, model_code = sql_columns_to_pydantic_model(self.prefix, table, self._columns(columns))
 
         tool_code = self.template.format(
             func_name=self.func_name(table),
+            doc=self._doc(table),
             model_name=model_name,
-            table=table
+            table=table,
+            column_types=repr(self.column_types(table)),
         )
 
         return model_code, tool_code
+
+    def build_tool(
+            self,
+            table: str,
+            columns: List[tuple],
+    ) -> Optional[Callable]:
+        model = sql_columns_to_pydantic_class(self.prefix, table, self._columns(columns))
+        column_types = self.column_types(table)
+
+        async def tool(data, where=None):
+            return await update_tmpl(table, data, where, column_types=column_types)
+
+        return runtime_tool(tool, self.func_name(table), self._doc(table), {
+            "data": model,
+            "where": Optional[WhereFilter],
+            "return": int,
+        })
+
+
+_MANY_FUNC_PREFIX = "update_many"
+
+_MANY_IMPORTS = """# This file is auto-generated. Do not edit manually.
+
+from typing import Optional, List, Union
+from pydantic import BaseModel
+from tai_dynamic_postgres_mcp.core.app import mcp_app
+from tai_dynamic_postgres_mcp.gen.templates.update import update_many_tmpl
+
+"""
+
+_MANY_ITEM_TEMPLATE = '''
+class {item_model_name}(BaseModel):
+    key: {key_model_name}
+    changes: {model_name}
+'''
+
+_MANY_TOOL_DOC = '''
+    Updates many rows of the `{table}` table, each with its own values, in a single transaction and round trip.
+
+    Parameters:
+        items: List of `{item_model_name}` objects: `key` identifies the row by its primary key ({key_doc}),
+               `changes` holds the fields to update. Fields left out keep their current value, fields set to
+               null are set to NULL. Each key may appear once per call.
+
+    Returns:
+        Number of rows updated in the `{table}` table.
+    '''
+
+_MANY_TOOL_TEMPLATE = '''
+@mcp_app.tool
+async def {func_name}(items: List[{item_model_name}]) -> int:
+    """{doc}"""
+    return await update_many_tmpl("{table}", {key_columns}, items, column_types={column_types})
+'''
+
+
+class UpdateManyGen(BaseGen):
+    def __init__(self, ignore_columns: Optional[List[str]] = None):
+        super().__init__(_MANY_FUNC_PREFIX, _MANY_IMPORTS, _MANY_TOOL_TEMPLATE, ignore_columns)
+
+    def _columns(self, table: str, columns: List[tuple]) -> tuple[List[str], List[tuple], List[tuple]]:
+        key_columns = self.primary_key(table)
+        key_model_columns = [(col, typ) for col, typ in columns if col in key_columns]
+
+        # All fields optional, the key itself can't be changed
+        change_columns = [
+            (col, f"Optional[{typ}]") for col, typ in columns
+            if col not in self.ignore_columns and col not in key_columns
+        ]
+        return key_columns, key_model_columns, change_columns
+
+    def _item_model_name(self, table: str) -> str:
+        return model_name_of(self.prefix, table).removesuffix("Row") + "Item"
+
+    def _doc(self, table: str, key_columns: List[str]) -> str:
+        return _MANY_TOOL_DOC.format(
+            table=table, item_model_name=self._item_model_name(table), key_doc=', '.join(key_columns)
+        )
+
+    def _column_types(self, table: str, key_columns: List[str], change_columns: List[tuple]) -> dict:
+        types = self.column_types(table)
+        return {col: types[col] for col in key_columns + [col for col, _ in change_columns]}
+
+    def generate_tool(
+            self,
+            table: str,
+            columns: List[tuple],
+    ) -> tuple[str, str]:
+        key_columns, key_model_columns, change_columns = self._columns(table, columns)
+        if not key_columns:
+            return "", ""  # Rows can't be addressed without a primary key
+
+        key_model_name, key_model_code = sql_columns_to_pydantic_model(self.prefix, f"{table}_key", key_model_columns)
+        model_name, model_code = sql_columns_to_pydantic_model(self.prefix, table, change_columns)
+
+        item_model_name = self._item_model_name(table)
+        item_model_code = _MANY_ITEM_TEMPLATE.format(
+            item_model_name=item_model_name,
+            key_model_name=key_model_name,
+            model_name=model_name,
+        )
+
+        tool_code = self.template.format(
+            func_name=self.func_name(table),
+            doc=self._doc(table, key_columns),
+            item_model_name=item_model_name,
+            table=table,
+            key_columns=repr(key_columns),
+            column_types=repr(self._column_types(table, key_columns, change_columns)),
+        )
+
+        return key_model_code + model_code + item_model_code, tool_code
+
+    def build_tool(
+            self,
+            table: str,
+            columns: List[tuple],
+    ) -> Optional[Callable]:
+        key_columns, key_model_columns, change_columns = self._columns(table, columns)
+        if not key_columns:
+            return None
+
+        key_model = sql_columns_to_pydantic_class(self.prefix, f"{table}_key", key_model_columns)
+        model = sql_columns_to_pydantic_class(self.prefix, table, change_columns)
+        item_model = create_model(self._item_model_name(table), key=(key_model, ...), changes=(model, ...))
+        column_types = self._column_types(table, key_columns, change_columns)
+
+        async def tool(items):
+            return await update_many_tmpl(table, key_columns, items, column_types=column_types)
+
+        return runtime_tool(tool, self.func_name(table), self._doc(table, key_columns), {
+            "items": List[item_model],
+            "return": int,
+        })
@@ -0,0 +1,127 @@
+import logging
+from typing import Callable, List, Literal, Optional, Tuple
+
+from tai_dynamic_postgres_mcp.gen.builders.base_gen import BaseGen, runtime_tool
+from tai_dynamic_postgres_mcp.gen.schema.schema_parser import (
+    model_name_of,
+    sql_columns_to_pydantic_class,
+    sql_columns_to_pydantic_model,
+)
+from tai_dynamic_postgres_mcp.gen.templates.upsert import upsert_tmpl
+
+logger = logging.getLogger(__name__)
+
+_FUNC_PREFIX = "upsert"
+
+_IMPORTS = """# This file is auto-generated. Do not edit manually.
+
+from typing import Optional, List, Union, Literal
+from pydantic import BaseModel
+from tai_dynamic_postgres_mcp.core.app import mcp_app
+from tai_dynamic_postgres_mcp.gen.templates.upsert import upsert_tmpl
+
+"""
+
+_TOOL_DOC = '''
+    Inserts multiple rows into the `{table}` table, updating the existing row instead when one with the same key
+    already exists (INSERT ... ON CONFLICT DO UPDATE), so no select is needed before writing.
+
+    Parameters:
+        params: List of `{model_name}` objects in the order: {doc_params}
+        conflict_on: Unique key (comma-separated columns) that identifies an existing row.
+
+    Rows sharing a key are written once, with the values of the last of them.
+
+    Returns:
+        List of inserted or updated row IDs from the `{table}` table, one per row of `params`.
+    '''
+
+_TOOL_TEMPLATE = '''
+@mcp_app.tool
+async def {func_name}(params: List[{model_name}], conflict_on: Literal[{conflict_targets}] = "{default_target}") -> List[int]:
+    """{doc}"""
+
+    values = [({args}) for row in params or []]
+
+    return await upsert_tmpl("{table}", {col_list}, values, conflict_on.split(","), column_types={column_types})
+'''
+
+
+class UpsertGen(BaseGen):
+    def __init__(self, ignore_columns: Optional[List[str]] = None):
+        super().__init__(_FUNC_PREFIX, _IMPORTS, _TOOL_TEMPLATE, ignore_columns)
+
+    def _conflict_targets(self, table: str, col_list: List[str]) -> List[str]:
+        # Only keys whose columns are all provided by the model can detect a conflict
+        return [",".join(key) for key in self.unique_keys(table) if all(col in col_list for col in key)]
+
+    def _columns(self, table: str, columns: List[tuple]) -> Tuple[List[tuple], List[str]]:
+        """Columns of the model, and the conflict targets they cover."""
+        upsert_columns = [(col, typ) for col, typ in columns if col not in self.ignore_columns]
+        conflict_targets = self._conflict_targets(table, [col for col, _ in upsert_columns])
+        if not conflict_targets:
+            # Every key has an ignored column, e.g. `id` by default: keys are how upserts address rows,
+            # so the model takes them back
+            key_columns = {col for key in self.unique_keys(table) for col in key}
+            upsert_columns = [
+                (col, typ) for col, typ in columns if col not in self.ignore_columns or col in key_columns
+            ]
+            conflict_targets = self._conflict_targets(table, [col for col, _ in upsert_columns])
+        if not conflict_targets:
+            logger.debug(f"No upsert tool for {table}: it has no primary key or unique constraint")
+        return upsert_columns, conflict_targets
+
+    def _doc(self, table: str, col_list: List[str]) -> str:
+        return _TOOL_DOC.format(table=table, model_name=model_name_of(self.prefix, table), doc_params=', '.join(col_list))
+
+    def generate_tool(
+            self,
+            table: str,
+            columns: List[tuple],
+    ) -> tuple[str, str]:
+        upsert_columns, conflict_targets = self._columns(table, columns)
+        col_list = [col for col, _ in upsert_columns]
+        if not conflict_targets:
+            return "", ""
+
+        model_name, model_code = sql_columns_to_pydantic_model(self.prefix, table, upsert_columns)
+
+        types = self.column_types(table)
+        tool_code = self.template.format(
+            func_name=self.func_name(table),
+            model_name=model_name,
+            table=table,
+            conflict_targets=", ".join(f'"{target}"' for target in conflict_targets),
+            default_target=conflict_targets[0],
+            doc=self._doc(table, col_list),
+            args=', '.join([f"row.{col}" for col in col_list]),
+            col_list=repr(col_list),
+            column_types=repr({col: types[col] for col in col_list}),
+        )
+
+        return model_code, tool_code
+
+    def build_tool(
+            self,
+            table: str,
+            columns: List[tuple],
+    ) -> Optional[Callable]:
+        upsert_columns, conflict_targets = self._columns(table, columns)
+        col_list = [col for col, _ in upsert_columns]
+        if not conflict_targets:
+            return None
+
+        model = sql_columns_to_pydantic_class(self.prefix, table, upsert_columns)
+        types = self.column_types(table)
+        column_types = {col: types[col] for col in col_list}
+
+        async def tool(params, conflict_on=conflict_targets[0]):
+            values = [tuple(getattr(row, col) for col in col_list) for row in params or []]
+
+            return await upsert_tmpl(table, col_list, values, conflict_on.split(","), column_types=column_types)
+
+        return runtime_tool(tool, self.func_name(table), self._doc(table, col_list), {
+            "params": List[model],
+            "conflict_on": Literal[tuple(conflict_targets)],
+            "return": List[int],
+        })
@@ -1,10 +1,20 @@
 from typing import Optional, List, Any, Dict, Tuple
 
+from tai_dynamic_postgres_mcp.database.helpers import Vector
 from tai_dynamic_postgres_mcp.gen.filters.models import WhereFilter, LogicalFilter
 
 
+def _bind_as_array(sql_type: Optional[str], values: List[Any]) -> bool:
+    # Array and json columns compare whole containers, which an array parameter can't carry.
+    if sql_type and (sql_type.endswith(']') or sql_type.startswith('json')):
+        return False
+    return not any(isinstance(value, (dict, list)) for value in values)
+
+
 def build_where_clause(
-        op: Optional[WhereFilter], column_map: Optional[Dict[str, str]] = None
+        op: Optional[WhereFilter],
+        column_map: Optional[Dict[str, str]] = None,
+        column_types: Optional[Dict[str, str]] = None,
 ) -> Tuple[str, List[Any]]:
     if not op:
         return "", []
@@ -20,23 +30,26 @@ def build_where_clause(
 
     if isinstance(inner, LogicalFilter):
         if inner.AND:
-            sub_clauses = [build_where_clause(sub, column_map) for sub in inner.AND]
+            sub_clauses = [build_where_clause(sub, column_map, column_types) for sub in inner.AND]
             sql_parts, values = zip(*sub_clauses)
             clauses.append(f"({' AND '.join([part for part in sql_parts if part])})")
             params.extend([v for subvals in values for v in subvals])
         if inner.OR:
-            sub_clauses = [build_where_clause(sub, column_map) for sub in inner.OR]
+            sub_clauses = [build_where_clause(sub, column_map, column_types) for sub in inner.OR]
             sql_parts, values = zip(*sub_clauses)
             clauses.append(f"({' OR '.join([part for part in sql_parts if part])})")
             params.extend([v for subvals in values for v in subvals])
         if inner.NOT:
-            sql, vals = build_where_clause(inner.NOT, column_map)
+            sql, vals = build_where_clause(inner.NOT, column_map, column_types)
             if sql:
                 clauses.append(f"(NOT ({sql}))")
             params.extend(vals)
     elif isinstance(inner, dict):
         for field, condition in inner.items():
             mapped_field = map_column(field)
+            sql_type = column_types.get(field) if column_types else None
+            # A single typed array parameter keeps the statement (and its plan) independent of the list size.
+            array_placeholder = f"%s::{sql_type}[]" if sql_type else "%s"
             for operator, value in condition.model_dump(exclude_none=True, by_alias=True).items():
                 if operator == "knn":
                     knn = condition.knn
@@ -46,9 +59,8 @@ def build_where_clause(
                         'cosine': '<=>'
                     }
                     op = op_map.get(knn.distance, '<->')
-                    vector_str = '[' + ','.join(map(str, knn.query)) + ']'
                     clauses.append(f"{mapped_field} {op} (%s)::vector < %s")
-                    params.extend([vector_str, knn.threshold])
+                    params.extend([Vector(knn.query), knn.threshold])
                 else:
                     match operator:
                         case "eq":
@@ -83,6 +95,12 @@ def build_where_clause(
                             params.append(value)
                         case "is_null":
                             clauses.append(f"{mapped_field} IS {'NULL' if value else 'NOT NULL'}")
+                        case "in" if _bind_as_array(sql_type, value):
+                            clauses.append(f"{mapped_field} = ANY({array_placeholder})")
+                            params.append(value)
+                        case "not_in" if _bind_as_array(sql_type, value):
+                            clauses.append(f"{mapped_field} <> ALL({array_placeholder})")
+                            params.append(value)
                         case "in":
                             placeholders = ', '.join(['%s'] * len(value))
                             clauses.append(f"{mapped_field} IN ({placeholders})")
@@ -0,0 +1,26 @@
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class ColumnInfo(BaseModel):
+    name: str
+    type: str  # SQL type, e.g. "character varying(255)"
+    nullable: bool
+    default: Optional[str] = None  # SQL expression of the column default
+
+
+class ForeignKeyInfo(BaseModel):
+    column: str
+    ref_table: str
+    ref_column: str
+
+
+class TableDescription(BaseModel):
+    table: str
+    columns: List[ColumnInfo]
+    primary_key: List[str]
+    unique_keys: List[List[str]]
+    foreign_keys: List[ForeignKeyInfo]
+    operations: List[str]  # Generic tools usable on this table
+    input_schemas: Dict[str, Dict[str, Any]]  # JSON schema of the table-specific arguments of each operation
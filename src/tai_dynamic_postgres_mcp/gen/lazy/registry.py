@@ -0,0 +1,122 @@
+from collections import OrderedDict
+from functools import cached_property
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from fastmcp.utilities.json_schema import compress_schema
+from pydantic import TypeAdapter
+
+from tai_dynamic_postgres_mcp.config.settings import pg_settings
+from tai_dynamic_postgres_mcp.gen.builders.base_gen import BaseGen
+from tai_dynamic_postgres_mcp.gen.schema.schema_parser import ParsedSchema
+
+# Arguments of each operation that depend on the table; the others are shared by every table.
+_TABLE_PARAMS = {
+    "select": ["columns"],
+    "aggregate": ["group_by"],
+    "insert": ["params"],
+    "upsert": ["params", "conflict_on"],
+    "update": ["data"],
+    "update_many": ["items"],
+    "delete": [],
+}
+
+
+class CompiledTool:
+    """The tool of one table and operation, as `build_tool` makes it, with its argument validation."""
+
+    def __init__(self, operation: str, fn: Callable) -> None:
+        self.operation = operation
+        self.fn = fn
+        self.adapter = TypeAdapter(fn)
+
+    async def call(self, arguments: Dict[str, Any]) -> Any:
+        # Validates the arguments into the table's models and calls the tool, like FastMCP does
+        return await self.adapter.validate_python(arguments)
+
+    @cached_property
+    def input_schema(self) -> Dict[str, Any]:
+        schema = self.adapter.json_schema()
+        shared = [name for name in schema.get("properties", {}) if name not in _TABLE_PARAMS[self.operation]]
+        return compress_schema(schema, prune_params=shared)
+
+
+class LazyToolRegistry:
+    """
+    LRU cache of the per-table tools behind the generic tools of the lazy mode.
+
+    A table's models and validators are only built when one of its tools is first called (or
+    described); the least recently used ones are dropped past `maxsize`, so the memory stays
+    bounded on schemas with thousands of tables.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.generators: Dict[str, BaseGen] = {}
+        self.schema: Optional[ParsedSchema] = None
+        self._entries: OrderedDict[Tuple[str, str], Optional[CompiledTool]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def configure(self, generators: Iterable[BaseGen], schema: ParsedSchema):
+        self.generators = {gen.prefix: gen for gen in generators}
+        self.set_schema(schema)
+
+    def set_schema(self, schema: ParsedSchema, tables: Optional[Iterable[str]] = None):
+        """Switches to a new schema, dropping the compiled tools of `tables` (all of them by default)."""
+        self.schema = schema
+        for gen in self.generators.values():
+            gen.schema = schema
+        if tables is None:
+            self._entries.clear()
+        else:
+            tables = set(tables)
+            for key in [key for key in self._entries if key[1] in tables]:
+                del self._entries[key]
+
+    @property
+    def operations(self) -> List[str]:
+        return list(self.generators)
+
+    def tables(self) -> List[str]:
+        return list(self.schema.tables) if self.schema else []
+
+    def get(self, operation: str, table: str) -> Optional[CompiledTool]:
+        """The compiled tool of `table`, or None when the operation doesn't apply (e.g. upsert without a unique key)."""
+        if operation not in self.generators:
+            raise ValueError(f"Operation {operation} is not available")
+        if not self.schema or table not in self.schema.tables:
+            raise ValueError(f"Unknown table {table}, list them with `list_tables`")
+
+        key = (operation, table)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+        self.misses += 1
+        fn = self.generators[operation].build_tool(table, self.schema.tables[table])
+        compiled = CompiledTool(operation, fn) if fn else None
+        self._entries[key] = compiled
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return compiled
+
+    async def call(self, operation: str, table: str, **arguments) -> Any:
+        compiled = self.get(operation, table)
+        if compiled is None:
+            raise ValueError(f"Operation {operation} is not available on {table}")
+        # Omitted arguments take the table tool's own defaults
+        return await compiled.call({name: value for name, value in arguments.items() if value is not None})
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+lazy_registry = LazyToolRegistry(pg_settings.lazy_cache_size)
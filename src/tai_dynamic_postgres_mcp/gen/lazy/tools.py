@@ -0,0 +1,223 @@
+from typing import Any, Dict, List, Literal, Optional, Union
+
+from tai_dynamic_postgres_mcp.core.app import mcp_app
+from tai_dynamic_postgres_mcp.gen.aggregate.models import AggregateItem
+from tai_dynamic_postgres_mcp.gen.filters.models import WhereFilter
+from tai_dynamic_postgres_mcp.gen.lazy.models import ColumnInfo, ForeignKeyInfo, TableDescription
+from tai_dynamic_postgres_mcp.gen.lazy.registry import lazy_registry
+from tai_dynamic_postgres_mcp.gen.order.models import OrderByItem
+from tai_dynamic_postgres_mcp.gen.pagination.models import ColumnarResult, ResultPage
+
+
+async def list_tables(schema: Optional[str] = None, name_contains: Optional[str] = None) -> List[str]:
+    """
+    Lists the tables the generic tools (`select`, `insert`, ...) can be used on.
+
+    Parameters:
+        schema: Optional schema name, to list only its tables.
+        name_contains: Optional substring the table name must contain (case-insensitive).
+
+    Returns:
+        Schema-qualified table names. Call `describe_table` for the columns and keys of one.
+    """
+    tables = lazy_registry.tables()
+    if schema:
+        tables = [table for table in tables if table.split(".")[0] == schema]
+    if name_contains:
+        tables = [table for table in tables if name_contains.lower() in table.split(".")[-1].lower()]
+    return tables
+
+
+async def describe_table(table: str) -> TableDescription:
+    """
+    Describes a table: its columns, keys and foreign keys, the generic tools usable on it and the
+    JSON schema of their table-specific arguments (rows, changes, columns).
+
+    Parameters:
+        table: Schema-qualified table name, as returned by `list_tables`.
+
+    Returns:
+        A `TableDescription` of the table.
+    """
+    compiled = {operation: lazy_registry.get(operation, table) for operation in lazy_registry.operations}
+    compiled = {operation: tool for operation, tool in compiled.items() if tool}
+
+    schema = lazy_registry.schema
+    types = schema.types.get(table, {})
+    defaults = schema.defaults.get(table, {})
+    pk = schema.pks.get(table, [])
+    return TableDescription(
+        table=table,
+        columns=[
+            ColumnInfo(name=col, type=types[col], nullable=typ.startswith("Optional["), default=defaults.get(col))
+            for col, typ in schema.tables[table]
+        ],
+        primary_key=pk,
+        unique_keys=([pk] if pk else []) + schema.uniques.get(table, []),
+        foreign_keys=[
+            ForeignKeyInfo(column=col, ref_table=ref_table, ref_column=ref_col)
+            for fk_table, col, ref_table, ref_col in schema.fks if fk_table == table
+        ],
+        operations=list(compiled),
+        input_schemas={operation: tool.input_schema for operation, tool in compiled.items() if tool.input_schema},
+    )
+
+
+async def select(
+        table: str,
+        where: Optional[WhereFilter] = None,
+        order_by: Optional[List[OrderByItem]] = None,
+        limit: Optional[int] = None,
+        stream: bool = False,
+        after: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        format: Literal["rows", "columnar"] = "rows",
+) -> Union[List[Dict[str, Any]], ResultPage[Dict[str, Any]], ColumnarResult]:
+    """
+    Selects rows from a table.
+
+    Parameters:
+        table: Schema-qualified table name, as returned by `list_tables`.
+        where: Optional filters to apply using `WhereFilter`. For vector similarity (KNN), include in field filters like {"vector_field": {"knn": {"query": [floats], "distance": "l2", "threshold": 0.5, "direction": "ASC"}}}. If `threshold` is set, adds a distance filter; always implies ordering by distance (use 'direction' for ASC/DESC). Combine with AND/OR as needed.
+        order_by: Optional list of fields and directions to order by (appended after any implied KNN orders).
+        limit: Optional maximum number of rows to return (the page size when streaming).
+        stream: If True, rows are read in batches through a server-side cursor and returned as a `ResultPage`, capped by the server's row and byte budget. When the page is truncated, `next_token` points to the rest.
+        after: Optional `next_token` of a previous `ResultPage`, to fetch the following page (implies `stream`).
+        columns: Optional subset of columns to fetch; the others are left empty. Skip heavy fields you don't need.
+        format: "rows" (default) returns one object per row; "columnar" returns the column names once plus one array of values per row, a much smaller response for many rows.
+
+    Returns:
+        List of rows (or a `ResultPage` of them when streaming), or a `ColumnarResult` with `format="columnar"`.
+    """
+    return await lazy_registry.call(
+        "select", table, where=where, order_by=order_by, limit=limit, stream=stream, after=after, columns=columns,
+        format=format,
+    )
+
+
+async def aggregate(
+        table: str,
+        aggregates: Optional[List[AggregateItem]] = None,
+        where: Optional[WhereFilter] = None,
+        group_by: Optional[List[str]] = None,
+        having: Optional[WhereFilter] = None,
+        order_by: Optional[List[OrderByItem]] = None,
+        limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Computes aggregates over a table in the database, returning one row per group instead of the rows themselves.
+
+    Parameters:
+        table: Schema-qualified table name, as returned by `list_tables`.
+        aggregates: Optional list of `AggregateItem` ({"func": "count" | "sum" | "avg" | "min" | "max" | "count_distinct", "field": column, "alias": name}). `field` can be omitted for `count` to count rows. Defaults to counting rows.
+        where: Optional filters to apply using `WhereFilter` on the rows, before aggregating.
+        group_by: Optional columns to group by, one result row per distinct combination.
+        having: Optional filters to apply using `WhereFilter` on the results, referring to the aggregates by alias (default "<func>_<field>", or "count") and to the `group_by` columns.
+        order_by: Optional list of results (aliases or `group_by` columns) and directions to order by.
+        limit: Optional maximum number of result rows to return.
+
+    Returns:
+        List of result rows, each holding the `group_by` columns and the aggregates by alias.
+    """
+    return await lazy_registry.call(
+        "aggregate", table, aggregates=aggregates, where=where, group_by=group_by, having=having, order_by=order_by,
+        limit=limit,
+    )
+
+
+async def insert(table: str, params: List[Dict[str, Any]], raise_on_conflict: bool = True) -> List[int]:
+    """
+    Inserts multiple rows into a table.
+
+    Parameters:
+        table: Schema-qualified table name, as returned by `list_tables`.
+        params: Rows to insert, as objects of column values (see `describe_table`).
+        raise_on_conflict: If True, raise an error on unique constraint conflict.
+                           If False, conflicting rows will be ignored (ON CONFLICT DO NOTHING).
+
+    Returns:
+        List of inserted row IDs.
+    """
+    return await lazy_registry.call("insert", table, params=params, raise_on_conflict=raise_on_conflict)
+
+
+async def upsert(table: str, params: List[Dict[str, Any]], conflict_on: Optional[str] = None) -> List[int]:
+    """
+    Inserts multiple rows into a table, updating the existing row instead when one with the same key already exists
+    (INSERT ... ON CONFLICT DO UPDATE).
+
+    Parameters:
+        table: Schema-qualified table name, as returned by `list_tables`.
+        params: Rows to write, as objects of column values (see `describe_table`).
+        conflict_on: Optional unique key (comma-separated columns) that identifies an existing row. Defaults to the
+                     primary key, or the first unique key.
+
+    Returns:
+        List of inserted or updated row IDs.
+    """
+    return await lazy_registry.call("upsert", table, params=params, conflict_on=conflict_on)
+
+
+async def update(table: str, data: Dict[str, Any], where: Optional[WhereFilter] = None) -> int:
+    """
+    Updates rows in a table.
+
+    Parameters:
+        table: Schema-qualified table name, as returned by `list_tables`.
+        data: Object of the column values to set. Fields left out keep their current value, fields set to null are
+              set to NULL.
+        where: Optional filters to apply using `WhereFilter`.
+
+    Returns:
+        Number of rows updated.
+    """
+    return await lazy_registry.call("update", table, data=data, where=where)
+
+
+async def update_many(table: str, items: List[Dict[str, Any]]) -> int:
+    """
+    Updates many rows of a table, each with its own values, in a single transaction and round trip.
+
+    Parameters:
+        table: Schema-qualified table name, as returned by `list_tables`.
+        items: List of `{"key": {...}, "changes": {...}}` objects: `key` identifies the row by its primary key,
+               `changes` holds the fields to update. Fields left out keep their current value, fields set to
+               null are set to NULL. Each key may appear once per call.
+
+    Returns:
+        Number of rows updated.
+    """
+    return await lazy_registry.call("update_many", table, items=items)
+
+
+async def delete(table: str, where: Optional[WhereFilter] = None) -> int:
+    """
+    Deletes rows from a table.
+
+    Parameters:
+        table: Schema-qualified table name, as returned by `list_tables`.
+        where: Optional filters to apply using `WhereFilter`.
+
+    Returns:
+        Number of rows deleted.
+    """
+    return await lazy_registry.call("delete", table, where=where)
+
+
+_GENERIC_TOOLS = {
+    "select": select,
+    "aggregate": aggregate,
+    "insert": insert,
+    "upsert": upsert,
+    "update": update,
+    "update_many": update_many,
+    "delete": delete,
+}
+
+
+def register_lazy_tools() -> int:
+    """Registers the catalog tools and the generic tool of every configured operation. Returns their count."""
+    tools = [list_tables, describe_table] + [_GENERIC_TOOLS[operation] for operation in lazy_registry.operations]
+    for tool in tools:
+        mcp_app.tool(tool)
+    return len(tools)
@@ -1,20 +1,84 @@
 import importlib
 import logging
 import pkgutil
-from typing import Optional, List
+import time
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Optional, List, Tuple
 
 from tai_dynamic_postgres_mcp import tools
+from tai_dynamic_postgres_mcp.config.settings import pg_settings
+from tai_dynamic_postgres_mcp.core.app import mcp_app
+from tai_dynamic_postgres_mcp.database.result_cache import result_cache, table_change_listener
+from tai_dynamic_postgres_mcp.gen.builders.aggregate_gen import AggregateGen
 from tai_dynamic_postgres_mcp.gen.builders.base_gen import BaseGen, TOOLS_SUFFIX
 from tai_dynamic_postgres_mcp.gen.builders.delete_gen import DeleteGen
 from tai_dynamic_postgres_mcp.gen.builders.insert_gen import InsertGen
 from tai_dynamic_postgres_mcp.gen.builders.select_gen import SelectGen
 from tai_dynamic_postgres_mcp.gen.builders.select_joined_gen import SelectJoinedGen
-from tai_dynamic_postgres_mcp.gen.builders.update_gen import UpdateGen
-from tai_dynamic_postgres_mcp.gen.schema.introspect import generate_schema_ddl
+from tai_dynamic_postgres_mcp.gen.builders.update_gen import UpdateGen, UpdateManyGen
+from tai_dynamic_postgres_mcp.gen.builders.upsert_gen import UpsertGen
+from tai_dynamic_postgres_mcp.gen.lazy.registry import lazy_registry
+from tai_dynamic_postgres_mcp.gen.lazy.tools import register_lazy_tools
+from tai_dynamic_postgres_mcp.gen.reload import SchemaWatcher
+from tai_dynamic_postgres_mcp.gen.schema.introspect import introspect_schema
+from tai_dynamic_postgres_mcp.gen.schema.schema_parser import ParsedSchema
+from tai_dynamic_postgres_mcp.gen.schema.stats import build_table_stats_tool
+from tai_dynamic_postgres_mcp.gen.schema.snapshot import load_snapshot, save_snapshot, schema_fingerprint
 
 logger = logging.getLogger(__name__)
 
 
+def _package_version() -> str:
+    try:
+        return version("tai-dynamic-postgres-mcp")
+    except PackageNotFoundError:
+        return "dev"
+
+
+async def _introspect(snapshot_path: Path, fingerprint: str) -> ParsedSchema:
+    schema = await introspect_schema()
+    save_snapshot(snapshot_path, fingerprint, schema)
+    return schema
+
+
+async def _load_from_files(
+        gen_list: List[BaseGen],
+        overwrite: bool,
+        unchanged: bool,
+        snapshot: Optional[Tuple[str, ParsedSchema]],
+        snapshot_path: Path,
+        fingerprint: str,
+        start: float,
+) -> ParsedSchema:
+    to_generate = [gen for gen in gen_list if not gen.is_exists]
+    if overwrite and not unchanged:
+        to_generate = gen_list
+
+    schema = snapshot[1] if unchanged else None
+    if to_generate:
+        # Introspected once, shared by every generator
+        schema = schema or await introspect_schema()
+        for gen in to_generate:
+            gen.generate_file(schema)
+        # Only a full generation leaves every tool file matching the fingerprint
+        if not unchanged and len(to_generate) == len(gen_list):
+            save_snapshot(snapshot_path, fingerprint, schema)
+        logger.info(f"Generated {len(to_generate)} tool files in {time.perf_counter() - start:.2f}s")
+    else:
+        logger.info(f"Schema unchanged, reusing the generated tool files ({time.perf_counter() - start:.2f}s)")
+
+    for loader, module_name, is_pkg in pkgutil.walk_packages(tools.__path__, tools.__name__ + "."):
+        try:
+            if module_name.endswith(TOOLS_SUFFIX):
+                importlib.import_module(module_name)
+        except ImportError as e:
+            logger.warning(f"Failed to import {module_name}: {e}")
+
+    # Files reused without a matching snapshot: the table stats tool and schema reloads need the schema
+    return schema or await introspect_schema()
+
+
 async def load_dynamic_tools(
         overwrite: bool = True,
         readonly: bool = False,
@@ -23,28 +87,80 @@ async def load_dynamic_tools(
         ignore_update_columns: Optional[List[str]] = None,
         ignore_select_joined_columns: Optional[List[str]] = None,
         select_joined: Optional[List[List[str]]] = None,
-):
+        emit_files: bool = False,
+        lazy: bool = False,
+) -> Optional[SchemaWatcher]:
+    """
+    Registers the tools of every table on `mcp_app`.
+
+    By default the tools are built in memory. With `emit_files`, their source is written to the
+    `tools` package and imported from there instead, to inspect what the server exposes. With `lazy`,
+    only a catalog and one generic tool per operation are registered, taking the table as argument.
+    """
     gen_list: List[BaseGen] = [
         SelectJoinedGen(select_joined, ignore_select_joined_columns),
         SelectGen(ignore_select_columns),
+        AggregateGen(ignore_select_columns),
     ]
 
     if not readonly:
         gen_list += [
             InsertGen(ignore_insert_columns),
+            UpsertGen(ignore_insert_columns),
             UpdateGen(ignore_update_columns),
+            UpdateManyGen(ignore_update_columns),
             DeleteGen(),
         ]
 
-    to_generate = gen_list if overwrite else [gen for gen in gen_list if not gen.is_exists]
-    if to_generate:
-        schema = await generate_schema_ddl()
-        for gen in to_generate:
-            gen.generate_file(schema)
+    start = time.perf_counter()
 
-    for loader, module_name, is_pkg in pkgutil.walk_packages(tools.__path__, tools.__name__ + "."):
-        try:
-            if module_name.endswith(TOOLS_SUFFIX):
-                importlib.import_module(module_name)
-        except ImportError as e:
-            logger.warning(f"Failed to import {module_name}: {e}")
+    # The generated code depends on the schema, the generator options and the generators themselves
+    fingerprint = await schema_fingerprint({
+        "version": _package_version(),
+        "readonly": readonly,
+        "ignore_insert_columns": ignore_insert_columns,
+        "ignore_select_columns": ignore_select_columns,
+        "ignore_update_columns": ignore_update_columns,
+        "ignore_select_joined_columns": ignore_select_joined_columns,
+        "select_joined": select_joined,
+        "emit_files": emit_files,
+        "lazy": lazy,
+    })
+    snapshot_path = Path(pg_settings.schema_snapshot_path or Path(tools.__file__).resolve().parent / "schema.json")
+    snapshot = load_snapshot(snapshot_path)
+    unchanged = snapshot is not None and snapshot[0] == fingerprint
+
+    # Describes the tables and columns the select tools expose
+    mcp_app.tool(build_table_stats_tool(gen_list[1]))
+
+    registry = None
+    if lazy:
+        schema = snapshot[1] if unchanged else await _introspect(snapshot_path, fingerprint)
+        # Few and explicitly configured, the joined selects keep their own tools
+        registry = lazy_registry
+        registry.configure(gen_list[1:], schema)
+        gen_list = gen_list[:1]
+        count = gen_list[0].register_tools(schema) + register_lazy_tools()
+        logger.info(f"Registered {count} tools for {len(schema.tables)} tables in {time.perf_counter() - start:.2f}s")
+    elif emit_files:
+        schema = await _load_from_files(gen_list, overwrite, unchanged, snapshot, snapshot_path, fingerprint, start)
+    else:
+        schema = snapshot[1] if unchanged else await _introspect(snapshot_path, fingerprint)
+        count = sum(gen.register_tools(schema) for gen in gen_list)
+        logger.info(f"Registered {count} tools in {time.perf_counter() - start:.2f}s")
+
+    # The schema the loaded tools were generated from, the starting point of schema reloads
+    for gen in gen_list:
+        gen.schema = gen.schema or schema
+
+    if result_cache.enabled and pg_settings.result_cache_notify:
+        # Notified by the triggers of `--install-change-triggers`
+        await table_change_listener.start()
+
+    if pg_settings.schema_reload:
+        watcher = SchemaWatcher(
+            gen_list, pg_settings.schema_reload_channel, pg_settings.schema_reload_delay, lazy_registry=registry
+        )
+        await watcher.start()
+        return watcher
+    return None
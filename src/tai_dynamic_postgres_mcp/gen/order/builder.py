@@ -1,8 +1,16 @@
 from typing import Optional, List, Dict, Tuple, Any
 
+from tai_dynamic_postgres_mcp.database.helpers import Vector
 from tai_dynamic_postgres_mcp.gen.order.models import OrderByItem
 
 
+def check_order_by_fields(order_by: Optional[List[OrderByItem]], columns: List[str]):
+    """Refuses ordering by a column the tool doesn't expose, e.g. one ignored by `--ignore-select-column`."""
+    unknown = [item.field for item in order_by or [] if item.field not in columns]
+    if unknown:
+        raise ValueError(f"Unknown order_by fields: {', '.join(unknown)}")
+
+
 def build_order_by_clause(
         order_by: Optional[List[OrderByItem]] = None,
         column_map: Optional[Dict[str, str]] = None
@@ -24,9 +32,8 @@ def build_order_by_clause(
         if item.knn:
             knn = item.knn
             op = op_map.get(knn.distance, '<->')
-            vector_str = '[' + ','.join(map(str, knn.query)) + ']'
             parts.append(f"{mapped_field} {op} (%s)::vector {knn.direction}")
-            order_params.append(vector_str)
+            order_params.append(Vector(knn.query))
         else:
             parts.append(f"{mapped_field} {item.direction}")
 
@@ -0,0 +1,51 @@
+from typing import Optional, List, Dict, Tuple, Any
+
+from tai_dynamic_postgres_mcp.gen.order.models import OrderByItem
+
+
+def keyset_order_by(
+        order_by: Optional[List[OrderByItem]],
+        key_columns: Optional[List[str]],
+        not_null_columns: Optional[List[str]],
+) -> Optional[List[OrderByItem]]:
+    """
+    Returns `order_by` extended with the key columns as tiebreakers, so that the ordering is total
+    and a page can resume right after the last row seen. Returns None when keyset paging is not
+    applicable (no key, KNN ordering or nullable sort fields); callers fall back to OFFSET paging.
+    """
+    if not key_columns:
+        return None
+
+    items = list(order_by or [])
+    if any(item.knn or item.field not in (not_null_columns or []) for item in items):
+        return None
+
+    # Reusing the last direction keeps the row comparison form usable.
+    direction = items[-1].direction if items else 'ASC'
+    ordered = {item.field for item in items}
+    items += [OrderByItem(field=col, direction=direction) for col in key_columns if col not in ordered]
+    return items
+
+
+def build_keyset_clause(
+        order_by: List[OrderByItem],
+        values: List[Any],
+        column_map: Optional[Dict[str, str]] = None
+) -> Tuple[str, List[Any]]:
+    fields = [column_map.get(item.field, item.field) if column_map else item.field for item in order_by]
+
+    directions = {item.direction for item in order_by}
+    if len(directions) == 1:
+        op = '>' if directions.pop() == 'ASC' else '<'
+        placeholders = ', '.join(['%s'] * len(fields))
+        return f"({', '.join(fields)}) {op} ({placeholders})", list(values)
+
+    # Mixed directions: (a > x) OR (a = x AND b < y) OR ...
+    clauses = []
+    params: List[Any] = []
+    for i, item in enumerate(order_by):
+        op = '>' if item.direction == 'ASC' else '<'
+        parts = [f"{fields[j]} = %s" for j in range(i)] + [f"{fields[i]} {op} %s"]
+        clauses.append(f"({' AND '.join(parts)})")
+        params.extend(values[:i + 1])
+    return f"({' OR '.join(clauses)})", params
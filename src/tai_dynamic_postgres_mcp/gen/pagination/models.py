@@ -0,0 +1,18 @@
+from typing import Any, Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class ResultPage(BaseModel, Generic[T]):
+    rows: List[T]
+    truncated: bool = False  # True when more rows are available after this page
+    next_token: Optional[str] = None  # Pass back as `after` to fetch the next page
+
+
+class ColumnarResult(BaseModel):
+    columns: List[str]  # Column names, in the order of each row's values
+    rows: List[List[Any]]
+    truncated: bool = False  # True when more rows are available after this page
+    next_token: Optional[str] = None  # Pass back as `after` to fetch the next page
@@ -0,0 +1,140 @@
+import itertools
+from typing import Any, Dict, List, Literal, Optional, Type, Union
+
+from psycopg import sql
+from psycopg.rows import dict_row
+
+from tai_dynamic_postgres_mcp.config.settings import pg_settings
+from tai_dynamic_postgres_mcp.database.connection import get_read_connection
+from tai_dynamic_postgres_mcp.database.cost_guard import READ_HINT, cost_guard
+from tai_dynamic_postgres_mcp.database.helpers import NUMERIC_ARRAY_OID, NUMERIC_OID
+from tai_dynamic_postgres_mcp.gen.order.builder import build_order_by_clause
+from tai_dynamic_postgres_mcp.gen.order.models import OrderByItem
+from tai_dynamic_postgres_mcp.gen.pagination.builder import build_keyset_clause, keyset_order_by
+from tai_dynamic_postgres_mcp.gen.pagination.models import ColumnarResult, ResultPage
+from tai_dynamic_postgres_mcp.gen.pagination.tokens import decode_token, encode_token, query_fingerprint
+from tai_dynamic_postgres_mcp.gen.templates.results import load_columnar, load_rows, numeric_to_float
+
+_cursor_ids = itertools.count()
+
+
+def _row_sizes(cur) -> List[int]:
+    """Raw size on the wire of each row of the last fetched batch."""
+    res = cur.pgresult
+    if res is None:
+        return []
+    return [sum(res.get_length(row, col) for col in range(res.nfields)) for row in range(res.ntuples)]
+
+
+async def fetch_page(
+        query: sql.Composed,
+        where_clause: str,
+        where_params: List[Any],
+        order_by: Optional[List[OrderByItem]] = None,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        model: Optional[Type] = None,
+        column_map: Optional[Dict[str, str]] = None,
+        key_columns: Optional[List[str]] = None,
+        not_null_columns: Optional[List[str]] = None,
+        hidden_columns: Optional[List[str]] = None,
+        format: Literal["rows", "columnar"] = "rows",
+        statement_timeout: Optional[float] = None,
+) -> Union[ResultPage, ColumnarResult]:
+    """
+    Runs `query` through a server-side cursor and returns at most one page of rows.
+
+    Rows are fetched in batches of `stream_batch_size`; reading stops as soon as the page
+    holds `limit` rows or hits the `stream_max_rows` / `stream_max_bytes` budget, in which
+    case the page is marked as truncated and carries the token of the next page.
+
+    When the table has a key, the ordering is completed with it and the token holds the
+    sort key of the last row, so the next page starts with an index seek (keyset paging)
+    instead of re-scanning the rows already returned with OFFSET.
+
+    `hidden_columns` are fetched for the token only, and dropped from the returned rows.
+    """
+    page_order = keyset_order_by(order_by, key_columns, not_null_columns)
+    order_by_clause, order_params = build_order_by_clause(page_order or order_by, column_map=column_map)
+
+    fingerprint = query_fingerprint(query.as_string() + where_clause + order_by_clause, where_params + order_params)
+    state = decode_token(after, fingerprint) if after else {}
+    keyset = state.get("keyset")
+    offset = state.get("offset", 0)
+
+    clauses = [where_clause] if where_clause else []
+    params = where_params[:]
+    if keyset is not None and page_order:
+        keyset_clause, keyset_params = build_keyset_clause(page_order, keyset, column_map=column_map)
+        clauses.append(keyset_clause)
+        params.extend(keyset_params)
+
+    if clauses:
+        query += sql.SQL(" WHERE ") + sql.SQL(" AND ".join(f"({clause})" for clause in clauses))
+
+    if order_by_clause:
+        query += sql.SQL(order_by_clause)
+    params.extend(order_params)
+
+    max_rows = pg_settings.stream_max_rows if limit is None else min(limit, pg_settings.stream_max_rows)
+
+    # One extra row tells whether another page exists.
+    query += sql.SQL(" LIMIT %s")
+    params.append(max_rows + 1)
+    if offset:
+        query += sql.SQL(" OFFSET %s")
+        params.append(offset)
+
+    rows = []
+    size = 0
+    truncated = False
+    # Server-side cursors live inside a transaction: open one explicitly on the autocommit read connection.
+    async with get_read_connection(statement_timeout) as conn, conn.transaction():
+        async with conn.cursor(
+                f"tai_stream_{next(_cursor_ids)}", binary=pg_settings.binary_results, row_factory=dict_row
+        ) as cur:
+            if cost_guard.enabled:
+                # The page size caps the rows already, only the cost of reading them is checked
+                await cost_guard.check(
+                    conn, query.as_string(), params, READ_HINT, check_rows=False, limit=max_rows + 1
+                )
+            await cur.execute(query, params)
+            while not truncated:
+                batch = await cur.fetchmany(pg_settings.stream_batch_size)
+                if not batch:
+                    break
+                for row, row_size in zip(batch, _row_sizes(cur) or [0] * len(batch)):
+                    if len(rows) >= max_rows or (rows and size + row_size > pg_settings.stream_max_bytes):
+                        truncated = True
+                        break
+                    rows.append(row)
+                    size += row_size
+            columns = [column.name for column in cur.description]
+            numeric_columns = [
+                column.name for column in cur.description if column.type_code in (NUMERIC_OID, NUMERIC_ARRAY_OID)
+            ]
+
+    next_token = None
+    if truncated:
+        last_key = [rows[-1].get(item.field) for item in page_order] if rows and page_order else [None]
+        if all(value is not None for value in last_key):
+            next_token = encode_token(fingerprint, keyset=last_key)
+        else:
+            # NULL sort keys can't be compared, resume from the previous position instead.
+            next_token = encode_token(fingerprint, keyset=keyset, offset=offset + len(rows))
+
+    if hidden_columns:
+        columns = [column for column in columns if column not in hidden_columns]
+        numeric_columns = [column for column in numeric_columns if column not in hidden_columns]
+        for row in rows:
+            for column in hidden_columns:
+                del row[column]
+
+    # numeric is read as Decimal here, so a numeric sort key resumes at its exact value; the rows
+    # returned carry floats, like the other select results.
+    if numeric_columns:
+        numeric_to_float(rows, numeric_columns)
+
+    if format == "columnar":
+        return load_columnar(columns, [list(row.values()) for row in rows], truncated, next_token)
+    return ResultPage(rows=load_rows(rows, model), truncated=truncated, next_token=next_token)
@@ -0,0 +1,26 @@
+import base64
+import hashlib
+import json
+from typing import Any, Dict, List
+
+
+def query_fingerprint(query: str, params: List[Any]) -> str:
+    payload = json.dumps([query, params], default=str, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def encode_token(fingerprint: str, **state: Any) -> str:
+    payload = json.dumps({"q": fingerprint, **state}, default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_token(token: str, fingerprint: str) -> Dict[str, Any]:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError("Invalid continuation token") from e
+
+    if not isinstance(state, dict) or state.pop("q", None) != fingerprint:
+        raise ValueError("Continuation token does not belong to this query")
+    return state
@@ -0,0 +1,210 @@
+import asyncio
+import logging
+from contextlib import suppress
+from typing import Callable, Iterable, List, Optional, Set
+
+from fastmcp.exceptions import NotFoundError
+from psycopg import Error, sql
+
+from tai_dynamic_postgres_mcp.core.app import mcp_app
+from tai_dynamic_postgres_mcp.database.connection import drain_connection_pools, get_async_connection
+from tai_dynamic_postgres_mcp.database.cost_guard import cost_guard
+from tai_dynamic_postgres_mcp.database.listener import listen
+from tai_dynamic_postgres_mcp.database.result_cache import result_cache
+from tai_dynamic_postgres_mcp.database.statement_cache import statement_cache
+from tai_dynamic_postgres_mcp.gen.builders.base_gen import BaseGen
+from tai_dynamic_postgres_mcp.gen.builders.select_joined_gen import SelectJoinedGen
+from tai_dynamic_postgres_mcp.gen.lazy.registry import LazyToolRegistry
+from tai_dynamic_postgres_mcp.gen.schema.introspect import introspect_schema
+from tai_dynamic_postgres_mcp.gen.schema.schema_parser import ParsedSchema
+
+logger = logging.getLogger(__name__)
+
+# Payload asking for every table to be reloaded, when the changed table can't be known.
+ALL_TABLES = "*"
+
+# Notifies the schema-qualified name of every table touched by a DDL command (including the table
+# of a created or altered index). A dropped index no longer tells its table, so it reloads everything.
+_TRIGGER_FUNCTION_SQL = """
+                        CREATE OR REPLACE FUNCTION tai_notify_schema_change() RETURNS event_trigger
+                            LANGUAGE plpgsql AS
+                        $$
+                        DECLARE
+                            obj record;
+                            tbl text;
+                        BEGIN
+                            IF TG_EVENT = 'sql_drop' THEN
+                                FOR obj IN SELECT * FROM pg_event_trigger_dropped_objects()
+                                    LOOP
+                                        IF obj.object_type = 'table' THEN
+                                            PERFORM pg_notify({channel}, obj.schema_name || '.' || obj.object_name);
+                                        ELSIF obj.object_type = 'index' AND obj.original THEN
+                                            PERFORM pg_notify({channel}, {all_tables});
+                                        END IF;
+                                    END LOOP;
+                            ELSE
+                                FOR obj IN SELECT * FROM pg_event_trigger_ddl_commands() WHERE classid = 'pg_class'::regclass
+                                    LOOP
+                                        SELECT n.nspname || '.' || c.relname
+                                        INTO tbl
+                                        FROM pg_class c
+                                                 JOIN pg_namespace n ON n.oid = c.relnamespace
+                                        WHERE c.relkind = 'r'
+                                          AND c.oid = coalesce(
+                                                (SELECT i.indrelid FROM pg_index i WHERE i.indexrelid = obj.objid),
+                                                obj.objid);
+                                        IF tbl IS NOT NULL THEN
+                                            PERFORM pg_notify({channel}, tbl);
+                                        END IF;
+                                    END LOOP;
+                            END IF;
+                        END
+                        $$; \
+                        """
+
+_EVENT_TRIGGERS = {
+    "tai_schema_changed": "ddl_command_end",
+    "tai_schema_dropped": "sql_drop",
+}
+
+
+async def install_event_trigger(channel: str):
+    """Creates (or replaces) the event triggers publishing DDL changes. Requires superuser privileges."""
+    async with get_async_connection() as conn:
+        async with conn.transaction():
+            await conn.execute(
+                sql.SQL(_TRIGGER_FUNCTION_SQL).format(channel=sql.Literal(channel), all_tables=sql.Literal(ALL_TABLES))
+            )
+            for name, event in _EVENT_TRIGGERS.items():
+                await conn.execute(sql.SQL("DROP EVENT TRIGGER IF EXISTS {}").format(sql.Identifier(name)))
+                await conn.execute(
+                    sql.SQL("CREATE EVENT TRIGGER {name} ON {event} EXECUTE FUNCTION tai_notify_schema_change()").format(
+                        name=sql.Identifier(name), event=sql.SQL(event)
+                    )
+                )
+
+
+def _statement_uses(key, tables: Set[str]) -> bool:
+    # The second item of a statement key is the table, or the FROM clause of a joined select.
+    return isinstance(key[1], str) and any(table in key[1].split() for table in tables)
+
+
+class SchemaWatcher:
+    """
+    Listens for the DDL notifications and regenerates the tools of the changed tables in the running app.
+
+    Notifications are collected for `delay` seconds, so a migration made of many statements triggers a
+    single reload. Tools are replaced without any await in between: a call already running keeps its
+    function and completes normally, new calls get the new tool.
+    """
+
+    def __init__(
+            self,
+            generators: List[BaseGen],
+            channel: str,
+            delay: float = 1.0,
+            lazy_registry: Optional[LazyToolRegistry] = None,
+    ) -> None:
+        self.generators = generators
+        self.lazy_registry = lazy_registry
+        self.channel = channel
+        self.delay = delay
+        self.reloads = 0
+        self._pending: Set[str] = set()
+        self._reload_task: Optional[asyncio.Task] = None
+        self._listen_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    async def start(self):
+        try:
+            await install_event_trigger(self.channel)
+        except Error as e:
+            logger.warning(
+                f"Could not install the schema change event triggers ({e}). "
+                f"Tools are reloaded only if they're installed by a superuser."
+            )
+        self._listen_task = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        for task in (self._listen_task, self._reload_task):
+            if task:
+                task.cancel()
+                # Let it unwind, e.g. close its listening connection, before the pools close
+                with suppress(asyncio.CancelledError):
+                    await task
+        self._listen_task = self._reload_task = None
+
+    async def _listen(self):
+        # Changes made while disconnected were not notified
+        await listen(self.channel, self._schedule, lambda: self._schedule(ALL_TABLES))
+
+    def _schedule(self, table: str):
+        self._pending.add(table)
+        if self._reload_task is None or self._reload_task.done():
+            self._reload_task = asyncio.create_task(self._reload_later())
+
+    async def _reload_later(self):
+        await asyncio.sleep(self.delay)
+        async with self._lock:
+            tables, self._pending = self._pending, set()
+            try:
+                await self.reload(tables)
+            except Exception as e:
+                logger.error(f"Failed to reload the tools of {', '.join(sorted(tables))}: {e}")
+        if self._pending:
+            self._reload_task = asyncio.create_task(self._reload_later())
+
+    async def reload(self, tables: Iterable[str]):
+        schema = await introspect_schema()
+        tables = set(tables)
+        if ALL_TABLES in tables:
+            # Tables known before the change too, to remove the tools of the dropped ones
+            tables = set(schema.tables) | {table for gen in self.generators if gen.schema for table in gen.schema.tables}
+            if self.lazy_registry:
+                tables |= set(self.lazy_registry.tables())
+
+        for gen in self.generators:
+            if isinstance(gen, SelectJoinedGen):
+                self._reload_joined(gen, schema, tables)
+            else:
+                self._reload_tables(gen, schema, tables)
+        if self.lazy_registry:
+            # The generic tools stay, the changed tables are compiled again on their next call
+            self.lazy_registry.set_schema(schema, tables)
+
+        evicted = statement_cache.evict(lambda key: _statement_uses(key, tables))
+        # Plan estimates are keyed on SQL text, too costly to match against the changed tables
+        cost_guard.clear()
+        result_cache.invalidate(tables)
+        if evicted:
+            # Pooled connections may hold prepared statements of the old table definitions
+            await drain_connection_pools()
+
+        self.reloads += 1
+        logger.info(f"Reloaded the tools of {', '.join(sorted(tables))} ({evicted} cached statements evicted)")
+
+    def _register(self, name: str, tool: Optional[Callable]):
+        try:
+            mcp_app.remove_tool(name)
+        except NotFoundError:
+            pass
+        if tool:
+            mcp_app.tool(tool)
+
+    def _reload_tables(self, gen: BaseGen, schema: ParsedSchema, tables: Set[str]):
+        gen.schema = schema
+        for table in tables:
+            tool = gen.build_tool(table, schema.tables[table]) if table in schema.tables else None
+            self._register(gen.func_name(table), tool)
+
+    def _reload_joined(self, gen: SelectJoinedGen, schema: ParsedSchema, tables: Set[str]):
+        gen.schema = schema
+        for group in gen.join_groups:
+            if not tables.intersection(group):
+                continue
+            tool = None
+            try:
+                tool = gen.build_join_tool(group, schema.tables, schema.fks)
+            except ValueError as e:
+                logger.warning(f"Removing the joined select of {', '.join(group)}: {e}")
+            self._register(gen.func_name(gen.group_name(group)), tool)
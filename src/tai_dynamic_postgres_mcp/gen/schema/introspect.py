@@ -1,74 +1,102 @@
-from collections import defaultdict
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
-from tai_dynamic_postgres_mcp.database.connection import cursor
+from tai_dynamic_postgres_mcp.database.connection import read_cursor
+from tai_dynamic_postgres_mcp.gen.schema.schema_parser import ParsedSchema, sql_type_to_python_type
 
-_DDL_RAW_QUERY = """
-                 SELECT n.nspname AS schema, 
-                    c.relname AS table, 
-                    a.attname AS column, 
-                    pg_catalog.format_type(a.atttypid, a.atttypmod) AS type,
-                    a.attnotnull AS notnull
+# Everything is read from pg_catalog: the information_schema views re-check privileges row by row
+# and get very slow on databases with thousands of tables.
+_COLUMNS_QUERY = """
+                 SELECT n.nspname AS schema,
+                        c.relname AS table,
+                        a.attname AS column,
+                        pg_catalog.format_type(a.atttypid, a.atttypmod) AS type,
+                        a.attnotnull AS notnull,
+                        pg_catalog.pg_get_expr(d.adbin, d.adrelid) AS default
                  FROM pg_class c
-                     JOIN pg_namespace n
-                 ON n.oid = c.relnamespace
-                     JOIN pg_attribute a ON a.attrelid = c.oid
+                          JOIN pg_namespace n ON n.oid = c.relnamespace
+                          JOIN pg_attribute a ON a.attrelid = c.oid
+                          LEFT JOIN pg_attrdef d ON d.adrelid = c.oid AND d.adnum = a.attnum
                  WHERE c.relkind = 'r'
-                   AND a.attnum
-                     > 0
+                   AND a.attnum > 0
                    AND NOT a.attisdropped
-                   AND n.nspname NOT IN ('pg_catalog'
-                     , 'information_schema')
+                   AND n.nspname NOT IN ('pg_catalog', 'information_schema')
                  ORDER BY n.nspname, c.relname, a.attnum; \
                  """
 
+# One row per column pair of each foreign key, in the key's column order.
 _FK_QUERY = """
-            SELECT tc.table_schema,
-                   tc.table_name,
-                   kcu.column_name,
-                   ccu.table_schema AS ref_table_schema,
-                   ccu.table_name   AS ref_table_name,
-                   ccu.column_name  AS ref_column_name,
-                   rc.update_rule,
-                   rc.delete_rule
-            FROM information_schema.table_constraints AS tc
-                     JOIN information_schema.key_column_usage AS kcu
-                          ON tc.constraint_name = kcu.constraint_name
-                              AND tc.table_schema = kcu.table_schema
-                     JOIN information_schema.constraint_column_usage AS ccu
-                          ON ccu.constraint_name = tc.constraint_name
-                     JOIN information_schema.referential_constraints AS rc
-                          ON rc.constraint_name = tc.constraint_name
-                              AND rc.constraint_schema = tc.table_schema
-            WHERE tc.constraint_type = 'FOREIGN KEY'; \
+            SELECT n.nspname AS schema,
+                   c.relname AS table,
+                   a.attname AS column,
+                   rn.nspname AS ref_schema,
+                   rc.relname AS ref_table,
+                   ra.attname AS ref_column
+            FROM pg_constraint con
+                     JOIN pg_class c ON c.oid = con.conrelid
+                     JOIN pg_namespace n ON n.oid = c.relnamespace
+                     JOIN pg_class rc ON rc.oid = con.confrelid
+                     JOIN pg_namespace rn ON rn.oid = rc.relnamespace
+                     CROSS JOIN LATERAL unnest(con.conkey, con.confkey) WITH ORDINALITY AS k(attnum, ref_attnum, ord)
+                     JOIN pg_attribute a ON a.attrelid = con.conrelid AND a.attnum = k.attnum
+                     JOIN pg_attribute ra ON ra.attrelid = con.confrelid AND ra.attnum = k.ref_attnum
+            WHERE con.contype = 'f'
+              AND c.relkind = 'r'
+              AND n.nspname NOT IN ('pg_catalog', 'information_schema')
+            ORDER BY n.nspname, c.relname, con.conname, k.ord; \
             """
 
+# Primary keys, unique constraints and unique indexes: everything ON CONFLICT (cols) can infer.
+# Partial and expression indexes can't be targeted by plain column lists, so they are left out.
+_UNIQUE_QUERY = """
+                SELECT n.nspname AS schema,
+                       c.relname AS table,
+                       i.indisprimary AS is_primary,
+                       array_agg(a.attname ORDER BY k.ord) AS columns
+                FROM pg_index i
+                         JOIN pg_class c ON c.oid = i.indrelid
+                         JOIN pg_namespace n ON n.oid = c.relnamespace
+                         CROSS JOIN LATERAL unnest(i.indkey::int2[]) WITH ORDINALITY AS k(attnum, ord)
+                         JOIN pg_attribute a ON a.attrelid = c.oid AND a.attnum = k.attnum
+                WHERE i.indisunique
+                  AND i.indpred IS NULL
+                  AND i.indexprs IS NULL
+                  AND k.ord <= i.indnkeyatts
+                  AND c.relkind = 'r'
+                  AND n.nspname NOT IN ('pg_catalog', 'information_schema')
+                GROUP BY n.nspname, c.relname, i.indexrelid, i.indisprimary
+                ORDER BY n.nspname, c.relname, i.indisprimary DESC, i.indexrelid; \
+                """
 
-async def generate_schema_ddl() -> str:
-    tables: Dict[str, List[str]] = defaultdict(list)
 
-    async with cursor() as cur:
-        await cur.execute(_DDL_RAW_QUERY)
-        rows = await cur.fetchall()
+async def introspect_schema() -> ParsedSchema:
+    """Reads tables, columns, keys and defaults from pg_catalog, in the structure every generator shares."""
+    tables: Dict[str, List[Tuple[str, str]]] = {}
+    fks: List[Tuple[str, str, str, str]] = []
+    pks: Dict[str, List[str]] = {}
+    types: Dict[str, Dict[str, str]] = {}
+    uniques: Dict[str, List[List[str]]] = {}
+    defaults: Dict[str, Dict[str, str]] = {}
 
-        for schema, table, column, col_type, notnull in rows:
-            nullability = "NOT NULL" if notnull else "NULL"
-            tables[f"{schema}.{table}"].append(f"    {column} {col_type} {nullability}")
+    # A lagging replica could miss the latest DDL.
+    async with read_cursor(primary=True) as cur:
+        await cur.execute(_COLUMNS_QUERY)
+        for schema, table, column, col_type, notnull, default in await cur.fetchall():
+            full_table_name = f"{schema}.{table}"
+            tables.setdefault(full_table_name, []).append((column, sql_type_to_python_type(col_type, not notnull)))
+            types.setdefault(full_table_name, {})[column] = col_type
+            table_defaults = defaults.setdefault(full_table_name, {})
+            if default is not None:
+                table_defaults[column] = default
 
         await cur.execute(_FK_QUERY)
-        fk_rows = await cur.fetchall()
+        for schema, table, column, ref_schema, ref_table, ref_column in await cur.fetchall():
+            fks.append((f"{schema}.{table}", column, f"{ref_schema}.{ref_table}", ref_column))
 
-        for tc_schema, tc_table, kcu_column, ref_schema, ref_table, ref_column, update_rule, delete_rule in fk_rows:
-            fk_line = f"    FOREIGN KEY ({kcu_column}) REFERENCES {ref_schema}.{ref_table} ({ref_column})"
-            if update_rule != 'NO ACTION':
-                fk_line += f" ON UPDATE {update_rule}"
-            if delete_rule != 'NO ACTION':
-                fk_line += f" ON DELETE {delete_rule}"
-            tables[f"{tc_schema}.{tc_table}"].append(fk_line)
+        await cur.execute(_UNIQUE_QUERY)
+        for schema, table, is_primary, columns in await cur.fetchall():
+            if is_primary:
+                pks[f"{schema}.{table}"] = columns
+            else:
+                uniques.setdefault(f"{schema}.{table}", []).append(columns)
 
-    ddl_statements = [
-        f"CREATE TABLE {table} (\n" + ",\n".join(columns) + "\n);"
-        for table, columns in tables.items()
-    ]
-
-    return "\n\n".join(ddl_statements)
+    return ParsedSchema(tables, fks, pks, types, uniques, defaults)
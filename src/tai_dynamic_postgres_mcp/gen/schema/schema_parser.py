@@ -1,5 +1,8 @@
 import re
-from typing import Dict, List, Tuple, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple, Optional, NamedTuple, Union, Type
+
+from pydantic import BaseModel, create_model
 
 CONSTRAINT_KEYWORDS = {
     'NOT', 'NULL',  # NOT NULL, NULL
@@ -101,9 +104,22 @@ def sql_type_to_python_type(sql_type: str, nullable: bool) -> str:
     return f'Optional[{py_type}]' if nullable else py_type
 
 
-def parse_schema(schema: str) -> Tuple[Dict[str, List[Tuple[str, str]]], List[Tuple[str, str, str, str]]]:
+class ParsedSchema(NamedTuple):
+    tables: Dict[str, List[Tuple[str, str]]]  # table -> [(col, python type)]
+    fks: List[Tuple[str, str, str, str]]  # (table, col, ref_table, ref_col)
+    pks: Dict[str, List[str]]  # table -> primary key columns
+    types: Dict[str, Dict[str, str]]  # table -> {col: sql type}
+    uniques: Dict[str, List[List[str]]]  # table -> columns of each unique key other than the primary key
+    defaults: Dict[str, Dict[str, str]]  # table -> {col: default expression}, for columns with a default
+
+
+def parse_schema(schema: str) -> ParsedSchema:
     tables: Dict[str, List[Tuple[str, str]]] = {}
     fks: List[Tuple[str, str, str, str]] = []  # (table, col, ref_table, ref_col)
+    pks: Dict[str, List[str]] = {}
+    types: Dict[str, Dict[str, str]] = {}
+    uniques: Dict[str, List[List[str]]] = {}
+    defaults: Dict[str, Dict[str, str]] = {}
     current_table: Optional[str] = None
 
     lines = schema.splitlines()
@@ -118,6 +134,8 @@ def parse_schema(schema: str) -> Tuple[Dict[str, List[Tuple[str, str]]], List[Tu
             full_table_name = f"{schema_name}.{table_name}"
             current_table = full_table_name
             tables[current_table] = []
+            types[current_table] = {}
+            defaults[current_table] = {}
             # Skip to the opening parenthesis if on next line
             i += 1
             continue
@@ -146,8 +164,23 @@ def parse_schema(schema: str) -> Tuple[Dict[str, List[Tuple[str, str]]], List[Tu
                 i += 1
                 continue
 
-            if line.upper().startswith('UNIQUE') or line.upper().startswith('PRIMARY KEY') or line.upper().startswith(
-                    'CHECK'):
+            if line.upper().startswith('PRIMARY KEY'):
+                pk_match = re.match(r'PRIMARY\s+KEY\s*\((.*?)\)', line, re.IGNORECASE)
+                if pk_match:
+                    pks[current_table] = [col.strip() for col in pk_match.group(1).split(',')]
+                i += 1
+                continue
+
+            if line.upper().startswith('UNIQUE'):
+                unique_match = re.match(r'UNIQUE\s*\((.*?)\)', line, re.IGNORECASE)
+                if unique_match:
+                    uniques.setdefault(current_table, []).append(
+                        [col.strip() for col in unique_match.group(1).split(',')]
+                    )
+                i += 1
+                continue
+
+            if line.upper().startswith('CHECK'):
                 # Skip table constraints that are not FK
                 i += 1
                 continue
@@ -168,8 +201,17 @@ def parse_schema(schema: str) -> Tuple[Dict[str, List[Tuple[str, str]]], List[Tu
             nullable = 'NOT NULL' not in constraints.upper()
             if 'PRIMARY KEY' in constraints.upper():
                 nullable = False
+                pks.setdefault(current_table, []).append(col_name)
+            elif 'UNIQUE' in constraints.upper():
+                uniques.setdefault(current_table, []).append([col_name])
             py_type = sql_type_to_python_type(col_type, nullable)
             tables[current_table].append((col_name, py_type))
+            types[current_table][col_name] = col_type
+
+            default_match = re.search(r'DEFAULT\s+(.+?)(?:\s+(?:NOT\s+NULL|NULL|PRIMARY|UNIQUE|REFERENCES|CHECK|'
+                                      r'CONSTRAINT|GENERATED|COLLATE)\b|$)', constraints, re.IGNORECASE)
+            if default_match:
+                defaults[current_table][col_name] = default_match.group(1)
 
             # Handle inline FOREIGN KEY (REFERENCES in constraints)
             fk_inline_match = re.search(r'REFERENCES\s*(?:(\w+)\.)?(\w+)\s*\((\w+)\)\s*(?:.*)', constraints,
@@ -183,12 +225,21 @@ def parse_schema(schema: str) -> Tuple[Dict[str, List[Tuple[str, str]]], List[Tu
 
         i += 1
 
-    return tables, fks
+    return ParsedSchema(tables, fks, pks, types, uniques, defaults)
 
 
-def sql_columns_to_pydantic_model(prefix: str, table: str, columns: List[Tuple[str, str]]) -> tuple[str, str]:
+def as_parsed_schema(schema: Union[ParsedSchema, str]) -> ParsedSchema:
+    """Accepts an introspected schema as is, or parses it from `CREATE TABLE` statements."""
+    return schema if isinstance(schema, ParsedSchema) else parse_schema(schema)
+
+
+def model_name_of(prefix: str, table: str) -> str:
     name = f"{prefix}_{table}_row"
-    model_name = ''.join(word.capitalize() for word in name.replace('.', '_').split('_'))
+    return ''.join(word.capitalize() for word in name.replace('.', '_').split('_'))
+
+
+def sql_columns_to_pydantic_model(prefix: str, table: str, columns: List[Tuple[str, str]]) -> tuple[str, str]:
+    model_name = model_name_of(prefix, table)
 
     def format_field(col: str, typ: str) -> str:
         default = " = None" if "Optional[" in typ or "None" in typ else ""
@@ -202,3 +253,55 @@ class {model_name}(BaseModel):
 '''
 
     return model_name, model_code
+
+
+# Names used by the Python type expressions of SQL_TO_PYTHON, and the generics wrapping them
+_TYPE_NAMES = {
+    'Any': Any, 'bool': bool, 'bytes': bytes, 'dict': dict, 'float': float, 'int': int, 'list': list, 'str': str,
+    'None': type(None),
+}
+_GENERIC_TYPES = {
+    'List': lambda args: List[args[0]],
+    'Optional': lambda args: Optional[args[0]],
+    'Union': lambda args: Union[tuple(args)],
+}
+_TYPE_TOKEN = re.compile(r'\s*(\w+|[\[\],])')
+
+
+@lru_cache(maxsize=None)
+def python_type_of(typ: str) -> Any:
+    """The typing object of a type expression made by `sql_type_to_python_type`, e.g. `Optional[List[int]]`."""
+    tokens = _TYPE_TOKEN.findall(typ)
+    if ''.join(tokens) != re.sub(r'\s', '', typ):
+        raise ValueError(f"Unsupported column type: {typ}")
+
+    def parse(pos: int) -> Tuple[Any, int]:
+        name = tokens[pos] if pos < len(tokens) else ''
+        if pos + 1 < len(tokens) and tokens[pos + 1] == '[':
+            if name not in _GENERIC_TYPES:
+                raise ValueError(f"Unsupported column type: {typ}")
+            args = []
+            pos += 1
+            while pos < len(tokens) and tokens[pos] in ('[', ','):
+                arg, pos = parse(pos + 1)
+                args.append(arg)
+            if pos >= len(tokens) or tokens[pos] != ']':
+                raise ValueError(f"Unsupported column type: {typ}")
+            return _GENERIC_TYPES[name](args), pos + 1
+        if name not in _TYPE_NAMES:
+            raise ValueError(f"Unsupported column type: {typ}")
+        return _TYPE_NAMES[name], pos + 1
+
+    result, end = parse(0)
+    if end != len(tokens):
+        raise ValueError(f"Unsupported column type: {typ}")
+    return result
+
+
+def sql_columns_to_pydantic_class(prefix: str, table: str, columns: List[Tuple[str, str]]) -> Type[BaseModel]:
+    """Same model as `sql_columns_to_pydantic_model`, built in memory instead of as source code."""
+    fields = {
+        col: (python_type_of(typ), None if "Optional[" in typ or "None" in typ else ...)
+        for col, typ in columns
+    }
+    return create_model(model_name_of(prefix, table), **fields)
@@ -0,0 +1,86 @@
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from tai_dynamic_postgres_mcp.database.connection import read_cursor
+from tai_dynamic_postgres_mcp.gen.schema.schema_parser import ParsedSchema
+
+logger = logging.getLogger(__name__)
+
+# Any DDL touching the introspected tables rewrites their catalog rows, which changes the rows' xmin.
+# Statistics updates (VACUUM, ANALYZE) are done in place and keep it. Tuple freezing does change it,
+# which only costs a spurious regeneration.
+_FINGERPRINT_QUERY = """
+                     WITH tables AS (SELECT c.oid
+                                     FROM pg_class c
+                                              JOIN pg_namespace n ON n.oid = c.relnamespace
+                                     WHERE c.relkind = 'r'
+                                       AND n.nspname NOT IN ('pg_catalog', 'information_schema'))
+                     SELECT md5(coalesce(string_agg(version, ',' ORDER BY version), ''))
+                     FROM (SELECT 'c' || c.oid || ':' || c.xmin AS version
+                           FROM pg_class c
+                                    JOIN tables t ON t.oid = c.oid
+                           UNION ALL
+                           SELECT 'a' || a.attrelid || '.' || a.attnum || ':' || a.xmin
+                           FROM pg_attribute a
+                                    JOIN tables t ON t.oid = a.attrelid
+                           WHERE a.attnum > 0
+                           UNION ALL
+                           SELECT 'd' || d.oid || ':' || d.xmin
+                           FROM pg_attrdef d
+                                    JOIN tables t ON t.oid = d.adrelid
+                           UNION ALL
+                           SELECT 'k' || con.oid || ':' || con.xmin
+                           FROM pg_constraint con
+                                    JOIN tables t ON t.oid = con.conrelid
+                           UNION ALL
+                           SELECT 'i' || i.indexrelid || ':' || i.xmin
+                           FROM pg_index i
+                                    JOIN tables t ON t.oid = i.indrelid) AS versions; \
+                     """
+
+
+async def schema_fingerprint(options: Dict[str, Any]) -> str:
+    """
+    Cheap digest of the schema: the catalog row versions of the introspected tables, plus the
+    generator `options`, since the generated code depends on them too.
+    """
+    async with read_cursor(primary=True) as cur:
+        await cur.execute(_FINGERPRINT_QUERY)
+        (catalog_digest,) = await cur.fetchone()
+
+    payload = json.dumps([catalog_digest, options], sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def load_snapshot(path: Path) -> Optional[Tuple[str, ParsedSchema]]:
+    """Returns the fingerprint and schema saved at `path`, or None when missing or unreadable."""
+    try:
+        data = json.loads(path.read_text())
+        schema = data["schema"]
+        return data["fingerprint"], ParsedSchema(
+            tables={table: [tuple(column) for column in columns] for table, columns in schema["tables"].items()},
+            fks=[tuple(fk) for fk in schema["fks"]],
+            pks=schema["pks"],
+            types=schema["types"],
+            uniques=schema["uniques"],
+            defaults=schema["defaults"],
+        )
+    except FileNotFoundError:
+        return None
+    except (ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Ignoring invalid schema snapshot {path}: {e}")
+        return None
+
+
+def save_snapshot(path: Path, fingerprint: str, schema: ParsedSchema):
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        tmp_path.write_text(json.dumps({"fingerprint": fingerprint, "schema": schema._asdict()}))
+        # Atomic, a concurrent start never reads half a snapshot
+        tmp_path.replace(path)
+    except OSError as e:
+        # Only the next start gets slower, e.g. when installed in a read-only location
+        logger.warning(f"Could not save the schema snapshot {path}: {e}")
@@ -0,0 +1,153 @@
+from typing import Any, Callable, List, Optional
+
+from psycopg.rows import dict_row
+from pydantic import BaseModel
+
+from tai_dynamic_postgres_mcp.config.settings import pg_settings
+from tai_dynamic_postgres_mcp.database.connection import read_cursor
+from tai_dynamic_postgres_mcp.gen.builders.base_gen import BaseGen, runtime_tool
+
+# The planner's own estimate: the row density of the last ANALYZE applied to the current size of the table,
+# so it follows the table's growth without any scan. NULL when the table was never analyzed.
+_TABLE_STATS_QUERY = """
+                     SELECT CASE
+                                WHEN c.reltuples < 0 THEN NULL
+                                WHEN c.relpages = 0 THEN c.reltuples
+                                ELSE c.reltuples / c.relpages
+                                    * (pg_relation_size(c.oid) / current_setting('block_size')::int)
+                                END::bigint AS row_estimate,
+                            pg_relation_size(c.oid) AS table_bytes,
+                            pg_total_relation_size(c.oid) AS total_bytes,
+                            s.n_live_tup AS live_rows,
+                            s.n_dead_tup AS dead_rows,
+                            greatest(s.last_analyze, s.last_autoanalyze)::text AS last_analyzed
+                     FROM pg_class c
+                              JOIN pg_namespace n ON n.oid = c.relnamespace
+                              LEFT JOIN pg_stat_all_tables s ON s.relid = c.oid
+                     WHERE n.nspname = %s
+                       AND c.relname = %s; \
+                     """
+
+# Values of any type are returned as text. Partitioned and inheritance parents have a second row
+# covering their children, which is the one describing what a select on them reads.
+_COLUMN_STATS_QUERY = """
+                      SELECT DISTINCT ON (attname) attname AS column,
+                                                   null_frac,
+                                                   avg_width,
+                                                   n_distinct,
+                                                   most_common_vals::text::text[] AS most_common_values,
+                                                   most_common_freqs,
+                                                   histogram_bounds::text::text[] AS histogram_bounds,
+                                                   correlation
+                      FROM pg_stats
+                      WHERE schemaname = %s
+                        AND tablename = %s
+                        AND attname = ANY (%s)
+                      ORDER BY attname, inherited DESC; \
+                      """
+
+
+class ColumnStats(BaseModel):
+    column: str
+    null_frac: float  # Fraction of NULL values
+    avg_width: int  # Average width in bytes
+    n_distinct: float  # As reported by Postgres: a count, or minus the fraction of rows when negative
+    distinct_estimate: Optional[float] = None  # n_distinct as a count of distinct values
+    most_common_values: Optional[List[str]] = None
+    most_common_freqs: Optional[List[float]] = None  # Fraction of rows of each most common value
+    histogram_bounds: Optional[List[str]] = None  # Bounds of equal-population buckets of the other values
+    correlation: Optional[float] = None  # Physical vs logical order, from -1 to 1
+
+
+class TableStats(BaseModel):
+    table: str
+    row_estimate: Optional[int] = None  # None when the table was never analyzed
+    table_bytes: int
+    total_bytes: int  # Including indexes and TOAST
+    live_rows: Optional[int] = None
+    dead_rows: Optional[int] = None
+    last_analyzed: Optional[str] = None
+    columns: List[ColumnStats]
+
+
+def _sample(values: Optional[List[Any]], size: int) -> Optional[List[Any]]:
+    # Evenly spaced values, keeping the first and the last one, so histogram bounds still span the whole range
+    if values is None or len(values) <= size:
+        return values
+    if size < 2:
+        return values[:size]
+    step = (len(values) - 1) / (size - 1)
+    return [values[round(i * step)] for i in range(size)]
+
+
+async def fetch_table_stats(table: str, columns: List[str], max_values: int = 20) -> TableStats:
+    """Reads the statistics the planner keeps on `table` and its `columns`: nothing is scanned."""
+    schema_name, table_name = table.split('.', 1)
+    async with read_cursor(row_factory=dict_row, statement_timeout=pg_settings.select_statement_timeout) as cur:
+        await cur.execute(_TABLE_STATS_QUERY, (schema_name, table_name))
+        table_row = await cur.fetchone()
+        if table_row is None:
+            raise ValueError(f"Unknown table {table}")
+
+        await cur.execute(_COLUMN_STATS_QUERY, (schema_name, table_name, columns))
+        column_rows = {row["column"]: row for row in await cur.fetchall()}
+
+    row_estimate = table_row["row_estimate"]
+    column_stats = []
+    for col in columns:
+        row = column_rows.get(col)
+        if row is None:
+            continue  # Not analyzed yet
+        n_distinct = row["n_distinct"]
+        distinct_estimate = n_distinct
+        if n_distinct < 0:
+            distinct_estimate = -n_distinct * row_estimate if row_estimate is not None else None
+        # Most common values come first, the most frequent ones
+        column_stats.append(ColumnStats(**{
+            **row,
+            "distinct_estimate": distinct_estimate,
+            "most_common_values": row["most_common_values"] and row["most_common_values"][:max_values],
+            "most_common_freqs": row["most_common_freqs"] and row["most_common_freqs"][:max_values],
+            "histogram_bounds": _sample(row["histogram_bounds"], max_values),
+        }))
+
+    return TableStats(table=table, columns=column_stats, **table_row)
+
+
+_TOOL_DOC = '''
+    Returns the statistics Postgres keeps on a table, without scanning it: an estimated row count, its size on
+    disk and, per column, the fraction of NULLs, the number of distinct values, the most common values with their
+    frequencies and histogram bounds. Use it to size a table and plan filters and limits before selecting from it.
+    Estimates are as recent as the table's last ANALYZE.
+
+    Parameters:
+        table: Schema-qualified table name, e.g. "public.users".
+        columns: Optional columns to describe, all of them by default.
+        max_values: Maximum number of most common values and of histogram bounds returned per column.
+
+    Returns:
+        A `TableStats` object.
+    '''
+
+
+def build_table_stats_tool(gen: BaseGen) -> Callable:
+    """
+    The `table_stats` tool, exposing the tables and columns `gen` generates tools for: columns ignored
+    by the select tools stay hidden, their most common values included. Follows `gen.schema` on reloads.
+    """
+
+    async def tool(table, columns=None, max_values=20):
+        if not gen.schema or table not in gen.schema.tables:
+            raise ValueError(f"Unknown table {table}")
+        visible = [col for col, _ in gen.schema.tables[table] if col not in gen.ignore_columns]
+        unknown = set(columns or []) - set(visible)
+        if unknown:
+            raise ValueError(f"Unknown columns {', '.join(sorted(unknown))} of {table}")
+        return await fetch_table_stats(table, columns or visible, max_values)
+
+    return runtime_tool(tool, "table_stats", _TOOL_DOC, {
+        "table": str,
+        "columns": Optional[List[str]],
+        "max_values": int,
+        "return": TableStats,
+    })
@@ -0,0 +1,87 @@
+from typing import Any, Dict, List, Optional
+
+from psycopg import sql
+from psycopg.rows import dict_row
+
+from tai_dynamic_postgres_mcp.config.settings import pg_settings
+from tai_dynamic_postgres_mcp.database.connection import read_cursor
+from tai_dynamic_postgres_mcp.database.cost_guard import AGGREGATE_HINT, cost_guard
+from tai_dynamic_postgres_mcp.database.statement_cache import prepare_flag, statement_cache
+from tai_dynamic_postgres_mcp.gen.aggregate.builder import build_result_map, filter_fields
+from tai_dynamic_postgres_mcp.gen.aggregate.models import AggregateItem
+from tai_dynamic_postgres_mcp.gen.filters.builder import build_where_clause
+from tai_dynamic_postgres_mcp.gen.filters.models import WhereFilter
+from tai_dynamic_postgres_mcp.gen.order.builder import build_order_by_clause
+from tai_dynamic_postgres_mcp.gen.order.models import OrderByItem
+
+_AGGREGATE_SQL_TEMPLATE = "SELECT {columns} FROM {table}"
+
+
+async def aggregate_tmpl(
+        table: str,
+        aggregates: Optional[List[AggregateItem]] = None,
+        where: Optional[WhereFilter] = None,
+        group_by: Optional[List[str]] = None,
+        having: Optional[WhereFilter] = None,
+        order_by: Optional[List[OrderByItem]] = None,
+        limit: Optional[int] = None,
+        column_types: Optional[Dict[str, str]] = None,
+) -> List[Dict[str, Any]]:
+    aggregates = aggregates or [AggregateItem(func='count')]
+    group_by = list(dict.fromkeys(group_by or []))
+
+    unknown = {item.field for item in aggregates if item.field} - set(column_types or {})
+    if unknown:
+        raise ValueError(f"Unknown columns {', '.join(sorted(unknown))} of {table}")
+
+    result_map = build_result_map(aggregates, group_by)
+    unknown = (filter_fields(having) | {item.field for item in order_by or []}) - set(result_map)
+    if unknown:
+        raise ValueError(
+            f"`having` and `order_by` refer to the results ({', '.join(result_map)}), not to {', '.join(sorted(unknown))}"
+        )
+    if any(item.knn for item in order_by or []):
+        raise ValueError("KNN ordering doesn't apply to aggregated results")
+
+    where_clause, where_params = build_where_clause(where, column_types=column_types)
+    having_clause, having_params = build_where_clause(having, column_map=result_map)
+    order_by_clause, _ = build_order_by_clause(order_by, column_map=result_map)
+    params = where_params + having_params
+    if limit is not None:
+        params.append(limit)
+
+    def build_query() -> sql.Composable:
+        query = sql.SQL(_AGGREGATE_SQL_TEMPLATE).format(
+            columns=sql.SQL(', ').join(
+                sql.SQL("{} AS {}").format(sql.SQL(expression), sql.Identifier(name))
+                for name, expression in result_map.items()
+            ),
+            table=sql.Identifier(*table.split('.')),
+        )
+        if where_clause:
+            query += sql.SQL(" WHERE ") + sql.SQL(where_clause)
+        if group_by:
+            query += sql.SQL(" GROUP BY ") + sql.SQL(', ').join(sql.Identifier(col) for col in group_by)
+        if having_clause:
+            query += sql.SQL(" HAVING ") + sql.SQL(having_clause)
+        if order_by_clause:
+            query += sql.SQL(order_by_clause)
+        if limit is not None:
+            query += sql.SQL(" LIMIT %s")
+        return query
+
+    query, hit = statement_cache.get(
+        (
+            "aggregate", table, tuple(result_map.items()), tuple(group_by), where_clause, having_clause,
+            order_by_clause, limit is not None,
+        ),
+        build_query,
+    )
+
+    async with read_cursor(
+            binary=pg_settings.binary_results, row_factory=dict_row, statement_timeout=pg_settings.select_statement_timeout
+    ) as cur:
+        if cost_guard.enabled:
+            await cost_guard.check(cur.connection, query, params, AGGREGATE_HINT, limit=limit)
+        await cur.execute(query, params, prepare=prepare_flag(hit))
+        return await cur.fetchall()
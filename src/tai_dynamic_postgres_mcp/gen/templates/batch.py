@@ -0,0 +1,103 @@
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from psycopg import sql
+
+from tai_dynamic_postgres_mcp.database.connection import get_async_connection
+
+logger = logging.getLogger(__name__)
+
+# PostgreSQL's bind message can't carry more parameters than this.
+PG_MAX_PARAMS = 65535
+
+
+# The rows left after the full chunks are split in at most this many power-of-two chunks, then one
+# chunk of the rest; a rest smaller than the minimum is never split.
+_MAX_TAIL_SPLITS = 2
+_MIN_TAIL_SPLIT_ROWS = 16
+
+
+def chunk_rows(rows: Sequence, width: int, max_rows: int) -> List[Sequence]:
+    """
+    Splits `rows` in chunks of at most `max_rows` rows and `PG_MAX_PARAMS` parameters.
+
+    The rows left after the full chunks mostly go in power-of-two chunks, so the statements of a
+    table are cached for a handful of sizes instead of one per batch length, at the cost of at most
+    `_MAX_TAIL_SPLITS` extra statements per batch.
+    """
+    size = max(1, min(max_rows, PG_MAX_PARAMS // max(width, 1)))
+    full = len(rows) - len(rows) % size
+    chunks = [rows[i:i + size] for i in range(0, full, size)]
+    start = full
+    for _ in range(_MAX_TAIL_SPLITS):
+        left = len(rows) - start
+        if left < _MIN_TAIL_SPLIT_ROWS:
+            break
+        piece = 1 << (left.bit_length() - 1)
+        chunks.append(rows[start:start + piece])
+        start += piece
+    if start < len(rows):
+        chunks.append(rows[start:])
+    return chunks
+
+
+class BatchMetrics:
+    """Cumulative throughput of the batched write paths."""
+
+    def __init__(self) -> None:
+        self.batches = 0
+        self.rows = 0
+        self.chunks = 0
+        self.max_chunk_rows = 0
+        self.seconds = 0.0
+
+    def record(self, operation: str, table: str, rows: int, chunk_sizes: List[int], seconds: float) -> None:
+        self.batches += 1
+        self.rows += rows
+        self.chunks += len(chunk_sizes)
+        self.max_chunk_rows = max([self.max_chunk_rows, *chunk_sizes])
+        self.seconds += seconds
+        logger.debug(
+            f"{operation} {table}: {rows} rows in {len(chunk_sizes)} chunk(s) of <= {max(chunk_sizes, default=0)} rows, "
+            f"{seconds * 1000:.1f} ms ({rows / seconds if seconds else 0:.0f} rows/s)"
+        )
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "batches": self.batches,
+            "rows": self.rows,
+            "chunks": self.chunks,
+            "avg_chunk_rows": self.rows / self.chunks if self.chunks else 0.0,
+            "max_chunk_rows": self.max_chunk_rows,
+            "rows_per_second": self.rows / self.seconds if self.seconds else 0.0,
+        }
+
+
+batch_metrics = BatchMetrics()
+
+
+async def execute_pipelined(
+        statements: List[Tuple[Union[str, sql.Composable], List[Any]]],
+        returning: bool = True,
+        statement_timeout: Optional[float] = None,
+) -> List[Union[List[Tuple], int]]:
+    """
+    Sends every statement back-to-back in pipeline mode, inside a single transaction.
+
+    Returns, in order, the rows of each statement when `returning`, otherwise its rowcount.
+    """
+    async with get_async_connection(statement_timeout) as conn:
+        cursors = []
+        try:
+            async with conn.pipeline():
+                for query, params in statements:
+                    cur = conn.cursor()
+                    cursors.append(cur)
+                    await cur.execute(query, params)
+
+            results = [await cur.fetchall() if returning else cur.rowcount for cur in cursors]
+            await conn.commit()
+            return results
+        finally:
+            for cur in cursors:
+                await cur.close()
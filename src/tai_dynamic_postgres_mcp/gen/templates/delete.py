@@ -1,8 +1,12 @@
-from typing import Optional
+from typing import Optional, Dict
 
 from psycopg import sql
 
+from tai_dynamic_postgres_mcp.config.settings import pg_settings
 from tai_dynamic_postgres_mcp.database.connection import cursor
+from tai_dynamic_postgres_mcp.database.cost_guard import WRITE_HINT, cost_guard
+from tai_dynamic_postgres_mcp.database.result_cache import result_cache
+from tai_dynamic_postgres_mcp.database.statement_cache import prepare_flag, statement_cache
 from tai_dynamic_postgres_mcp.gen.filters.builder import build_where_clause
 from tai_dynamic_postgres_mcp.gen.filters.models import WhereFilter
 
@@ -12,17 +16,24 @@ _DELETE_SQL_TEMPLATE = "DELETE FROM {table}"
 async def delete_tmpl(
         table: str,
         where: Optional[WhereFilter] = None,
+        column_types: Optional[Dict[str, str]] = None,
 ) -> int:
-    where_clause, params = build_where_clause(where)
-
-    query = sql.SQL(_DELETE_SQL_TEMPLATE).format(
-        table=sql.Identifier(*table.split('.'))
-    )
-
-    if where_clause:
-        query += sql.SQL(" WHERE ") + sql.SQL(where_clause)
-
-    async with cursor() as cur:
-        await cur.execute(query, params)
+    where_clause, params = build_where_clause(where, column_types=column_types)
+
+    def build_query() -> sql.Composable:
+        query = sql.SQL(_DELETE_SQL_TEMPLATE).format(
+            table=sql.Identifier(*table.split('.'))
+        )
+        if where_clause:
+            query += sql.SQL(" WHERE ") + sql.SQL(where_clause)
+        return query
+
+    query, hit = statement_cache.get(("delete", table, where_clause), build_query)
+
+    async with cursor(statement_timeout=pg_settings.delete_statement_timeout) as cur:
+        if cost_guard.enabled:
+            await cost_guard.check(cur.connection, query, params, WRITE_HINT)
+        await cur.execute(query, params, prepare=prepare_flag(hit))
         await cur.connection.commit()
+        result_cache.invalidate([table])
         return cur.rowcount
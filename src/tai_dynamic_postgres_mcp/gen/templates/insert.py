@@ -1,38 +1,165 @@
-from typing import List, Tuple
+import time
+from typing import List, Tuple, Optional, Dict, Hashable
 
 from psycopg import sql
 
+from tai_dynamic_postgres_mcp.config.settings import pg_settings
 from tai_dynamic_postgres_mcp.database.connection import cursor
+from tai_dynamic_postgres_mcp.database.result_cache import result_cache
+from tai_dynamic_postgres_mcp.database.statement_cache import statement_cache
+from tai_dynamic_postgres_mcp.gen.templates.batch import PG_MAX_PARAMS, batch_metrics, chunk_rows, execute_pipelined
 
 _INSERT_SQL_TEMPLATE = "INSERT INTO {table} ({columns}) VALUES {values} {conflict_clause} RETURNING id"
 
+# Staging table filled with COPY, then moved into the target with a single INSERT ... SELECT.
+# `_tai_ord` keeps the input order. RETURNING can't reference it: Postgres returns the rows of an
+# INSERT ... SELECT ... ORDER BY in that order in practice, but doesn't guarantee it. Plain inserts
+# rely on it; upserts join the returned rows back to the staging table on their key instead. A NULL
+# never matches in the join: upsert rows with a NULL in their key, which never conflict, are inserted
+# with VALUES statements in the same transaction.
+_STAGE_TABLE = "_tai_insert_stage"
+_STAGE_SQL_TEMPLATE = (
+    "CREATE TEMP TABLE {stage} ON COMMIT DROP AS "
+    "SELECT {columns}, NULL::bigint AS _tai_ord FROM {table} WITH NO DATA"
+)
+_STAGE_COPY_SQL_TEMPLATE = "COPY {stage} ({columns}, _tai_ord) FROM STDIN"
+_STAGE_INSERT_SQL_TEMPLATE = (
+    "INSERT INTO {table} ({columns}) SELECT {columns} FROM {stage} ORDER BY _tai_ord {conflict_clause} RETURNING id"
+)
+_STAGE_UPSERT_SQL_TEMPLATE = (
+    "WITH written AS ("
+    "INSERT INTO {table} ({columns}) SELECT {columns} FROM {stage} ORDER BY _tai_ord {conflict_clause} "
+    "RETURNING id AS _tai_id, {key}"
+    ") SELECT written._tai_id FROM {stage} JOIN written USING ({key}) ORDER BY {stage}._tai_ord"
+)
 
-async def insert_tmpl(
+
+def _copy_value(value, sql_type: Optional[str]):
+    # pgvector's text input is `[x,y,...]`, not the `{x,y,...}` array literal a list is copied as.
+    if value is not None and sql_type and sql_type.startswith('vector') and not sql_type.endswith(']'):
+        return '[' + ','.join(map(str, value)) + ']'
+    return value
+
+
+async def _copy_insert(
         table: str,
         columns: List[str],
         values: List[Tuple],
-        raise_on_conflict: bool = True
+        conflict_clause: sql.Composable,
+        column_types: Optional[Dict[str, str]] = None,
+        key_columns: Optional[List[str]] = None,
 ) -> List[int]:
-    if not values:
-        return []
+    table_ident = sql.Identifier(*table.split('.'))
+    stage_ident = sql.Identifier(_STAGE_TABLE)
+    columns_sql = sql.SQL(', ').join(sql.Identifier(col) for col in columns)
+    types = [(column_types or {}).get(col) for col in columns]
+
+    staged = list(range(len(values)))
+    null_keyed: List[int] = []
+    if key_columns:
+        key_indexes = [columns.index(col) for col in key_columns]
+        staged = [pos for pos, row in enumerate(values) if all(row[i] is not None for i in key_indexes)]
+        null_keyed = [pos for pos, row in enumerate(values) if any(row[i] is None for i in key_indexes)]
+
+    ids: List[Optional[int]] = [None] * len(values)
+    async with cursor(statement_timeout=pg_settings.insert_statement_timeout) as cur:
+        if staged:
+            await cur.execute(
+                sql.SQL(_STAGE_SQL_TEMPLATE).format(stage=stage_ident, columns=columns_sql, table=table_ident)
+            )
+
+            copy_sql = sql.SQL(_STAGE_COPY_SQL_TEMPLATE).format(stage=stage_ident, columns=columns_sql)
+            async with cur.copy(copy_sql) as copy:
+                for ord_, pos in enumerate(staged):
+                    row = values[pos]
+                    await copy.write_row([_copy_value(value, typ) for value, typ in zip(row, types)] + [ord_])
 
-    flat_values = [item for row in values for item in row]
+            template = _STAGE_UPSERT_SQL_TEMPLATE if key_columns else _STAGE_INSERT_SQL_TEMPLATE
+            await cur.execute(sql.SQL(template).format(
+                table=table_ident,
+                columns=columns_sql,
+                stage=stage_ident,
+                conflict_clause=conflict_clause,
+                key=sql.SQL(', ').join(sql.Identifier(col) for col in key_columns or []),
+            ))
+            for pos, row in zip(staged, await cur.fetchall()):
+                ids[pos] = row[0]
 
+        for chunk in chunk_rows(null_keyed, len(columns), pg_settings.insert_chunk_size):
+            await cur.execute(
+                _values_query(table, columns, len(chunk), conflict_clause),
+                [item for pos in chunk for item in values[pos]],
+            )
+            for pos, row in zip(chunk, await cur.fetchall()):
+                ids[pos] = row[0]
+
+        await cur.connection.commit()
+    return ids
+
+
+def _values_query(table: str, columns: List[str], num_rows: int, conflict_clause: sql.Composable) -> sql.Composable:
     values_placeholders = sql.SQL(', ').join(
-        sql.SQL('({})').format(sql.SQL(', ').join(sql.Placeholder() for _ in columns)) for _ in values
+        sql.SQL('({})').format(sql.SQL(', ').join(sql.Placeholder() for _ in columns)) for _ in range(num_rows)
     )
 
-    conflict_clause = sql.SQL("") if raise_on_conflict else sql.SQL("ON CONFLICT DO NOTHING")
-
-    query = sql.SQL(_INSERT_SQL_TEMPLATE).format(
+    return sql.SQL(_INSERT_SQL_TEMPLATE).format(
         table=sql.Identifier(*table.split('.')),
         columns=sql.SQL(', ').join(sql.Identifier(col) for col in columns),
         values=values_placeholders,
         conflict_clause=conflict_clause
     )
 
-    async with cursor() as cur:
-        await cur.execute(query, flat_values)
-        result = await cur.fetchall()
-        await cur.connection.commit()
-        return [row[0] for row in result]
+
+async def write_rows(
+        operation: str,
+        table: str,
+        columns: List[str],
+        values: List[Tuple],
+        conflict_clause: sql.Composable,
+        conflict_key: Hashable,
+        column_types: Optional[Dict[str, str]] = None,
+        key_columns: Optional[List[str]] = None,
+) -> List[int]:
+    """
+    Inserts `values` with `conflict_clause`, through COPY or pipelined chunks depending on the batch size.
+    `key_columns`, the conflict target of upserts, lets large batches match the returned IDs to their rows.
+    """
+    start = time.perf_counter()
+
+    # Large batches are streamed with COPY: no giant statement to parse and no bind parameter limit.
+    if len(values) >= pg_settings.insert_copy_threshold or len(values) * len(columns) > PG_MAX_PARAMS:
+        ids = await _copy_insert(table, columns, values, conflict_clause, column_types, key_columns)
+        result_cache.invalidate([table])
+        batch_metrics.record(f"{operation} (COPY)", table, len(values), [len(values)], time.perf_counter() - start)
+        return ids
+
+    # Smaller batches are split in parameter-safe chunks, sent back-to-back in one transaction.
+    # Full chunks share the same statement text, so they also share its prepared plan.
+    chunks = chunk_rows(values, len(columns), pg_settings.insert_chunk_size)
+    statements = []
+    for chunk in chunks:
+        query, _ = statement_cache.get(
+            (operation, table, tuple(columns), len(chunk), conflict_key),
+            lambda: _values_query(table, columns, len(chunk), conflict_clause)
+        )
+        statements.append((query, [item for row in chunk for item in row]))
+
+    results = await execute_pipelined(statements, statement_timeout=pg_settings.insert_statement_timeout)
+    result_cache.invalidate([table])
+    batch_metrics.record(operation, table, len(values), [len(chunk) for chunk in chunks], time.perf_counter() - start)
+    return [row[0] for result in results for row in result]
+
+
+async def insert_tmpl(
+        table: str,
+        columns: List[str],
+        values: List[Tuple],
+        raise_on_conflict: bool = True,
+        column_types: Optional[Dict[str, str]] = None,
+) -> List[int]:
+    if not values:
+        return []
+
+    conflict_clause = sql.SQL("") if raise_on_conflict else sql.SQL("ON CONFLICT DO NOTHING")
+
+    return await write_rows("INSERT", table, columns, values, conflict_clause, raise_on_conflict, column_types)
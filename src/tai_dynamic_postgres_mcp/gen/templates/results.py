@@ -0,0 +1,52 @@
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+from pydantic import BaseModel, TypeAdapter
+
+from tai_dynamic_postgres_mcp.config.settings import pg_settings
+from tai_dynamic_postgres_mcp.gen.pagination.models import ColumnarResult
+
+
+@lru_cache(maxsize=None)
+def _rows_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    # Built once per model: the validator of the whole list runs in a single call.
+    return TypeAdapter(List[model])
+
+
+def load_rows(rows: List[Dict[str, Any]], model: Optional[Type[BaseModel]] = None) -> List[Any]:
+    """
+    Returns the fetched rows as the tool's result.
+
+    Rows come from typed columns loaded into the models' Python types, so by default they are
+    returned as plain dicts and serialized as they are. With `validate_results`, they are validated
+    against `model` first.
+    """
+    if model is None or not pg_settings.validate_results:
+        return rows
+    return _rows_adapter(model).validate_python(rows)
+
+
+def _to_float(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, list):
+        return [_to_float(item) for item in value]
+    return value
+
+
+def numeric_to_float(rows: List[Dict[str, Any]], columns: List[str]) -> None:
+    """Converts, in place, the Decimals of the `numeric` `columns` of rows read without the float loader."""
+    for row in rows:
+        for column in columns:
+            row[column] = _to_float(row[column])
+
+
+def load_columnar(
+        columns: List[str],
+        rows: List[Sequence[Any]],
+        truncated: bool = False,
+        next_token: Optional[str] = None,
+) -> ColumnarResult:
+    """Returns the rows as one header of column names plus one array of values per row."""
+    return ColumnarResult.model_construct(columns=columns, rows=rows, truncated=truncated, next_token=next_token)
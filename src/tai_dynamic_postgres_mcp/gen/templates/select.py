@@ -1,15 +1,23 @@
-from typing import List, Optional, Type
+from typing import Any, List, Literal, Optional, Tuple, Type, Union, Dict
 
 from psycopg import sql
-from psycopg.rows import dict_row
+from psycopg.rows import dict_row, tuple_row
 
-from tai_dynamic_postgres_mcp.database.connection import cursor
+from tai_dynamic_postgres_mcp.config.settings import pg_settings
+from tai_dynamic_postgres_mcp.database.connection import read_cursor
+from tai_dynamic_postgres_mcp.database.cost_guard import READ_HINT, cost_guard
+from tai_dynamic_postgres_mcp.database.helpers import register_numeric_as_float
+from tai_dynamic_postgres_mcp.database.result_cache import result_cache, result_size
+from tai_dynamic_postgres_mcp.database.statement_cache import prepare_flag, statement_cache
 from tai_dynamic_postgres_mcp.gen.filters.builder import build_where_clause
 from tai_dynamic_postgres_mcp.gen.filters.models import WhereFilter
-from tai_dynamic_postgres_mcp.gen.order.builder import build_order_by_clause
+from tai_dynamic_postgres_mcp.gen.order.builder import build_order_by_clause, check_order_by_fields
 from tai_dynamic_postgres_mcp.gen.order.models import OrderByItem
+from tai_dynamic_postgres_mcp.gen.pagination.models import ColumnarResult, ResultPage
+from tai_dynamic_postgres_mcp.gen.pagination.stream import fetch_page
+from tai_dynamic_postgres_mcp.gen.templates.results import load_columnar, load_rows
 
-_SELECT_SQL_TEMPLATE = "SELECT * FROM {table}"
+_SELECT_SQL_TEMPLATE = "SELECT {columns} FROM {table}"
 
 
 async def select_tmpl(
@@ -17,32 +25,95 @@ async def select_tmpl(
         where: Optional[WhereFilter] = None,
         order_by: Optional[List[OrderByItem]] = None,
         limit: Optional[int] = None,
-        model: Optional[Type] = None
-) -> List:
-    where_clause, where_params = build_where_clause(where)
-    params = where_params[:]
+        model: Optional[Type] = None,
+        stream: bool = False,
+        after: Optional[str] = None,
+        key_columns: Optional[List[str]] = None,
+        not_null_columns: Optional[List[str]] = None,
+        column_types: Optional[Dict[str, str]] = None,
+        columns: Optional[List[str]] = None,
+        format: Literal["rows", "columnar"] = "rows",
+        selectable_columns: Optional[List[str]] = None,
+) -> Union[List, ResultPage, ColumnarResult]:
+    if selectable_columns is not None:
+        check_order_by_fields(order_by, selectable_columns)
+    where_clause, where_params = build_where_clause(where, column_types=column_types)
 
-    query = sql.SQL(_SELECT_SQL_TEMPLATE).format(
+    paged = bool(stream or after)
+    hidden_columns: List[str] = []
+    if columns and paged:
+        # The continuation token is built from the sort key of the last row, so it's always fetched,
+        # and left out of the returned rows when not asked for.
+        sort_key = [item.field for item in order_by or [] if not item.knn] + list(key_columns or [])
+        hidden_columns = [col for col in dict.fromkeys(sort_key) if col not in columns]
+        columns = columns + hidden_columns
+
+    base_query = sql.SQL(_SELECT_SQL_TEMPLATE).format(
+        columns=sql.SQL(', ').join(sql.Identifier(col) for col in columns) if columns else sql.SQL('*'),
         table=sql.Identifier(*table.split('.'))
     )
 
-    if where_clause:
-        query += sql.SQL(" WHERE ") + sql.SQL(where_clause)
+    if paged:
+        return await fetch_page(
+            base_query, where_clause, where_params, order_by, limit, after, model,
+            key_columns=key_columns, not_null_columns=not_null_columns, hidden_columns=hidden_columns,
+            format=format, statement_timeout=pg_settings.select_statement_timeout,
+        )
 
     order_by_clause, order_params = build_order_by_clause(order_by)
-    if order_by_clause:
-        query += sql.SQL(order_by_clause)
-    params.extend(order_params)
 
-    if limit is not None:
-        query += sql.SQL(" LIMIT %s")
-        params.append(limit)
+    def build_statement(limit: Optional[int]) -> Tuple[str, bool, List[Any]]:
+        def build_query() -> sql.Composable:
+            query = base_query
+            if where_clause:
+                query += sql.SQL(" WHERE ") + sql.SQL(where_clause)
+            if order_by_clause:
+                query += sql.SQL(order_by_clause)
+            if limit is not None:
+                query += sql.SQL(" LIMIT %s")
+            return query
+
+        query, hit = statement_cache.get(
+            ("select", table, tuple(columns or ()), where_clause, order_by_clause, limit is not None), build_query
+        )
+        return query, hit, where_params + order_params + ([limit] if limit is not None else [])
+
+    query, hit, params = build_statement(limit)
+
+    cache_key = result_cache.key(query, params, format) if result_cache.enabled else None
+    primary = False
+    if cache_key is not None:
+        cached = result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        versions = result_cache.versions([table])
+        # A replica may not have replayed the last write yet: its result would be cached
+        primary = result_cache.needs_primary([table])
 
-    async with cursor(row_factory=dict_row) as cur:
-        await cur.execute(query, params)
+    columnar = format == "columnar"
+    limited = False
+    async with read_cursor(
+            binary=pg_settings.binary_results,
+            row_factory=tuple_row if columnar else dict_row,
+            statement_timeout=pg_settings.select_statement_timeout,
+            primary=primary,
+    ) as cur:
+        register_numeric_as_float(cur)
+        if cost_guard.enabled:
+            guarded_limit = await cost_guard.check_select(cur.connection, query, params, limit)
+            if guarded_limit != limit:
+                limit, limited = guarded_limit, True
+                query, hit, params = build_statement(limit)
+                await cost_guard.check(cur.connection, query, params, READ_HINT, check_rows=False, limit=limit)
+        await cur.execute(query, params, prepare=prepare_flag(hit))
         rows = await cur.fetchall()
-        await cur.connection.commit()
+        size = result_size(cur) if cache_key is not None else 0
 
-    if model:
-        return [model(**row) for row in rows]
-    return [dict(row) for row in rows]
+    if columnar:
+        truncated = limited and len(rows) == limit
+        result = load_columnar([column.name for column in cur.description], rows, truncated=truncated)
+    else:
+        result = load_rows(rows, model)
+    if cache_key is not None:
+        result_cache.put(cache_key, [table], versions, result, size)
+    return result
@@ -1,37 +1,128 @@
-from typing import Optional
+import time
+from collections import Counter
+from typing import Optional, Dict, List
 
 from psycopg import sql
 
+from tai_dynamic_postgres_mcp.config.settings import pg_settings
 from tai_dynamic_postgres_mcp.database.connection import cursor
+from tai_dynamic_postgres_mcp.database.cost_guard import WRITE_HINT, cost_guard
+from tai_dynamic_postgres_mcp.database.result_cache import result_cache
+from tai_dynamic_postgres_mcp.database.statement_cache import prepare_flag, statement_cache
 from tai_dynamic_postgres_mcp.gen.filters.builder import build_where_clause
 from tai_dynamic_postgres_mcp.gen.filters.models import WhereFilter
+from tai_dynamic_postgres_mcp.gen.templates.batch import batch_metrics, chunk_rows, execute_pipelined
+
+# Every item of the batch is one row of the VALUES list, joined to the target on its key. Each changed
+# column comes with a flag telling whether the item sets it: a column left out keeps its current value,
+# while an explicit null sets it to NULL.
+_UPDATE_MANY_SQL_TEMPLATE = "UPDATE {table} AS t SET {set_clause} FROM (VALUES {values}) AS v ({columns}) WHERE {join_clause}"
 
 
 async def update_tmpl(
         table: str,
         data,
-        where: Optional[WhereFilter] = None
+        where: Optional[WhereFilter] = None,
+        column_types: Optional[Dict[str, str]] = None,
 ) -> int:
-    update_fields = {
-        k: v for k, v in data.model_dump(exclude_none=True).items()
-    }
+    # Fields left out keep their value, an explicit null sets the column to NULL
+    update_fields = data.model_dump(exclude_unset=True)
     if not update_fields:
         return 0
 
-    set_clauses = [sql.SQL(f"{k} = %s") for k in update_fields]
     set_values = list(update_fields.values())
 
-    where_clause, where_params = build_where_clause(where)
+    where_clause, where_params = build_where_clause(where, column_types=column_types)
 
-    query = sql.SQL("UPDATE {table} SET ").format(
-        table=sql.Identifier(*table.split('.'))
-    )
-    query += sql.SQL(', ').join(set_clauses)
+    def build_query() -> sql.Composable:
+        query = sql.SQL("UPDATE {table} SET ").format(
+            table=sql.Identifier(*table.split('.'))
+        )
+        query += sql.SQL(', ').join(sql.SQL(f"{k} = %s") for k in update_fields)
+        if where_clause:
+            query += sql.SQL(" WHERE ") + sql.SQL(where_clause)
+        return query
 
-    if where_clause:
-        query += sql.SQL(" WHERE ") + sql.SQL(where_clause)
+    query, hit = statement_cache.get(("update", table, tuple(update_fields), where_clause), build_query)
 
-    async with cursor() as cur:
-        await cur.execute(query, set_values + where_params)
+    async with cursor(statement_timeout=pg_settings.update_statement_timeout) as cur:
+        if cost_guard.enabled:
+            await cost_guard.check(cur.connection, query, set_values + where_params, WRITE_HINT)
+        await cur.execute(query, set_values + where_params, prepare=prepare_flag(hit))
         await cur.connection.commit()
+        result_cache.invalidate([table])
         return cur.rowcount
+
+
+def _update_many_query(
+        table: str,
+        key_columns: List[str],
+        set_columns: List[str],
+        num_rows: int,
+        column_types: Optional[Dict[str, str]] = None,
+) -> sql.Composable:
+    flags = [f"_tai_set_{i}" for i in range(len(set_columns))]
+
+    def placeholder(col: str) -> sql.Composable:
+        # VALUES has no target column to infer the types from, so every value is cast explicitly.
+        sql_type = (column_types or {}).get(col)
+        return sql.SQL("%s::" + sql_type) if sql_type else sql.Placeholder()
+
+    row = sql.SQL('({})').format(sql.SQL(', ').join(
+        [placeholder(col) for col in key_columns + set_columns] + [sql.SQL("%s::boolean") for _ in flags]
+    ))
+
+    return sql.SQL(_UPDATE_MANY_SQL_TEMPLATE).format(
+        table=sql.Identifier(*table.split('.')),
+        set_clause=sql.SQL(', ').join(
+            sql.SQL("{col} = CASE WHEN v.{flag} THEN v.{col} ELSE t.{col} END").format(
+                col=sql.Identifier(col), flag=sql.Identifier(flag)
+            )
+            for col, flag in zip(set_columns, flags)
+        ),
+        values=sql.SQL(', ').join(row for _ in range(num_rows)),
+        columns=sql.SQL(', ').join(sql.Identifier(col) for col in key_columns + set_columns + flags),
+        join_clause=sql.SQL(' AND ').join(
+            sql.SQL("t.{col} = v.{col}").format(col=sql.Identifier(col)) for col in key_columns
+        ),
+    )
+
+
+async def update_many_tmpl(
+        table: str,
+        key_columns: List[str],
+        items: List,
+        column_types: Optional[Dict[str, str]] = None,
+) -> int:
+    start = time.perf_counter()
+    keys = [tuple(item.key.model_dump()[col] for col in key_columns) for item in items]
+    # The same row updated twice by one statement would keep either change, depending on the plan
+    duplicates = [key for key, count in Counter(keys).items() if count > 1]
+    if duplicates:
+        raise ValueError(f"Duplicate keys in the batch: {', '.join(map(str, duplicates))}")
+
+    changes = [item.changes.model_dump(exclude_unset=True) for item in items]
+    set_columns = list(dict.fromkeys(col for change in changes for col in change))
+    if not set_columns:
+        return 0
+
+    rows = [
+        list(key) + [change.get(col) for col in set_columns] + [col in change for col in set_columns]
+        for key, change in zip(keys, changes)
+    ]
+
+    chunks = chunk_rows(rows, len(key_columns) + 2 * len(set_columns), len(rows))
+    statements = []
+    for chunk in chunks:
+        query, _ = statement_cache.get(
+            ("update_many", table, tuple(set_columns), len(chunk)),
+            lambda: _update_many_query(table, key_columns, set_columns, len(chunk), column_types)
+        )
+        statements.append((query, [value for row in chunk for value in row]))
+
+    rowcounts = await execute_pipelined(
+        statements, returning=False, statement_timeout=pg_settings.update_statement_timeout
+    )
+    result_cache.invalidate([table])
+    batch_metrics.record("UPDATE", table, len(rows), [len(chunk) for chunk in chunks], time.perf_counter() - start)
+    return sum(rowcounts)
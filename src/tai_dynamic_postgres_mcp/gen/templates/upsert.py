@@ -0,0 +1,48 @@
+from typing import List, Tuple, Optional, Dict
+
+from psycopg import sql
+
+from tai_dynamic_postgres_mcp.gen.templates.insert import write_rows
+
+_CONFLICT_SQL_TEMPLATE = "ON CONFLICT ({conflict_columns}) DO UPDATE SET {assignments}"
+
+
+async def upsert_tmpl(
+        table: str,
+        columns: List[str],
+        values: List[Tuple],
+        conflict_columns: List[str],
+        column_types: Optional[Dict[str, str]] = None,
+) -> List[int]:
+    if not values:
+        return []
+
+    # Rows sharing a key can't be written by the same statement ("ON CONFLICT DO UPDATE command cannot
+    # affect row a second time"): the last one is written, and every row gets the ID of its key.
+    # NULLs never conflict, so rows with a NULL in their key are all written.
+    key_indexes = [columns.index(col) for col in conflict_columns]
+    keys = [
+        tuple(row[i] for i in key_indexes) if all(row[i] is not None for i in key_indexes) else pos
+        for pos, row in enumerate(values)
+    ]
+    last_rows = {key: pos for pos, key in enumerate(keys)}
+    if len(last_rows) < len(values):
+        written = sorted(last_rows.values())
+        ids = await upsert_tmpl(table, columns, [values[pos] for pos in written], conflict_columns, column_types)
+        key_ids = dict(zip((keys[pos] for pos in written), ids))
+        return [key_ids[key] for key in keys]
+
+    # When every column is part of the key there is nothing to update, but a no-op assignment
+    # (instead of DO NOTHING) still returns the ID of the existing row.
+    update_columns = [col for col in columns if col not in conflict_columns] or conflict_columns
+
+    conflict_clause = sql.SQL(_CONFLICT_SQL_TEMPLATE).format(
+        conflict_columns=sql.SQL(', ').join(sql.Identifier(col) for col in conflict_columns),
+        assignments=sql.SQL(', ').join(
+            sql.SQL("{col} = EXCLUDED.{col}").format(col=sql.Identifier(col)) for col in update_columns
+        ),
+    )
+
+    return await write_rows(
+        "UPSERT", table, columns, values, conflict_clause, tuple(conflict_columns), column_types, conflict_columns
+    )
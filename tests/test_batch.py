@@ -0,0 +1,36 @@
+from tai_dynamic_postgres_mcp.gen.templates.batch import PG_MAX_PARAMS, chunk_rows
+
+
+def sizes(rows: int, width: int, max_rows: int):
+    return [len(chunk) for chunk in chunk_rows(list(range(rows)), width, max_rows)]
+
+
+def test_chunks_keep_every_row_in_order():
+    rows = list(range(999))
+    chunks = chunk_rows(rows, 3, 500)
+    assert [row for chunk in chunks for row in chunk] == rows
+
+
+def test_full_chunks_then_a_capped_tail_split():
+    assert sizes(1000, 3, 500) == [500, 500]
+    # 499 left: two power-of-two chunks, then the rest in one
+    assert sizes(999, 3, 500) == [500, 256, 128, 115]
+    assert sizes(512, 3, 500) == [500, 12]
+
+
+def test_small_tail_is_not_split():
+    assert sizes(15, 3, 500) == [15]
+    assert sizes(16, 3, 500) == [16]
+    assert sizes(48, 3, 500) == [32, 16]
+
+
+def test_chunks_stay_under_the_parameter_limit():
+    width = 1000
+    chunks = chunk_rows(list(range(200)), width, 500)
+    assert max(len(chunk) for chunk in chunks) == PG_MAX_PARAMS // width
+    assert all(len(chunk) * width <= PG_MAX_PARAMS for chunk in chunks)
+
+
+def test_zero_width_and_empty_batches():
+    assert sizes(10, 0, 4) == [4, 4, 2]
+    assert chunk_rows([], 3, 500) == []
@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from tai_dynamic_postgres_mcp.database.cost_guard import CostGuard, QueryCostError, _plan_rows, pg_settings
+
+
+class FakeCursor:
+    def __init__(self, plans):
+        self.plans = plans
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    async def execute(self, query, params):
+        # The LIMIT parameter, when there is one, is the last
+        self.limit = params[-1] if params else None
+
+    async def fetchone(self):
+        return ([{"Plan": self.plans(self.limit)}],)
+
+
+class FakeConnection:
+    """Plans a scan of `rows` rows costing one unit per row, cut short by the LIMIT."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.explains = 0
+
+    def cursor(self, row_factory=None):
+        self.explains += 1
+        return FakeCursor(lambda limit: {
+            "Node Type": "Limit" if limit else "Seq Scan",
+            "Total Cost": float(min(self.rows, limit or self.rows)),
+            "Plan Rows": min(self.rows, limit or self.rows),
+        })
+
+
+def test_plan_rows_of_modify_table_counts_the_scanned_rows():
+    plan = {"Node Type": "ModifyTable", "Plan Rows": 0, "Plans": [{"Node Type": "Seq Scan", "Plan Rows": 42}]}
+    assert _plan_rows(plan) == 42
+    assert _plan_rows({"Node Type": "Seq Scan", "Plan Rows": 7}) == 7
+
+
+def test_check_rejects_above_max_cost():
+    guard = CostGuard(max_cost=100, max_rows=None, maxsize=8)
+    with pytest.raises(QueryCostError) as error:
+        asyncio.run(guard.check(FakeConnection(rows=1000), "SELECT 1", [], "hint"))
+    assert error.value.details["estimated_cost"] == 1000
+    assert guard.rejected == 1
+
+
+def test_estimates_are_cached_per_limit():
+    guard = CostGuard(max_cost=100, max_rows=None, maxsize=8)
+    conn = FakeConnection(rows=1000)
+    with pytest.raises(QueryCostError):
+        asyncio.run(guard.check(conn, "SELECT 1 LIMIT %s", [500], "hint", limit=500))
+
+    # The rejected large limit doesn't apply to a small one
+    asyncio.run(guard.check(conn, "SELECT 1 LIMIT %s", [5], "hint", limit=5))
+    asyncio.run(guard.check(conn, "SELECT 1 LIMIT %s", [5], "hint", limit=5))
+    assert conn.explains == 2
+    assert guard.hits == 1
+
+
+def test_check_select_rejects_too_many_rows(monkeypatch):
+    monkeypatch.setattr(pg_settings, "cost_guard_action", "reject")
+    guard = CostGuard(max_cost=None, max_rows=10, maxsize=8)
+    with pytest.raises(QueryCostError):
+        asyncio.run(guard.check_select(FakeConnection(rows=1000), "SELECT 1", [], None))
+
+
+def test_check_select_limits_before_checking_the_cost(monkeypatch):
+    monkeypatch.setattr(pg_settings, "cost_guard_action", "limit")
+    guard = CostGuard(max_cost=100, max_rows=10, maxsize=8)
+    conn = FakeConnection(rows=1000)
+
+    # The unlimited scan is over both thresholds, it gets a LIMIT instead of being refused
+    assert asyncio.run(guard.check_select(conn, "SELECT 1", [], None)) == 10
+    assert asyncio.run(guard.check_select(conn, "SELECT 1 LIMIT %s", [50], 50)) == 10
+    assert guard.limited == 2
+
+    # The caller then checks the cost of the limited statement
+    asyncio.run(guard.check(conn, "SELECT 1 LIMIT %s", [10], "hint", check_rows=False, limit=10))
+    assert guard.rejected == 0
+
+
+def test_check_select_keeps_a_small_limit(monkeypatch):
+    monkeypatch.setattr(pg_settings, "cost_guard_action", "limit")
+    guard = CostGuard(max_cost=100, max_rows=10, maxsize=8)
+    assert asyncio.run(guard.check_select(FakeConnection(rows=1000), "SELECT 1 LIMIT %s", [5], 5)) == 5
+    assert guard.limited == 0
@@ -0,0 +1,69 @@
+import struct
+from datetime import date, datetime, time, timedelta, timezone
+
+import pytest
+from psycopg.types.datetime import (
+    DateBinaryLoader,
+    TimeBinaryLoader,
+    TimestampBinaryLoader,
+    TimestamptzBinaryLoader,
+    TimetzBinaryLoader,
+)
+
+from tai_dynamic_postgres_mcp.database import helpers
+from tai_dynamic_postgres_mcp.database.helpers import TemporalBinaryLoader, Vector, VectorBinaryDumper, VectorBinaryLoader
+
+_PG_EPOCH = datetime(2000, 1, 1)
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_vector_binary_loader_reads_memoryview(monkeypatch, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(helpers, "np", None)
+
+    data = memoryview(struct.pack(">HH3f", 3, 0, 1.5, -2.0, 0.25))
+    assert VectorBinaryLoader(0).load(data) == [1.5, -2.0, 0.25]
+
+
+def test_vector_binary_dumper_round_trip(monkeypatch):
+    monkeypatch.setattr(helpers, "np", None)
+    data = VectorBinaryDumper(Vector).dump(Vector([0.5, 3.0]))
+    assert VectorBinaryLoader(0).load(memoryview(data)) == [0.5, 3.0]
+
+
+def _loader(base):
+    return type("Loader", (TemporalBinaryLoader,), {"base": base})(0)
+
+
+def _micros(value: timedelta) -> int:
+    return value // timedelta(microseconds=1)
+
+
+@pytest.mark.parametrize("base, data, text", [
+    (DateBinaryLoader, struct.pack(">i", (date(2024, 3, 5) - _PG_EPOCH.date()).days), "2024-03-05"),
+    (TimeBinaryLoader, struct.pack(">q", _micros(timedelta(hours=13, minutes=4, seconds=5))), "13:04:05"),
+    (TimeBinaryLoader, struct.pack(">q", _micros(timedelta(hours=13, microseconds=120000))), "13:00:00.12"),
+    (TimetzBinaryLoader, struct.pack(">qi", _micros(timedelta(hours=13)), -19800), "13:00:00+05:30"),
+    (
+        TimestampBinaryLoader,
+        struct.pack(">q", _micros(datetime(2024, 3, 5, 13, 4, 5, 500000) - _PG_EPOCH)),
+        "2024-03-05 13:04:05.5",
+    ),
+    (
+        TimestamptzBinaryLoader,
+        struct.pack(">q", _micros(datetime(2024, 3, 5, 13, 4, 5) - _PG_EPOCH)),
+        "2024-03-05 13:04:05+00",
+    ),
+    (TimestampBinaryLoader, struct.pack(">q", 2 ** 63 - 1), "infinity"),
+    (DateBinaryLoader, struct.pack(">i", -2 ** 31), "-infinity"),
+])
+def test_temporal_binary_loader_matches_text_output(base, data, text):
+    assert _loader(base).load(memoryview(data)) == text
+
+
+def test_temporal_binary_loader_formats_offsets():
+    value = datetime(2024, 3, 5, 13, 4, 5, tzinfo=timezone(-timedelta(hours=3, minutes=30)))
+    assert helpers._format_temporal(value) == "2024-03-05 13:04:05-03:30"
+    assert helpers._format_temporal(time(1, 2, 3, 4)) == "01:02:03.000004"
@@ -0,0 +1,100 @@
+import base64
+import json
+from decimal import Decimal
+
+import pytest
+
+from tai_dynamic_postgres_mcp.gen.order.models import KnnOrder, OrderByItem
+from tai_dynamic_postgres_mcp.gen.pagination.builder import build_keyset_clause, keyset_order_by
+from tai_dynamic_postgres_mcp.gen.pagination.tokens import decode_token, encode_token, query_fingerprint
+
+FINGERPRINT = query_fingerprint('SELECT * FROM "public"."users" ORDER BY id ASC', [])
+
+
+def _payload(token: str) -> dict:
+    return json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+
+
+def _token(payload: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+def test_token_round_trip():
+    token = encode_token(FINGERPRINT, keyset=[3, "b"], offset=0)
+    assert "=" not in token
+    assert decode_token(token, FINGERPRINT) == {"keyset": [3, "b"], "offset": 0}
+
+
+def test_token_keeps_exact_numeric_keys():
+    token = encode_token(FINGERPRINT, keyset=[Decimal("1.10000000000000000001")])
+    assert decode_token(token, FINGERPRINT) == {"keyset": ["1.10000000000000000001"]}
+
+
+def test_fingerprint_depends_on_query_and_params():
+    assert query_fingerprint("SELECT 1", [1]) != query_fingerprint("SELECT 1", [2])
+    assert query_fingerprint("SELECT 1", [1]) != query_fingerprint("SELECT 2", [1])
+
+
+def test_token_of_another_query_is_refused():
+    token = encode_token(query_fingerprint("SELECT 1", []), keyset=[1])
+    with pytest.raises(ValueError, match="does not belong"):
+        decode_token(token, FINGERPRINT)
+
+
+@pytest.mark.parametrize("payload", [
+    {"keyset": [1]},  # fingerprint removed
+    {"q": "0" * 16, "keyset": [1]},  # fingerprint altered
+    [FINGERPRINT, 1],  # not an object
+])
+def test_tampered_token_is_refused(payload):
+    with pytest.raises(ValueError):
+        decode_token(_token(payload), FINGERPRINT)
+
+
+@pytest.mark.parametrize("token", ["not a token!", "e30", base64.urlsafe_b64encode(b"\xff\xfe").decode()])
+def test_malformed_token_is_refused(token):
+    with pytest.raises(ValueError):
+        decode_token(token, FINGERPRINT)
+
+
+def test_edited_state_keeps_the_fingerprint_check():
+    payload = _payload(encode_token(FINGERPRINT, keyset=[1]))
+    payload["keyset"] = [100]
+    # The keyset values are only ever bound as parameters
+    assert decode_token(_token(payload), FINGERPRINT) == {"keyset": [100]}
+
+
+def test_keyset_order_appends_the_key_as_tiebreaker():
+    items = keyset_order_by([OrderByItem(field="created", direction="DESC")], ["id"], ["created", "id"])
+    assert [(item.field, item.direction) for item in items] == [("created", "DESC"), ("id", "DESC")]
+
+
+def test_keyset_order_without_order_by_sorts_on_the_key():
+    items = keyset_order_by(None, ["tenant", "id"], ["tenant", "id"])
+    assert [(item.field, item.direction) for item in items] == [("tenant", "ASC"), ("id", "ASC")]
+
+
+def test_keyset_order_doesnt_repeat_an_ordered_key_column():
+    items = keyset_order_by([OrderByItem(field="id", direction="DESC")], ["id"], ["id"])
+    assert [(item.field, item.direction) for item in items] == [("id", "DESC")]
+
+
+@pytest.mark.parametrize("order_by, key_columns", [
+    ([OrderByItem(field="name")], ["id"]),  # nullable sort field
+    ([OrderByItem(field="embedding", knn=KnnOrder(query=[0.0]))], ["id"]),  # KNN distance
+    ([OrderByItem(field="created")], []),  # no key
+])
+def test_keyset_paging_is_refused(order_by, key_columns):
+    assert keyset_order_by(order_by, key_columns, ["created", "id"]) is None
+
+
+def test_keyset_clause_with_one_direction_compares_rows():
+    order_by = [OrderByItem(field="created", direction="DESC"), OrderByItem(field="id", direction="DESC")]
+    assert build_keyset_clause(order_by, [5, 9]) == ("(created, id) < (%s, %s)", [5, 9])
+
+
+def test_keyset_clause_with_mixed_directions_expands_the_comparison():
+    order_by = [OrderByItem(field="created", direction="ASC"), OrderByItem(field="id", direction="DESC")]
+    clause, params = build_keyset_clause(order_by, [5, 9], column_map={"created": "t.created", "id": "t.id"})
+    assert clause == "((t.created > %s) OR (t.created = %s AND t.id < %s))"
+    assert params == [5, 5, 9]
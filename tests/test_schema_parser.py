@@ -0,0 +1,53 @@
+from typing import Any, List, Optional, Union
+
+import pytest
+
+from tai_dynamic_postgres_mcp.gen.schema.schema_parser import (
+    SQL_TO_PYTHON,
+    python_type_of,
+    sql_columns_to_pydantic_class,
+    sql_type_to_python_type,
+)
+
+
+@pytest.mark.parametrize("typ, expected", [
+    ("int", int),
+    ("Any", Any),
+    ("Optional[str]", Optional[str]),
+    ("List[List[float]]", List[List[float]]),
+    ("Optional[List[Union[dict, list]]]", Optional[List[Union[dict, list]]]),
+    ("Union[int, None]", Optional[int]),
+])
+def test_python_type_of(typ, expected):
+    assert python_type_of(typ) == expected
+
+
+def test_every_mapped_sql_type_resolves():
+    for sql_type in SQL_TO_PYTHON:
+        for nullable in (False, True):
+            python_type_of(sql_type_to_python_type(sql_type, nullable))
+            python_type_of(sql_type_to_python_type(f"{sql_type}[]", nullable))
+
+
+@pytest.mark.parametrize("typ", [
+    "__import__('os')",
+    "os.system",
+    "Dict[str, int]",
+    "List[int",
+    "List[int]]",
+    "int, str",
+    "Optional[]",
+    "",
+])
+def test_python_type_of_refuses_other_expressions(typ):
+    with pytest.raises(ValueError):
+        python_type_of(typ)
+
+
+def test_pydantic_class_fields():
+    model = sql_columns_to_pydantic_class("select", "public.users", [("id", "int"), ("name", "Optional[str]")])
+    assert model.model_fields["id"].annotation is int
+    assert model.model_fields["id"].is_required()
+    assert model.model_fields["name"].annotation == Optional[str]
+    assert model(id=1).name is None
+
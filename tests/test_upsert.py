@@ -0,0 +1,138 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from tai_dynamic_postgres_mcp.gen.templates import insert, upsert
+from tai_dynamic_postgres_mcp.gen.templates.upsert import upsert_tmpl
+
+COLUMNS = ["email", "name"]
+
+
+class FakeCopy:
+    def __init__(self, staged):
+        self.staged = staged
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    async def write_row(self, row):
+        self.staged.append(row)
+
+
+class FakeCursor:
+    """Returns the `name` of each written row as its ID, in the order Postgres would."""
+
+    def __init__(self):
+        self.staged = []
+        self.statements = []
+        self.result = []
+        self.connection = self
+
+    async def commit(self):
+        pass
+
+    def copy(self, query):
+        return FakeCopy(self.staged)
+
+    async def execute(self, query, params=None):
+        text = query.as_string(None)
+        self.statements.append(text)
+        if text.startswith("WITH written"):
+            # Joined back to the staging table on the key, which a NULL never matches
+            self.result = [(row[1],) for row in sorted(self.staged, key=lambda row: row[-1]) if row[0] is not None]
+        elif " VALUES " in text:
+            self.result = [(params[i + 1],) for i in range(0, len(params), len(COLUMNS))]
+
+    async def fetchall(self):
+        return self.result
+
+
+@pytest.fixture
+def fake_cursor(monkeypatch):
+    cur = FakeCursor()
+
+    @asynccontextmanager
+    async def cursor(*args, **kwargs):
+        yield cur
+
+    monkeypatch.setattr(insert, "cursor", cursor)
+    monkeypatch.setattr(insert.pg_settings, "insert_copy_threshold", 2)
+    return cur
+
+
+def test_copy_upsert_returns_ids_of_null_key_rows(fake_cursor):
+    values = [("a@x", "a"), (None, "n1"), ("b@x", "b"), (None, "n2"), ("c@x", "c")]
+
+    ids = asyncio.run(upsert_tmpl("public.users", COLUMNS, values, ["email"]))
+
+    assert ids == ["a", "n1", "b", "n2", "c"]
+    # Only the rows with a key go through the staging table
+    assert [row[1] for row in fake_cursor.staged] == ["a", "b", "c"]
+    assert any(" VALUES " in text for text in fake_cursor.statements)
+
+
+def test_copy_upsert_of_null_key_rows_only(fake_cursor):
+    ids = asyncio.run(upsert_tmpl("public.users", COLUMNS, [(None, "n1"), (None, "n2")], ["email"]))
+
+    assert ids == ["n1", "n2"]
+    assert fake_cursor.staged == []
+
+
+def test_copy_upsert_deduplicates_keys_and_keeps_null_keys(fake_cursor):
+    values = [("a@x", "a1"), (None, "n1"), ("a@x", "a2"), (None, "n2")]
+
+    ids = asyncio.run(upsert_tmpl("public.users", COLUMNS, values, ["email"]))
+
+    # The last row of a key is written, and every row of the key gets its ID
+    assert ids == ["a2", "n1", "a2", "n2"]
+
+
+@pytest.fixture
+def written(monkeypatch):
+    """Replaces the write path: records each batch and returns the `name` of each row as its ID."""
+    batches = []
+
+    async def write_rows(operation, table, columns, values, *args, **kwargs):
+        batches.append(list(values))
+        return [row[1] for row in values]
+
+    monkeypatch.setattr(upsert, "write_rows", write_rows)
+    return batches
+
+
+def test_upsert_writes_the_last_row_of_each_key(written):
+    values = [("a@x", "a1"), ("b@x", "b"), ("a@x", "a2"), ("a@x", "a3")]
+
+    ids = asyncio.run(upsert_tmpl("public.users", COLUMNS, values, ["email"]))
+
+    assert written == [[("b@x", "b"), ("a@x", "a3")]]
+    assert ids == ["a3", "b", "a3", "a3"]
+
+
+def test_upsert_writes_every_null_key_row(written):
+    values = [(None, "n1"), ("a@x", "a1"), (None, "n2"), ("a@x", "a2")]
+
+    ids = asyncio.run(upsert_tmpl("public.users", COLUMNS, values, ["email"]))
+
+    assert written == [[(None, "n1"), (None, "n2"), ("a@x", "a2")]]
+    assert ids == ["n1", "a2", "n2", "a2"]
+
+
+def test_upsert_with_a_composite_key_dedupes_on_all_its_columns(written):
+    values = [("a@x", "a"), ("a@x", "b"), ("a@x", "a")]
+
+    ids = asyncio.run(upsert_tmpl("public.users", COLUMNS, values, ["email", "name"]))
+
+    assert written == [[("a@x", "b"), ("a@x", "a")]]
+    assert ids == ["a", "b", "a"]
+
+
+def test_upsert_without_duplicates_is_written_as_is(written):
+    values = [("a@x", "a"), (None, "n"), ("b@x", "b")]
+
+    assert asyncio.run(upsert_tmpl("public.users", COLUMNS, values, ["email"])) == ["a", "n", "b"]
+    assert written == [values]